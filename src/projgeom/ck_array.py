@@ -0,0 +1,88 @@
+"""
+Batched Triangle Centers (ck_array.py)
+
+This code computes the altitudes and orthocenters of many triangles of a
+    Cayley-Klein geometry at once. It is the batched counterpart of
+    `tri_altitude` and `orthocenter` in ck_plane.py.
+
+The triangles are given as an (N, 3, 3) integer array: N triangles, three
+    vertices each, three homogeneous coordinates per vertex. The geometry is
+    given by its point class (e.g. `HyperbolicPoint`), whose pole map is
+    applied to all sides of all triangles in one call of `perp_array`.
+
+The construction is the same as in ck_plane.py and so are the results,
+    coordinate for coordinate:
+
+1. the sides a_2 a_3, a_3 a_1 and a_1 a_2 of every triangle are computed
+   once, as one batched cross product;
+2. the altitude through a_i is the join of the pole of the opposite side
+   with a_i;
+3. the orthocenter is the meet of the first two altitudes.
+
+All products are exact: as in pg_array.py, rows that could overflow int64
+    are recomputed with Python ints and the result then has object dtype.
+"""
+
+import numpy as np
+
+from .pg_array import as_coord_array, cross_array, perp_array
+
+# For the altitude through vertex i, the opposite side is the join of
+# vertices _SIDE_A[i] and _SIDE_B[i].
+_SIDE_A = [1, 2, 0]
+_SIDE_B = [2, 0, 1]
+
+
+def _altitudes(point_type: type, triangles, count: int) -> np.ndarray:
+    """The first `count` altitudes of every triangle, as an (N, count, 3) array."""
+    tri = as_coord_array(triangles)
+    if tri.ndim != 3 or tri.shape[1] != 3:
+        raise ValueError("triangles must be an array of shape (N, 3, 3)")
+    num = tri.shape[0]
+    sides = cross_array(tri[:, _SIDE_A[:count]], tri[:, _SIDE_B[:count]])
+    line_type = point_type([0, 0, 1]).dual_type()
+    poles = perp_array(line_type, sides.reshape(num * count, 3))
+    return cross_array(poles.reshape(num, count, 3), tri[:, :count])
+
+
+def tri_altitude_array(point_type: type, triangles) -> np.ndarray:
+    """
+    The `tri_altitude_array` function calculates the three altitudes of every triangle.
+
+    :param point_type: the point class of the geometry, e.g. `EllipticPoint`
+    :type point_type: type
+    :param triangles: an (N, 3, 3) integer array of triangles
+    :return: an (N, 3, 3) array; row [k, i] is the altitude through vertex i of
+        triangle k, with the coordinates of `tri_altitude(triangle)[i]`.
+    :raises ValueError: `triangles` does not have shape (N, 3, 3).
+
+    Examples:
+        >>> from projgeom.hyp_object import HyperbolicPoint
+        >>> tri_altitude_array(HyperbolicPoint, [[[1, 3, 5], [3, 1, 4], [5, 2, 1]]])
+        array([[[ 88,  34, -38],
+                [-83, -67,  79],
+                [ -5,  33, -41]]])
+    """
+    return _altitudes(point_type, triangles, 3)
+
+
+def orthocenter_array(point_type: type, triangles) -> np.ndarray:
+    """
+    The `orthocenter_array` function calculates the orthocenter of every triangle.
+
+    Only the two altitudes that are needed (and hence only two sides) are computed.
+
+    :param point_type: the point class of the geometry, e.g. `EllipticPoint`
+    :type point_type: type
+    :param triangles: an (N, 3, 3) integer array of triangles
+    :return: an (N, 3) array with the coordinates of `orthocenter(triangle)` for every
+        triangle.
+    :raises ValueError: `triangles` does not have shape (N, 3, 3).
+
+    Examples:
+        >>> from projgeom.ell_object import EllipticPoint
+        >>> orthocenter_array(EllipticPoint, [[[1, 3, 5], [3, 1, 4], [5, 2, 1]]])
+        array([[ 3262, -2336,  4826]])
+    """
+    alt = _altitudes(point_type, triangles, 2)
+    return cross_array(alt[:, 0], alt[:, 1])
@@ -55,6 +55,8 @@ class CayleyKleinPlane(ProjectivePlane[Dual, Value]):
     The class CayleyKleinPlane represents a Cayley-Klein plane in projective geometry.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def perp(self) -> Dual:
         """Pole or Polar
@@ -191,6 +193,7 @@ def reflect(mirror: CayleyKleinPlane, pt_p: CayleyKleinPlane):
     :type mirror: CayleyKleinPlane
     :param pt_p: The parameter `pt_p` represents a CayleyKleinPlane object
     :type pt_p: CayleyKleinPlane
+    :return: the mirror image of `pt_p`, an object of the same type.
 
     .. svgbob::
        :align: center
@@ -206,7 +209,9 @@ def reflect(mirror: CayleyKleinPlane, pt_p: CayleyKleinPlane):
     Examples:
         >>> from projgeom.hyp_object import HyperbolicLine, HyperbolicPoint
         >>> t = reflect(HyperbolicLine([0, 1, 0]), HyperbolicPoint([0, 0, 1]))
-        >>> t == HyperbolicPoint([0, 1, 0])
-        False
+        >>> t == HyperbolicPoint([0, 0, 1])
+        True
+        >>> reflect(HyperbolicLine([0, 1, 0]), HyperbolicPoint([1, 2, 1]))
+        HyperbolicPoint(1 : -2 : 1)
     """
-    involution(mirror.perp(), mirror, pt_p)
+    return involution(mirror.perp(), mirror, pt_p)
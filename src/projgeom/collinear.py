@@ -0,0 +1,147 @@
+"""
+Collinear Subsets and Concurrent Bundles (collinear.py)
+
+This code finds every maximal set of collinear points in a collection of N
+    points, and dually every maximal bundle of concurrent lines, without
+    testing all O(N^3) triples with `coincident`.
+
+For every anchor point the algorithm joins it with all other points in one
+    vectorized `meet`, reduces the resulting lines to their canonical keys
+    (gcd divided, first non-zero entry positive, as `PgObject.canonical_key`)
+    and groups equal keys. A group is exactly the set of points that lie on a
+    common line with the anchor. Each line is reported once, by the anchor
+    with the smallest index on it, so the output is a stream of
+    `(line, indices)` pairs that is produced anchor by anchor in O(N) memory,
+    with O(N^2) meets in total.
+
+The inputs are a `PgArray`, an (N, 3) integer array or a sequence of points
+    (or lines) of one of the integer geometries, whose `meet` is the cross
+    product. A point that is given more than once (with proportional
+    coordinates) counts once towards `min_size`; all of its copies are listed
+    on each of its lines, which is still reported once.
+"""
+
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from .pg_array import canonical_array, cross_array, to_coord_array
+from .pg_object import PgLine, PgObject, PgPoint
+
+
+def _dual_elem_type(objs, default: type) -> type:
+    """The scalar type of the meet of two elements of `objs`."""
+    if not isinstance(objs, np.ndarray) and len(objs) > 0:
+        first = objs[0]
+        if isinstance(first, PgObject):
+            return first.dual_type()
+    return default
+
+
+def _groups(keys: np.ndarray, min_count: int) -> List[np.ndarray]:
+    """
+    Row indices of `keys` grouped by equal rows, keeping only groups with at least
+    `min_count` rows. Within a group the indices are ascending.
+    """
+    if keys.dtype != object:
+        order = np.lexsort(keys.T[::-1])
+        ordered = keys[order]
+        change = (ordered[1:] != ordered[:-1]).any(axis=-1)
+        starts = np.concatenate([[0], np.flatnonzero(change) + 1, [len(order)]])
+        keep = np.flatnonzero(np.diff(starts) >= min_count)
+        return [order[starts[g] : starts[g + 1]] for g in keep]
+    buckets: Dict[Tuple, List[int]] = {}
+    for row, key in enumerate(map(tuple, keys.tolist())):
+        buckets.setdefault(key, []).append(row)
+    return [
+        np.array(rows, dtype=np.int64)
+        for rows in buckets.values()
+        if len(rows) >= min_count
+    ]
+
+
+def _incidence_groups(
+    coords: np.ndarray, min_size: int
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    if min_size < 2:
+        raise ValueError("min_size must be at least 2")
+    # Repeated points are replaced by their first copy, and the copies added back to
+    # every group found for it.
+    copies = {int(group[0]): group for group in _groups(canonical_array(coords), 2)}
+    if not copies:
+        yield from _distinct_incidence_groups(coords, min_size)
+        return
+    repeated = np.concatenate([group[1:] for group in copies.values()])
+    index = np.setdiff1d(np.arange(coords.shape[0]), repeated)
+    for key, group in _distinct_incidence_groups(coords[index], min_size):
+        found = [copies.get(int(i), i[np.newaxis]) for i in index[group]]
+        yield key, np.sort(np.concatenate(found))
+
+
+def _distinct_incidence_groups(
+    coords: np.ndarray, min_size: int
+) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+    num = coords.shape[0]
+    others = np.arange(num)
+    for anchor in range(num):
+        rest = others[others != anchor]
+        keys = canonical_array(cross_array(coords[anchor], coords[rest]))
+        nonzero = (keys != 0).any(axis=-1)
+        rest, keys = rest[nonzero], keys[nonzero]
+        for group in _groups(keys, min_size - 1):
+            # reported by the smallest point on the line only
+            if rest[group[0]] > anchor:
+                yield keys[group[0]], np.concatenate([[anchor], rest[group]])
+
+
+def collinear_subsets(
+    points, min_size: int = 3
+) -> Iterator[Tuple[PgObject, np.ndarray]]:
+    """
+    The `collinear_subsets` function streams every maximal set of at least `min_size`
+    collinear points.
+
+    :param points: a collection of N points (`PgArray`, (N, 3) array, or
+        sequence of `PgObject`)
+    :param min_size: the smallest number of distinct points reported on a line
+    :type min_size: int
+    :return: an iterator of `(line, indices)` pairs, where `indices` is a sorted int64
+        array of the points on `line`. Each line is reported once.
+
+    Examples:
+        >>> pts = [PgPoint([0, 0, 1]), PgPoint([1, 0, 1]), PgPoint([2, 0, 1]),
+        ...        PgPoint([0, 1, 1]), PgPoint([0, 2, 1]), PgPoint([1, 1, 1])]
+        >>> for line, indices in collinear_subsets(pts):
+        ...     print(line, indices.tolist())
+        (0 : 1 : 0) [0, 1, 2]
+        (1 : 0 : 0) [0, 3, 4]
+        (1 : 1 : -2) [2, 4, 5]
+    """
+    line_type = _dual_elem_type(points, PgLine)
+    for key, indices in _incidence_groups(to_coord_array(points), min_size):
+        yield line_type(key.tolist()), indices
+
+
+def concurrent_bundles(
+    lines, min_size: int = 3
+) -> Iterator[Tuple[PgObject, np.ndarray]]:
+    """
+    The `concurrent_bundles` function streams every maximal set of at least `min_size`
+    concurrent lines (the dual of `collinear_subsets`).
+
+    :param lines: a collection of N lines (`PgArray`, (N, 3) array, or
+        sequence of `PgObject`)
+    :param min_size: the smallest number of distinct lines reported through a point
+    :type min_size: int
+    :return: an iterator of `(point, indices)` pairs, where `indices` is a sorted int64
+        array of the lines through `point`. Each point is reported once.
+
+    Examples:
+        >>> from projgeom.pg_array import PgLineArray
+        >>> lns = PgLineArray([[1, 0, 0], [0, 1, 0], [1, 1, 0], [1, 0, -1]])
+        >>> [(pt, indices.tolist()) for pt, indices in concurrent_bundles(lns)]
+        [(PgPoint(0 : 0 : 1), [0, 1, 2])]
+    """
+    point_type = _dual_elem_type(lines, PgPoint)
+    for key, indices in _incidence_groups(to_coord_array(lines), min_size):
+        yield point_type(key.tolist()), indices
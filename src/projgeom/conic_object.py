@@ -0,0 +1,188 @@
+"""
+Matrix Cayley-Klein Geometries (conic_object.py)
+
+This code defines Cayley-Klein geometries by matrices instead of by
+    hand-written `perp` methods.
+
+A Cayley-Klein geometry is given by its absolute conic, a symmetric 3x3
+    matrix C. The polar line of a point p is C p, and the pole of a line l
+    is C* l, where C* is the adjugate of C (the dual conic). For example:
+
+    ===========  ==================  ==================
+    geometry     C (points)          C* (lines)
+    ===========  ==================  ==================
+    elliptic     diag(1, 1, 1)       diag(1, 1, 1)
+    hyperbolic   diag(1, 1, -1)      diag(1, 1, -1)
+    MyCK         diag(-2, 1, -2)     diag(1, -2, 1)
+    ===========  ==================  ==================
+
+`cayley_klein()` creates the point and line classes of such a geometry. Both
+    derive from `ConicObject`, which implements the `CayleyKleinPlane` API on
+    top of `PgObject`, so that all functions of pg_plane.py and ck_plane.py
+    work with them. `perp` is a single matrix-vector product, and
+    `perp_array` takes the poles or polars of a whole (N, 3) coordinate array
+    in one matrix product.
+
+Geometries whose polarity is not a linear map cannot be written this way,
+    e.g. the perspective plane of persp_object.py, where every point has the
+    line at infinity as its polar.
+
+Examples:
+    >>> HypPoint, HypLine = cayley_klein("Hyp", [[1, 0, 0], [0, 1, 0], [0, 0, -1]])
+    >>> HypPoint([1, 2, 3]).perp()
+    HypLine(1 : 2 : -3)
+    >>> HypLine([1, 2, 3]).perp()
+    HypPoint(1 : 2 : -3)
+"""
+
+import sys
+from math import gcd
+from typing import ClassVar, Optional, Sequence, Tuple, Type, TypeVar, cast
+
+import numpy as np
+
+from .ck_plane import CayleyKleinPlane
+from .pg_array import as_coord_array, outer_dot_array
+from .pg_object import PgObject, det, dot
+from .transform import Matrix, adjugate
+
+Dual = TypeVar("Dual", bound="ConicObject")
+
+
+class ConicObject(PgObject[Dual], CayleyKleinPlane[Dual, int]):
+    """
+    The `ConicObject` class represents a point or line of a Cayley-Klein geometry given by a matrix.
+
+    Subclasses set `perp_matrix`, the matrix that maps the coordinates of an
+    object to those of its pole or polar, and `dual_class`, the class of the
+    pole or polar. They are normally created with `cayley_klein`.
+    """
+
+    __slots__ = ()
+
+    perp_matrix: ClassVar[Matrix]
+    dual_class: ClassVar[type]
+
+    def dual_type(self) -> type:
+        """
+        The `dual_type` function returns the type of the dual object.
+
+        Examples:
+            >>> Point, Line = cayley_klein("Ell", [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+            >>> Point([1, 2, 3]).dual_type() is Line
+            True
+        """
+        return self.dual_class
+
+    def perp(self) -> Dual:
+        """Pole or Polar
+
+        The `perp` function returns the pole of a line or the polar of a point,
+        the product of `perp_matrix` with the coordinates.
+
+        Examples:
+            >>> Point, Line = cayley_klein("MyCK", [[-2, 0, 0], [0, 1, 0], [0, 0, -2]])
+            >>> Point([1, 2, 3]).perp()
+            MyCKLine(-2 : 2 : -6)
+            >>> Line([1, 2, 3]).perp()
+            MyCKPoint(1 : -4 : 3)
+        """
+        coord = self.coord
+        return self.dual_class([dot(row, coord) for row in self.perp_matrix])
+
+    @classmethod
+    def perp_array(cls, arr) -> np.ndarray:
+        """
+        The `perp_array` function takes the pole or polar of every row of a coordinate array.
+
+        :param arr: an (N, 3) integer array of coordinates of objects of this class
+        :return: the (N, 3) array of coordinates of their poles or polars. The product
+            is exact: rows that could overflow int64 are computed with Python ints.
+
+        Examples:
+            >>> Point, Line = cayley_klein("Hyp", [[1, 0, 0], [0, 1, 0], [0, 0, -1]])
+            >>> Point.perp_array(np.array([[1, 2, 3], [4, 5, 6]]))
+            array([[ 1,  2, -3],
+                   [ 4,  5, -6]])
+        """
+        return outer_dot_array(as_coord_array(arr), as_coord_array(cls.perp_matrix))
+
+
+def _as_matrix(mat: Sequence[Sequence[int]]) -> Matrix:
+    if len(mat) != 3 or any(len(row) != 3 for row in mat):
+        raise ValueError("a matrix must have three rows of three integers")
+    return tuple(tuple(int(x) for x in row) for row in mat)  # type: ignore
+
+
+def _reduced(mat: Matrix) -> Matrix:
+    """The matrix divided by the gcd of its entries, with the first non-zero entry positive."""
+    flat = [x for row in mat for x in row]
+    divisor = gcd(*flat)
+    if next(x for x in flat if x != 0) < 0:
+        divisor = -divisor
+    return tuple(tuple(x // divisor for x in row) for row in mat)  # type: ignore
+
+
+def cayley_klein(
+    name: str,
+    conic: Sequence[Sequence[int]],
+    dual_conic: Optional[Sequence[Sequence[int]]] = None,
+    module: Optional[str] = None,
+) -> Tuple[type, type]:
+    """
+    The `cayley_klein` function creates the point and line classes of a Cayley-Klein geometry.
+
+    :param name: the prefix of the class names, e.g. "Hyp" gives `HypPoint` and `HypLine`
+    :type name: str
+    :param conic: the symmetric 3x3 integer matrix of the absolute conic, which maps a
+        point to its polar line
+    :type conic: Sequence[Sequence[int]]
+    :param dual_conic: the matrix that maps a line to its pole; by default the adjugate
+        of `conic`, divided by the gcd of its entries. It must be given if `conic`
+        is singular.
+    :type dual_conic: Optional[Sequence[Sequence[int]]]
+    :param module: the value of `__module__` of the new classes; by default the module
+        of the caller, so that the classes can be pickled when they are assigned to
+        module-level names of the same name
+    :type module: Optional[str]
+    :return: the point class and the line class.
+    :raises ValueError: a matrix is not 3x3 or not symmetric, or `conic` is singular
+        and no `dual_conic` is given.
+
+    Examples:
+        >>> from projgeom.ck_plane import orthocenter
+        >>> Point, Line = cayley_klein("Ell", [[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+        >>> orthocenter([Point([1, 3, 5]), Point([3, 1, 4]), Point([5, 2, 1])])
+        EllPoint(3262 : -2336 : 4826)
+    """
+    point_matrix = _as_matrix(conic)
+    if dual_conic is None:
+        if det(*point_matrix) == 0:
+            raise ValueError("dual_conic is required for a singular conic")
+        line_matrix = _reduced(adjugate(point_matrix))
+    else:
+        line_matrix = _as_matrix(dual_conic)
+    for mat in (point_matrix, line_matrix):
+        if any(mat[i][j] != mat[j][i] for i in range(3) for j in range(i)):
+            raise ValueError("the conic matrices must be symmetric")
+    if module is None:
+        module = sys._getframe(1).f_globals.get("__name__", "__main__")
+    point_class = cast(
+        Type[ConicObject],
+        type(
+            f"{name}Point",
+            (ConicObject,),
+            {"__slots__": (), "__module__": module, "perp_matrix": point_matrix},
+        ),
+    )
+    line_class = cast(
+        Type[ConicObject],
+        type(
+            f"{name}Line",
+            (ConicObject,),
+            {"__slots__": (), "__module__": module, "perp_matrix": line_matrix},
+        ),
+    )
+    point_class.dual_class = line_class
+    line_class.dual_class = point_class
+    return point_class, line_class
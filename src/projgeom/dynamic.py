@@ -0,0 +1,162 @@
+"""
+Dynamic Constructions (dynamic.py)
+
+This code keeps an interactive construction up to date when its free points
+    are moved, recomputing only what depends on them.
+
+A `DynamicGraph` is a `LazyGraph` (see lazy.py) whose leaves can be free:
+    `free` wraps a point or line as a node that can later be given another
+    position with `move`. The construction is built as with `LazyGraph`, by
+    calling `meet`, `perp`, `parametrize` etc. on the nodes, or the functions
+    of pg_plane.py and ck_plane.py such as `altitude` and `orthocenter`.
+
+Every node records the nodes that use it (its dependents). Moving a free
+    object marks its dependents as dirty, and their dependents in turn; the
+    walk stops at nodes that are dirty already, so it visits every affected
+    node at most once, and nodes that do not depend on the moved object are
+    never visited. Nothing is recomputed by the move itself: as in lazy.py,
+    a dirty node is recomputed when its value is requested, and then only
+    together with its dirty operands. `move_all` moves several free objects
+    at once, so that a node depending on several of them is recomputed once
+    and not once per move. The cost of a move is therefore proportional to
+    the part of the construction that it affects and does not grow with the
+    size of the whole construction.
+
+Examples:
+    >>> from projgeom.ck_plane import orthocenter
+    >>> from projgeom.hyp_object import HyperbolicPoint
+    >>> graph = DynamicGraph()
+    >>> pt_a, pt_b, pt_c = graph.frees([HyperbolicPoint([1, 3, 5]), HyperbolicPoint([3, 1, 4]),
+    ...                                 HyperbolicPoint([5, 2, 1])])
+    >>> pt_d = graph.free(HyperbolicPoint([2, 2, 7]))
+    >>> pt_h = orthocenter([pt_a, pt_b, pt_c])
+    >>> ln_l = pt_d.meet(pt_a)
+    >>> pt_h.value(), ln_l.value()
+    (HyperbolicPoint(140 : -3798 : -3074), HyperbolicLine(-11 : -3 : 4))
+    >>> graph.computed
+    8
+
+Moving `pt_d` leaves the orthocenter alone and recomputes only `ln_l`:
+
+    >>> graph.move(pt_d, HyperbolicPoint([1, 0, 2]))
+    >>> graph.is_dirty(pt_h), graph.is_dirty(ln_l)
+    (False, True)
+    >>> pt_h.value(), ln_l.value()
+    (HyperbolicPoint(140 : -3798 : -3074), HyperbolicLine(-6 : -3 : 3))
+    >>> graph.computed
+    9
+"""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+from .lazy import LazyGraph, LazyObject
+from .pg_plane import ProjectivePlane
+
+
+class DynamicGraph(LazyGraph):
+    """
+    The `DynamicGraph` class is a construction graph with free objects that can be moved.
+
+    :ivar computed: the number of operations actually evaluated
+    :ivar reused: the number of times a requested node already existed
+    :ivar invalidated: the number of times a node was marked dirty by a move
+
+    Examples:
+        >>> from projgeom.pg_object import PgPoint
+        >>> graph = DynamicGraph()
+        >>> pt_a, pt_b = graph.frees([PgPoint([1, 2, 3]), PgPoint([4, 5, 6])])
+        >>> ln_l = pt_a.meet(pt_b)
+        >>> ln_l.value()
+        PgLine(-3 : 6 : -3)
+        >>> graph.move(pt_b, PgPoint([1, 0, 0]))
+        >>> ln_l.value()
+        PgLine(0 : 3 : -2)
+    """
+
+    invalidated: int
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._dependents: Dict[int, List] = {}
+        self._free: Set[int] = set()
+        self.invalidated = 0
+
+    def _intern(self, cls: type, op: str, args: Tuple, key: Tuple):
+        size = len(self._nodes)
+        node = super()._intern(cls, op, args, key)
+        if len(self._nodes) > size:
+            for uid in {arg.uid for arg in node.args}:
+                self._dependents.setdefault(uid, []).append(node)
+        return node
+
+    def free(self, obj: ProjectivePlane) -> LazyObject:
+        """
+        The `free` function wraps a concrete point or line as a free node, which can be moved.
+        Unlike `leaf`, every call creates a new node.
+        """
+        node = self._intern(LazyObject, "leaf", (obj,), ("free", len(self._nodes)))
+        self._free.add(node.uid)
+        return node
+
+    def frees(self, objs: Iterable[ProjectivePlane]) -> List[LazyObject]:
+        """The `frees` function wraps every object of `objs` with `free`."""
+        return [self.free(obj) for obj in objs]
+
+    def move(self, node: LazyObject, obj: ProjectivePlane) -> None:
+        """
+        The `move` function gives a free node a new position and marks its dependents as dirty.
+
+        :param node: a node created by `free` on this graph
+        :type node: LazyObject
+        :param obj: the new position, of the same type as the old one
+        :type obj: ProjectivePlane
+        :raises ValueError: `node` is not a free node of this graph.
+        :raises TypeError: `obj` is not of the type of the old position.
+        """
+        self.move_all([(node, obj)])
+
+    def move_all(self, moves: Iterable[Tuple[LazyObject, ProjectivePlane]]) -> None:
+        """
+        The `move_all` function moves several free nodes at once.
+
+        :param moves: pairs of a free node of this graph and its new position
+        :type moves: Iterable[Tuple[LazyObject, ProjectivePlane]]
+        :raises ValueError: a node is not a free node of this graph.
+        :raises TypeError: a new position is not of the type of the old one.
+
+        Examples:
+            >>> from projgeom.pg_object import PgPoint
+            >>> graph = DynamicGraph()
+            >>> pt_a, pt_b = graph.frees([PgPoint([1, 2, 3]), PgPoint([4, 5, 6])])
+            >>> ln_l = pt_a.meet(pt_b)
+            >>> ln_l.value()
+            PgLine(-3 : 6 : -3)
+            >>> graph.move_all([(pt_a, PgPoint([0, 1, 0])), (pt_b, PgPoint([0, 0, 1]))])
+            >>> ln_l.value(), graph.computed
+            (PgLine(1 : 0 : 0), 2)
+        """
+        moves = list(moves)
+        for node, obj in moves:
+            if node.graph is not self or node.uid not in self._free:
+                raise ValueError("only the free nodes of this graph can be moved")
+            if type(obj) is not type(node._value):
+                raise TypeError(
+                    f"a free {type(node._value).__name__} cannot be moved "
+                    f"to a {type(obj).__name__}"
+                )
+        stack: List = []
+        for node, obj in moves:
+            node._value = obj
+            stack.extend(self._dependents.get(node.uid, ()))
+        # A dirty node has only dirty dependents, so the walk can stop there.
+        while stack:
+            node = stack.pop()
+            if node._evaluated:
+                node._evaluated = False
+                node._value = None
+                self.invalidated += 1
+                stack.extend(self._dependents.get(node.uid, ()))
+
+    def is_dirty(self, node) -> bool:
+        """The `is_dirty` function tells whether a node must be recomputed before it is used."""
+        return not node._evaluated
@@ -14,6 +14,8 @@ class EllipticPoint(PgObject["EllipticLine"]):
           \\ /
     """
 
+    __slots__ = ()
+
     def dual_type(self) -> type:
         """Returns the type of the dual object (EllipticLine for EllipticPoint).
 
@@ -71,6 +73,8 @@ class EllipticLine(PgObject[EllipticPoint]):
           \\ /
     """
 
+    __slots__ = ()
+
     def dual_type(self) -> type:
         """Returns the type of the dual object (EllipticPoint for EllipticLine).
 
@@ -0,0 +1,328 @@
+"""
+FfPoint and FfLine Classes
+
+This code defines the projective plane PG(2, p) over the finite field GF(p),
+    with the same `ProjectivePlane` API as the integer geometries. The functions
+    in pg_plane.py (check_pappus, check_desargue, harm_conj, involution, etc.)
+    work unchanged on these objects.
+
+Every object carries its prime modulus p next to its coordinates. The
+    coordinates are reduced mod p on construction, and therefore after every
+    `meet` (cross product) and `parametrize` (Plucker combination), so all
+    values stay word-sized however long a construction chain gets. This keeps
+    massive randomized theorem checks and whole-plane enumeration cheap.
+
+Two objects are equal when their coordinates are proportional mod p. The
+    canonical key used for equality and hashing is the monic form of the
+    coordinates: they are scaled by a modular inverse so that the first
+    non-zero coordinate becomes 1.
+
+Over a finite field a vector can be self-orthogonal (for example
+    1^2 + 2^2 = 0 mod 5), so `aux()` cannot simply reuse the coordinates as
+    the integer geometries do. It falls back to a unit vector that is not
+    incident with the object.
+"""
+
+from operator import attrgetter
+from typing import Self, Sequence, Set, Tuple, TypeVar
+
+from .pg_object import PgObject, cross, det, dot, plckr
+
+Dual = TypeVar("Dual", bound="FfObject")
+
+# Bases of the Miller-Rabin test; together they are exact below 3.3 * 10^24.
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# Moduli that have passed `check_modulus`, so that it costs one lookup per object.
+_PRIMES: Set[int] = set()
+
+
+def is_prime(num: int) -> bool:
+    """Primality test for the modulus of GF(p)
+
+    The `is_prime` function runs the Miller-Rabin test with the first twelve primes
+    as bases, which is exact for all numbers below 3.3 * 10^24 (e.g. 2^61 - 1) and
+    a strong probable-prime test beyond.
+
+    :param num: the number to test
+    :type num: int
+    :return: True if `num` is a prime.
+
+    Examples:
+        >>> [n for n in range(30) if is_prime(n)]
+        [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+        >>> is_prime(2**61 - 1), is_prime(3215031751)
+        (True, False)
+    """
+    if num < 2:
+        return False
+    for prime in _WITNESSES:
+        if num % prime == 0:
+            return num == prime
+    odd, shift = num - 1, 0
+    while odd % 2 == 0:
+        odd //= 2
+        shift += 1
+    for base in _WITNESSES:
+        x = pow(base, odd, num)
+        if x in (1, num - 1):
+            continue
+        for _ in range(shift - 1):
+            x = x * x % num
+            if x == num - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def check_modulus(modulus: int) -> None:
+    """
+    The `check_modulus` function checks that `modulus` is a prime, so that the integers
+    mod `modulus` form a field. Each modulus is tested once.
+
+    :raises ValueError: `modulus` is not a prime.
+
+    Examples:
+        >>> check_modulus(9)
+        Traceback (most recent call last):
+            ...
+        ValueError: modulus must be a prime number, not 9
+    """
+    if modulus not in _PRIMES:
+        if not is_prime(modulus):
+            raise ValueError(f"modulus must be a prime number, not {modulus}")
+        _PRIMES.add(modulus)
+
+
+def monic(vec: Sequence[int], modulus: int) -> Tuple[int, int, int]:
+    """Canonical representative of a homogeneous vector over GF(p)
+
+    The `monic` function scales the vector by the modular inverse of its first
+    non-zero entry, so that this entry becomes 1.
+
+    :param vec: The parameter `vec` is a sequence of three integers
+    :type vec: Sequence[int]
+    :param modulus: the prime p
+    :type modulus: int
+    :return: a tuple of three integers in the range [0, p). The zero vector is returned unchanged.
+
+    Examples:
+        >>> monic([0, 3, 4], 7)
+        (0, 1, 6)
+        >>> monic([0, 0, 0], 7)
+        (0, 0, 0)
+    """
+    for entry in vec:
+        if entry % modulus != 0:
+            inv = pow(entry, -1, modulus)
+            return (
+                vec[0] * inv % modulus,
+                vec[1] * inv % modulus,
+                vec[2] * inv % modulus,
+            )
+    return (0, 0, 0)
+
+
+class FfObject(PgObject[Dual]):
+    """
+    The `FfObject` class represents a geometric object of the projective plane over GF(p).
+
+    :param coord: a sequence of three integers; they are reduced mod `modulus`
+    :type coord: Sequence[int]
+    :param modulus: the prime p of the field GF(p)
+    :type modulus: int
+    :raises ValueError: The `coord` parameter must be a sequence of three integers and
+        `modulus` must be a prime.
+
+    Examples:
+        >>> pt_p = FfObject([10, -1, 3], 7)
+        >>> pt_p.coord
+        (3, 6, 3)
+        >>> pt_p == FfObject([1, 2, 1], 7)
+        True
+    """
+
+    __slots__ = ("_modulus",)
+
+    _modulus: int
+
+    def __init__(self, coord: Sequence[int], modulus: int) -> None:
+        if len(coord) != 3:
+            raise ValueError("coord must be a sequence of three integers")
+        if modulus not in _PRIMES:
+            check_modulus(modulus)
+        self._modulus = modulus
+        if self.auto_normalize:
+            key = monic(coord, modulus)
+            self._coord = key
+            self._key = key if key != (0, 0, 0) else None
+        else:
+            self._coord = (coord[0] % modulus, coord[1] % modulus, coord[2] % modulus)
+            self._key = None
+
+    modulus = property(
+        attrgetter("_modulus"), doc="The prime p of the field GF(p) (read-only)."
+    )
+
+    def __eq__(self, other) -> bool:
+        """
+        The function checks if two objects over the same field are proportional mod p.
+
+        Examples:
+            >>> FfPoint([1, 2, 3], 7) == FfPoint([2, 4, 6], 7)
+            True
+            >>> FfPoint([1, 2, 3], 7) == FfPoint([1, 2, 3], 11)
+            False
+        """
+        if type(self) is not type(other) or self._modulus != other._modulus:
+            return False
+        key = self._key
+        if key is not None:
+            other_key = other._key
+            if other_key is not None:
+                return key == other_key
+        modulus = self._modulus
+        return all(x % modulus == 0 for x in cross(self._coord, other._coord))
+
+    __hash__ = PgObject.__hash__
+
+    def __reduce__(self):
+        """
+        The function pickles the object as its class, coordinate tuple and modulus.
+
+        Examples:
+            >>> import pickle
+            >>> pickle.loads(pickle.dumps(FfLine([3, 6, 2], 7))).modulus
+            7
+        """
+        return (type(self), (self.coord, self.modulus))
+
+    def canonical_key(self) -> Tuple[int, int, int]:
+        """
+        The `canonical_key` function returns the monic coordinates as a tuple, computed once
+        and cached on the instance.
+
+        :raises ValueError: the coordinates are all zero mod p.
+
+        Examples:
+            >>> FfPoint([3, 6, 2], 7).canonical_key()
+            (1, 2, 3)
+        """
+        key = self._key
+        if key is None:
+            key = monic(self._coord, self._modulus)
+            if key == (0, 0, 0):
+                raise ValueError("the zero vector has no canonical key")
+            self._key = key
+        return key
+
+    def normalize(self) -> Self:
+        """
+        The `normalize` function returns the same object with monic coordinates.
+
+        Examples:
+            >>> FfPoint([3, 6, 2], 7).normalize()
+            FfPoint(1 : 2 : 3)
+        """
+        return type(self)(monic(self._coord, self._modulus), self._modulus)
+
+    def aux(self) -> Dual:
+        """
+        The `aux` function returns a dual object not incident with this one.
+
+        Examples:
+            >>> pt_p = FfPoint([1, 2, 0], 5)
+            >>> ln_l = pt_p.aux()
+            >>> ln_l
+            FfLine(1 : 0 : 0)
+            >>> pt_p.incident(ln_l)
+            False
+        """
+        if dot(self.coord, self.coord) % self.modulus != 0:
+            return self.dual_type()(self.coord, self.modulus)
+        for i, entry in enumerate(self.coord):
+            if entry != 0:
+                unit = [0, 0, 0]
+                unit[i] = 1
+                return self.dual_type()(unit, self.modulus)
+        return self.dual_type()(self.coord, self.modulus)
+
+    def dot(self, line) -> int:
+        """
+        The `dot` function calculates the dot product mod p.
+
+        Examples:
+            >>> FfPoint([3, 4, 5], 7).dot(FfLine([1, 1, 1], 7))
+            5
+        """
+        return dot(self.coord, line.coord) % self.modulus
+
+    def parametrize(self, lambda_: int, pt_q: Self, mu_: int) -> Self:
+        """Homogeneous parametrization of point or line, reduced mod p
+
+        Examples:
+            >>> FfPoint([1, 2, 3], 7).parametrize(1, FfPoint([4, 5, 6], 7), 2)
+            FfPoint(2 : 5 : 1)
+        """
+        return type(self)(plckr(lambda_, self.coord, mu_, pt_q.coord), self.modulus)
+
+    def incident(self, rhs: Dual) -> bool:
+        """
+        The function checks if the dot product vanishes mod p.
+
+        Examples:
+            >>> FfPoint([1, 2, 3], 7).incident(FfLine([1, 1, 1], 7))
+            False
+            >>> FfPoint([1, 2, 4], 7).incident(FfLine([1, 1, 1], 7))
+            True
+        """
+        return dot(self.coord, rhs.coord) % self.modulus == 0
+
+    def coincident(self, pt_q: Self, pt_r: Self) -> bool:
+        """
+        The function checks if the determinant of three objects vanishes mod p.
+
+        Examples:
+            >>> FfPoint([1, 0, 0], 7).coincident(FfPoint([0, 1, 0], 7), FfPoint([1, 1, 7], 7))
+            True
+        """
+        return det(self.coord, pt_q.coord, pt_r.coord) % self.modulus == 0
+
+    def meet(self, rhs: Self) -> Dual:
+        """
+        The `meet` function returns the join of two points or the meet of two lines, reduced mod p.
+
+        Examples:
+            >>> FfPoint([1, 2, 3], 7).meet(FfPoint([4, 5, 6], 7))
+            FfLine(4 : 6 : 4)
+        """
+        return self.dual_type()(cross(self.coord, rhs.coord), self.modulus)
+
+
+class FfPoint(FfObject["FfLine"]):
+    """Point of the projective plane over GF(p)
+
+    Examples:
+        >>> from projgeom.pg_plane import check_pappus
+        >>> pt_a, pt_b = FfPoint([1, 2, 3], 101), FfPoint([4, 0, 1], 101)
+        >>> pt_d, pt_e = FfPoint([0, 5, 2], 101), FfPoint([7, 1, 1], 101)
+        >>> coline1 = [pt_a, pt_b, pt_a.parametrize(3, pt_b, 5)]
+        >>> coline2 = [pt_d, pt_e, pt_d.parametrize(11, pt_e, 2)]
+        >>> check_pappus(coline1, coline2)
+        True
+    """
+
+    __slots__ = ()
+
+    def dual_type(self) -> type:
+        return FfLine
+
+
+class FfLine(FfObject[FfPoint]):
+    """Line of the projective plane over GF(p)"""
+
+    __slots__ = ()
+
+    def dual_type(self) -> type:
+        return FfPoint
@@ -0,0 +1,359 @@
+"""
+Precomputed Incidence Tables for PG(2, p) (ff_table.py)
+
+This code enumerates all p^2 + p + 1 points and lines of the finite projective
+    plane PG(2, p) once, stores their incidence as compact index tables, and
+    answers `meet`, `incident` and `coincident` by table lookup instead of
+    arithmetic.
+
+Every point and every line is identified by the index of its monic
+    coordinates (first non-zero coordinate equal to 1):
+
+- (1, y, z) has index y * p + z,
+- (0, 1, z) has index p^2 + z,
+- (0, 0, 1) has index p^2 + p.
+
+Points and lines share the same list of coordinates, and point i lies on
+    line j exactly when line i passes through point j. A single (n, p + 1)
+    table therefore serves both as "line -> points on it" and as
+    "point -> lines through it". Its rows are sorted, so incidence is a
+    binary search and the meet of two objects is the unique common entry of
+    their two rows.
+
+The degenerate zero vector, which the integer geometries produce for the meet
+    of an object with itself, gets the index ZERO = -1. As in the integer
+    geometries it is incident with, and equal to, every object, and so it
+    cannot be hashed.
+
+The `FfTablePoint` and `FfTableLine` classes wrap an index together with its
+    table and implement the `ProjectivePlane` API, so the functions in
+    pg_plane.py run unchanged on them, and whole-plane sweeps such as checking
+    `check_desargue` over many triangle pairs become memory-bound lookups.
+"""
+
+from typing import List, Self, Sequence, TypeVar
+
+import numpy as np
+
+from .ff_object import FfLine, FfPoint, check_modulus
+from .pg_object import dot, plckr
+from .pg_plane import ProjectivePlane
+
+Dual = TypeVar("Dual", bound="FfTableObject")
+
+# For a monic line whose first non-zero coordinate is k, the two free coordinates.
+_FREE = np.array([[1, 2], [0, 2], [0, 1]])
+
+# Index of the degenerate zero vector.
+ZERO = -1
+
+# The number of points whose coordinates `FfTable` computes at a time.
+_BLOCK_SIZE = 1 << 16
+
+
+class FfTable:
+    """
+    The `FfTable` class holds the points, lines and incidence tables of PG(2, p).
+
+    :param modulus: the prime p
+    :type modulus: int
+    :raises ValueError: `modulus` must be a prime.
+
+    Examples:
+        >>> plane = FfTable(3)
+        >>> plane.size
+        13
+        >>> plane.points_on(plane.index([1, 1, 1])).tolist()
+        [2, 4, 6, 11]
+        >>> plane.meet(2, 4)
+        4
+    """
+
+    modulus: int
+    size: int
+    coords: np.ndarray
+    table: np.ndarray
+
+    def __init__(self, modulus: int) -> None:
+        check_modulus(modulus)
+        q = modulus
+        self.modulus = q
+        self.size = q * q + q + 1
+        self._inv = np.zeros(q, dtype=np.int64)
+        self._inv[1:] = [pow(x, -1, q) for x in range(1, q)]
+        y, z = np.divmod(np.arange(q * q), q)
+        self.coords = np.concatenate(
+            [
+                np.stack([np.ones(q * q, dtype=np.int64), y, z], axis=-1),
+                np.stack(
+                    [np.zeros(q, np.int64), np.ones(q, np.int64), np.arange(q)], -1
+                ),
+                np.array([[0, 0, 1]], dtype=np.int64),
+            ]
+        )
+        self.table = self._build_table()
+
+    def _build_table(self) -> np.ndarray:
+        """
+        Points on every line: the free coordinates run over PG(1, p), the leading one is solved for.
+        The lines are done in blocks, so the coordinates of only one block of points exist at a time.
+        """
+        q = self.modulus
+        dtype = np.int32 if self.size < 2**31 else np.int64
+        table = np.empty((self.size, q + 1), dtype=dtype)
+        u_v = np.concatenate(
+            [np.stack([np.ones(q, np.int64), np.arange(q)], -1), np.array([[0, 1]])]
+        )
+        cols = np.arange(q + 1)[np.newaxis, :]
+        step = max(1, _BLOCK_SIZE // (q + 1))
+        for start in range(0, self.size, step):
+            lines = self.coords[start : start + step]
+            lead = np.argmax(lines != 0, axis=-1)
+            free = _FREE[lead]
+            coef = np.take_along_axis(lines, free, axis=-1)
+            solved = (
+                -(
+                    coef[:, np.newaxis, 0] * u_v[:, 0]
+                    + coef[:, np.newaxis, 1] * u_v[:, 1]
+                )
+                % q
+            )
+            pts = np.zeros((len(lines), q + 1, 3), dtype=np.int64)
+            rows = np.arange(len(lines))[:, np.newaxis]
+            pts[rows, cols, lead[:, np.newaxis]] = solved
+            pts[rows, cols, free[:, np.newaxis, 0]] = u_v[:, 0]
+            pts[rows, cols, free[:, np.newaxis, 1]] = u_v[:, 1]
+            table[start : start + step] = np.sort(self.index_array(pts), axis=-1)
+        return table
+
+    def index_array(self, coord: np.ndarray) -> np.ndarray:
+        """
+        The `index_array` function maps non-zero coordinate rows to their indices in the plane.
+
+        :param coord: an integer array of shape (..., 3)
+        :type coord: np.ndarray
+        :return: an int64 array of shape (...); zero rows map to ZERO.
+
+        Examples:
+            >>> FfTable(3).index_array(np.array([[2, 2, 2], [0, 0, 5], [3, 0, 6]]))
+            array([ 4, 12, -1])
+        """
+        q = self.modulus
+        coord = np.asarray(coord) % q
+        lead = np.take_along_axis(
+            coord, np.argmax(coord != 0, axis=-1)[..., np.newaxis], -1
+        )
+        mon = coord * self._inv[lead] % q
+        return np.where(
+            mon[..., 0] == 1,
+            mon[..., 1] * q + mon[..., 2],
+            np.where(
+                mon[..., 1] == 1,
+                q * q + mon[..., 2],
+                np.where(mon[..., 2] == 1, q * q + q, ZERO),
+            ),
+        )
+
+    def index(self, coord: Sequence[int]) -> int:
+        """
+        The `index` function maps the coordinates of a point or line to its index.
+
+        :param coord: a sequence of three integers
+        :type coord: Sequence[int]
+        :return: the index in the range [0, p^2 + p + 1), or ZERO for the zero vector.
+
+        Examples:
+            >>> FfTable(3).index([0, 2, 1])
+            11
+        """
+        return int(self.index_array(np.asarray(coord)))
+
+    def points_on(self, line: int) -> np.ndarray:
+        """Sorted indices of the p + 1 points on a line."""
+        return self.table[line]
+
+    def lines_through(self, point: int) -> np.ndarray:
+        """Sorted indices of the p + 1 lines through a point."""
+        return self.table[point]
+
+    def incident(self, point: int, line: int) -> bool:
+        """
+        The function checks by binary search whether a point lies on a line.
+
+        Examples:
+            >>> plane = FfTable(3)
+            >>> plane.incident(plane.index([1, 1, 1]), plane.index([1, 2, 0]))
+            True
+        """
+        if point == ZERO or line == ZERO:
+            return True
+        row = self.table[line]
+        pos = int(np.searchsorted(row, point))
+        return pos < len(row) and int(row[pos]) == point
+
+    def meet(self, obj_a: int, obj_b: int) -> int:
+        """
+        The `meet` function returns the line through two points, or the point on two lines.
+        The meet of an object with itself, or with ZERO, is ZERO.
+
+        Examples:
+            >>> from projgeom.pg_object import cross
+            >>> plane = FfTable(5)
+            >>> pt_a, pt_b = plane.index([1, 2, 3]), plane.index([0, 1, 4])
+            >>> plane.meet(pt_a, pt_b) == plane.index(cross([1, 2, 3], [0, 1, 4]))
+            True
+        """
+        if obj_a == obj_b or obj_a == ZERO or obj_b == ZERO:
+            return ZERO
+        row_a = self.table[obj_a]
+        row_b = self.table[obj_b]
+        pos = np.minimum(np.searchsorted(row_a, row_b), len(row_a) - 1)
+        return int(row_b[np.argmax(row_a[pos] == row_b)])
+
+    def coincident(self, obj_a: int, obj_b: int, obj_c: int) -> bool:
+        """
+        The function checks whether three points are collinear (or three lines concurrent).
+
+        Examples:
+            >>> plane = FfTable(3)
+            >>> pts = [plane.index(c) for c in ([1, 0, 0], [0, 1, 0], [1, 1, 0])]
+            >>> plane.coincident(*pts)
+            True
+        """
+        return self.incident(obj_c, self.meet(obj_a, obj_b))
+
+    def point(self, index: int) -> "FfTablePoint":
+        """The point with the given index, as a `ProjectivePlane` object."""
+        return FfTablePoint(self, index)
+
+    def line(self, index: int) -> "FfTableLine":
+        """The line with the given index, as a `ProjectivePlane` object."""
+        return FfTableLine(self, index)
+
+    def points(self) -> List["FfTablePoint"]:
+        """All points of the plane."""
+        return [FfTablePoint(self, i) for i in range(self.size)]
+
+    def lines(self) -> List["FfTableLine"]:
+        """All lines of the plane."""
+        return [FfTableLine(self, i) for i in range(self.size)]
+
+
+class FfTableObject(ProjectivePlane[Dual, int]):
+    """
+    The `FfTableObject` class represents a point or line of PG(2, p) by its index in an `FfTable`.
+
+    `meet`, `incident` and equality are table lookups. `dot`, `parametrize` and
+    `aux` need the field arithmetic and use the monic coordinates of the table.
+
+    Examples:
+        >>> from projgeom.pg_plane import check_desargue
+        >>> plane = FfTable(7)
+        >>> tri_1 = [plane.point(i) for i in (0, 9, 30)]
+        >>> tri_2 = [plane.point(i) for i in (1, 17, 52)]
+        >>> check_desargue(tri_1, tri_2)
+        True
+    """
+
+    __slots__ = ("table", "index")
+
+    table: FfTable
+    index: int
+
+    def __init__(self, table: FfTable, index: int) -> None:
+        self.table = table
+        self.index = index
+
+    @property
+    def coord(self) -> tuple:
+        if self.index == ZERO:
+            return (0, 0, 0)
+        return tuple(self.table.coords[self.index].tolist())
+
+    def __repr__(self):
+        """repr(self)"""
+        x, y, z = self.coord
+        return f"{self.__class__.__name__}({x} : {y} : {z})"
+
+    def __eq__(self, other) -> bool:
+        if type(self) is not type(other) or self.table is not other.table:
+            return False
+        return self.index == other.index or ZERO in (self.index, other.index)
+
+    def __hash__(self) -> int:
+        """
+        The function hashes the index. The zero vector is equal to every object, so it has no hash.
+
+        :raises ValueError: the object is the zero vector.
+        """
+        if self.index == ZERO:
+            raise ValueError("the zero vector has no hash")
+        return hash(self.index)
+
+    def dual_type(self) -> type:
+        return FfTableObject
+
+    def _from_coord(self, cls: type, coord: Sequence[int]) -> "FfTableObject":
+        return cls(self.table, self.table.index(coord))
+
+    def meet(self, rhs: Self) -> Dual:
+        """
+        The `meet` function looks up the join of two points or the meet of two lines.
+
+        Examples:
+            >>> plane = FfTable(3)
+            >>> plane.point(0).meet(plane.point(1))
+            FfTableLine(0 : 1 : 0)
+        """
+        return self.dual_type()(self.table, self.table.meet(self.index, rhs.index))
+
+    def incident(self, rhs: Dual) -> bool:
+        """The function looks up whether the two objects are incident."""
+        return self.table.incident(self.index, rhs.index)
+
+    def coincident(self, pt_q: Self, pt_r: Self) -> bool:
+        """The function looks up whether three points are collinear (or three lines concurrent)."""
+        return self.table.coincident(self.index, pt_q.index, pt_r.index)
+
+    def dot(self, line) -> int:
+        return dot(self.coord, line.coord) % self.table.modulus
+
+    def parametrize(self, lambda_: int, pt_q: Self, mu_: int) -> Self:
+        coord = plckr(lambda_, self.coord, mu_, pt_q.coord)
+        return self._from_coord(type(self), coord)  # type: ignore[return-value]
+
+    def aux(self) -> Dual:
+        """
+        The `aux` function returns a dual object not incident with this one.
+
+        Examples:
+            >>> plane = FfTable(5)
+            >>> all(not pt.incident(pt.aux()) for pt in plane.points())
+            True
+        """
+        elem = self._ff_type()(self.coord, self.table.modulus)
+        return self._from_coord(self.dual_type(), elem.aux().coord)  # type: ignore[return-value]
+
+    def _ff_type(self) -> type:
+        return FfPoint
+
+
+class FfTablePoint(FfTableObject["FfTableLine"]):
+    """Point of PG(2, p) backed by an `FfTable`"""
+
+    __slots__ = ()
+
+    def dual_type(self) -> type:
+        return FfTableLine
+
+
+class FfTableLine(FfTableObject[FfTablePoint]):
+    """Line of PG(2, p) backed by an `FfTable`"""
+
+    __slots__ = ()
+
+    def dual_type(self) -> type:
+        return FfTablePoint
+
+    def _ff_type(self) -> type:
+        return FfLine
@@ -15,6 +15,8 @@ class HyperbolicPoint(PgObject["HyperbolicLine"]):
         /  |  \\
     """
 
+    __slots__ = ()
+
     def dual_type(self) -> type:
         """Returns the type of the dual object (HyperbolicLine for HyperbolicPoint).
 
@@ -74,6 +76,8 @@ class HyperbolicLine(PgObject[HyperbolicPoint]):
         /  |  \\
     """
 
+    __slots__ = ()
+
     def dual_type(self) -> type:
         """Returns the type of the dual object (HyperbolicPoint for HyperbolicLine).
 
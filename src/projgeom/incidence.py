@@ -0,0 +1,120 @@
+"""
+Incidence Relation between Point Sets and Line Sets (incidence.py)
+
+This code computes which of M points lie on which of N lines in one
+    computation, instead of M x N separate `incident()` calls.
+
+The inputs are a collection of points and a collection of lines. Each may be
+    a `PgArray`, an (N, 3) integer array, or a plain sequence of `PgObject`
+    instances. Point i is incident with line j exactly when the dot product of
+    their coordinates vanishes, so the whole relation is the zero pattern of
+    the matrix product `points @ lines.T`.
+
+The relation is available in two forms:
+
+1. incidence_matrix(): a dense (M, N) boolean matrix.
+2. incidence_pairs(): a sparse (K, 2) array of (point index, line index) pairs,
+   with iter_incidence_pairs() streaming the same pairs block by block.
+
+Both work on blocks of `block_size` points by `block_size` lines, so the
+    temporary products stay bounded however large M x N is. The sparse form
+    only ever holds one block of products in memory, which makes it usable
+    when the dense matrix would not fit. The products go through the
+    overflow-checked kernel of `pg_array.py`, so the answers are exact for
+    coordinates of any size.
+"""
+
+from typing import Iterator
+
+import numpy as np
+
+from .pg_array import outer_dot_array, to_coord_array
+
+BLOCK_SIZE = 2048
+
+
+def _blocks(num_points: int, num_lines: int, block_size: int):
+    if block_size <= 0:
+        raise ValueError("block_size must be positive")
+    for row in range(0, num_points, block_size):
+        for col in range(0, num_lines, block_size):
+            yield row, min(row + block_size, num_points), col, min(
+                col + block_size, num_lines
+            )
+
+
+def incidence_matrix(points, lines, block_size: int = BLOCK_SIZE) -> np.ndarray:
+    """
+    The `incidence_matrix` function computes the incidence relation as a dense boolean matrix.
+
+    :param points: a collection of M points (`PgArray`, (M, 3) array, or sequence of `PgObject`)
+    :param lines: a collection of N lines (`PgArray`, (N, 3) array, or sequence of `PgObject`)
+    :param block_size: number of points and of lines handled per block
+    :type block_size: int
+    :return: a boolean array of shape (M, N) whose entry (i, j) tells whether point i lies on line j.
+
+    Examples:
+        >>> from projgeom.pg_object import PgLine, PgPoint
+        >>> points = [PgPoint([1, 0, 0]), PgPoint([0, 1, 0]), PgPoint([1, 1, 1])]
+        >>> lines = [PgLine([0, 0, 1]), PgLine([1, -1, 0])]
+        >>> incidence_matrix(points, lines)
+        array([[ True, False],
+               [ True, False],
+               [False,  True]])
+    """
+    pts = to_coord_array(points)
+    lns = to_coord_array(lines)
+    result = np.zeros((pts.shape[0], lns.shape[0]), dtype=bool)
+    for r_0, r_1, c_0, c_1 in _blocks(pts.shape[0], lns.shape[0], block_size):
+        result[r_0:r_1, c_0:c_1] = outer_dot_array(pts[r_0:r_1], lns[c_0:c_1]) == 0
+    return result
+
+
+def iter_incidence_pairs(
+    points, lines, block_size: int = BLOCK_SIZE
+) -> Iterator[np.ndarray]:
+    """
+    The `iter_incidence_pairs` function streams the incident (point, line) index pairs block by block.
+
+    :param points: a collection of M points (`PgArray`, (M, 3) array, or sequence of `PgObject`)
+    :param lines: a collection of N lines (`PgArray`, (N, 3) array, or sequence of `PgObject`)
+    :param block_size: number of points and of lines handled per block
+    :type block_size: int
+    :return: an iterator of (K_b, 2) int64 arrays, one per block that contains incidences.
+
+    Examples:
+        >>> from projgeom.pg_object import PgLine, PgPoint
+        >>> points = [PgPoint([1, 0, 0]), PgPoint([0, 1, 0]), PgPoint([1, 1, 1])]
+        >>> lines = [PgLine([0, 0, 1]), PgLine([1, -1, 0])]
+        >>> [blk.tolist() for blk in iter_incidence_pairs(points, lines, block_size=2)]
+        [[[0, 0], [1, 0]], [[2, 1]]]
+    """
+    pts = to_coord_array(points)
+    lns = to_coord_array(lines)
+    for r_0, r_1, c_0, c_1 in _blocks(pts.shape[0], lns.shape[0], block_size):
+        rows, cols = np.nonzero(outer_dot_array(pts[r_0:r_1], lns[c_0:c_1]) == 0)
+        if rows.size > 0:
+            yield np.stack([rows + r_0, cols + c_0], axis=-1).astype(np.int64)
+
+
+def incidence_pairs(points, lines, block_size: int = BLOCK_SIZE) -> np.ndarray:
+    """
+    The `incidence_pairs` function computes the incidence relation as a sparse list of index pairs.
+
+    :param points: a collection of M points (`PgArray`, (M, 3) array, or sequence of `PgObject`)
+    :param lines: a collection of N lines (`PgArray`, (N, 3) array, or sequence of `PgObject`)
+    :param block_size: number of points and of lines handled per block
+    :type block_size: int
+    :return: an int64 array of shape (K, 2); each row is a (point index, line index) pair.
+
+    Examples:
+        >>> from projgeom.pg_array import PgLineArray, PgPointArray
+        >>> points = PgPointArray([[1, 0, 0], [0, 1, 0], [1, 1, 1]])
+        >>> lines = PgLineArray([[0, 0, 1], [1, -1, 0]])
+        >>> incidence_pairs(points, lines).tolist()
+        [[0, 0], [1, 0], [2, 1]]
+    """
+    blocks = list(iter_incidence_pairs(points, lines, block_size))
+    if not blocks:
+        return np.zeros((0, 2), dtype=np.int64)
+    return np.concatenate(blocks)
@@ -0,0 +1,275 @@
+"""
+Kernel Instrumentation (instrument.py)
+
+This code counts and times the calls to the geometry kernel, to find out
+    which primitive dominates a slow job before deciding between batching,
+    normalization and caching.
+
+Inside a `with Instrument() as inst:` block every call of
+
+1. the primitives `meet`, `dot`, `incident`, `coincident`, `parametrize`,
+   `aux`, `perp` and `__eq__` of every `PgObject` subclass, and
+2. the functions of `pg_plane.py` and `ck_plane.py` (`harm_conj`,
+   `involution`, `check_desargue`, `orthocenter`, ...)
+
+is counted and timed, and the bit length of the largest coordinate of its
+    result is recorded. The statistics are keyed by the geometry class (the
+    class of `self` for a primitive, the class of the first point for a
+    function) and the name of the operation, so that two classes of the same
+    name, e.g. made by `conic_object.cayley_klein`, are kept apart. Classes
+    created inside the block are instrumented too. Times are inclusive: the
+    time of `orthocenter` contains that of the `meet` calls it makes.
+
+The calls are observed with a profile hook (`sys.setprofile`) that is set
+    when the block is entered and removed when it is left, so the kernel
+    runs at full speed when it is not instrumented, and nothing is patched:
+    functions imported with `from projgeom.pg_plane import ...` are seen as
+    well. Only the calls of the thread that entered the block are counted.
+    A profiler that is already running (e.g. cProfile) is suspended within
+    the block.
+
+Examples:
+    >>> from projgeom.hyp_object import HyperbolicPoint
+    >>> from projgeom.ck_plane import orthocenter
+    >>> triangle = [HyperbolicPoint([1, 3, 5]), HyperbolicPoint([3, 1, 4]),
+    ...             HyperbolicPoint([5, 2, 1])]
+    >>> with Instrument() as inst:
+    ...     pt_h = orthocenter(triangle)
+    >>> stats = inst.snapshot()
+    >>> stats[HyperbolicPoint, "orthocenter"].calls
+    1
+    >>> from projgeom.hyp_object import HyperbolicLine
+    >>> stats[HyperbolicPoint, "meet"].calls, stats[HyperbolicLine, "meet"].calls
+    (4, 1)
+"""
+
+import sys
+import time
+from types import CodeType, FrameType, FunctionType
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple
+
+from . import ck_plane, pg_plane
+from .pg_object import PgObject
+
+PRIMITIVES = (
+    "meet",
+    "dot",
+    "incident",
+    "coincident",
+    "parametrize",
+    "aux",
+    "perp",
+    "__eq__",
+)
+
+
+class OpStats(NamedTuple):
+    """Statistics of one operation of one geometry class"""
+
+    calls: int
+    seconds: float
+    """Total time spent in the calls, including nested calls."""
+    max_bits: int
+    """Largest bit length of a result coordinate (or of a scalar result)."""
+    mean_bits: float
+    """Mean bit length of the largest result coordinate, over the calls with a result."""
+
+
+class _Counter:
+    __slots__ = ("calls", "nanos", "max_bits", "sum_bits", "sized")
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.nanos = 0
+        self.max_bits = 0
+        self.sum_bits = 0
+        self.sized = 0
+
+
+def _bits(result) -> Optional[int]:
+    """Bit length of the largest coordinate of a result, or None for booleans etc."""
+    if isinstance(result, PgObject):
+        return max(abs(x).bit_length() for x in result.coord)
+    if isinstance(result, int) and not isinstance(result, bool):
+        return abs(result).bit_length()
+    if isinstance(result, (list, tuple)) and result:
+        sizes = [_bits(item) for item in result]
+        if None not in sizes:
+            return max(sizes)  # type: ignore
+    return None
+
+
+def _geometry_class(arg) -> Optional[type]:
+    """The geometry class of the first argument of a function (or of its first item)."""
+    if isinstance(arg, (list, tuple)) and arg:
+        arg = arg[0]
+    if isinstance(arg, PgObject):
+        return type(arg)
+    return None
+
+
+def _primitive(frame: FrameType) -> bool:
+    """Whether a frame runs a primitive of a `PgObject` subclass, found through `self`."""
+    code = frame.f_code
+    if code.co_name not in PRIMITIVES or code.co_argcount == 0:
+        return False
+    first = frame.f_locals.get(code.co_varnames[0])
+    for cls in type(first).__mro__:
+        func = cls.__dict__.get(code.co_name)
+        if isinstance(func, FunctionType) and func.__code__ is code:
+            return issubclass(cls, PgObject)
+    return False
+
+
+def _subclasses(cls: type) -> List[type]:
+    result = [cls]
+    subs: List[type] = cls.__subclasses__()
+    for sub in subs:
+        result.extend(_subclasses(sub))
+    return list(dict.fromkeys(result))
+
+
+class Instrument:
+    """
+    The `Instrument` class collects operation counts, times and result sizes.
+
+    It is a context manager: the kernel is instrumented while the `with` block
+    runs. The statistics are kept across several blocks until `reset` is
+    called. Only one instrument can be active at a time.
+
+    :raises RuntimeError: another instrument is active already.
+    """
+
+    _active: Optional["Instrument"] = None
+
+    def __init__(self) -> None:
+        self._counters: Dict[Tuple[Optional[type], str], _Counter] = {}
+        self._previous: Optional[Callable] = None
+
+    def _watched(self) -> Dict[CodeType, Tuple[bool, str]]:
+        """
+        Code objects of the instrumented methods and functions. The primitives of
+        classes created later are added by the hook when they are first called.
+        """
+        watched: Dict[CodeType, Tuple[bool, str]] = {}
+        for cls in _subclasses(PgObject):
+            for name in PRIMITIVES:
+                func = cls.__dict__.get(name)
+                if isinstance(func, FunctionType):
+                    watched[func.__code__] = (True, name)
+        for module in (pg_plane, ck_plane):
+            for name, func in vars(module).items():
+                if (
+                    isinstance(func, FunctionType)
+                    and func.__module__ == module.__name__
+                ):
+                    watched[func.__code__] = (False, name)
+        return watched
+
+    def _make_hook(self) -> Callable:
+        watched = self._watched()
+        ignored: Set[CodeType] = set()
+        counters = self._counters
+        stack: List[Tuple[FrameType, str, _Counter, int, object]] = []
+        clock = time.perf_counter_ns
+
+        def hook(frame: FrameType, event: str, arg) -> None:
+            if event == "call":
+                info = watched.get(frame.f_code)
+                if info is None:
+                    code = frame.f_code
+                    if code in ignored:
+                        return
+                    if not _primitive(frame):
+                        ignored.add(code)
+                        return
+                    info = watched[code] = (True, code.co_name)
+                is_method, name = info
+                first = frame.f_locals[frame.f_code.co_varnames[0]]
+                # A method that calls the same method of its base class (on the same
+                # object, through super()) is counted once.
+                if stack:
+                    caller, caller_name, _, _, caller_first = stack[-1]
+                    if (
+                        caller is frame.f_back
+                        and caller_name == name
+                        and caller_first is first
+                    ):
+                        return
+                key: Tuple[Optional[type], str]
+                if is_method:
+                    key = (type(first), name)
+                else:
+                    key = (_geometry_class(first), name)
+                counter = counters.get(key)
+                if counter is None:
+                    counter = counters[key] = _Counter()
+                stack.append((frame, name, counter, clock(), first))
+            elif event == "return" and stack and stack[-1][0] is frame:
+                counter, start = stack.pop()[2:4]
+                counter.nanos += clock() - start
+                counter.calls += 1
+                bits = _bits(arg)
+                if bits is not None:
+                    counter.sum_bits += bits
+                    counter.sized += 1
+                    if bits > counter.max_bits:
+                        counter.max_bits = bits
+
+        return hook
+
+    def __enter__(self) -> "Instrument":
+        if Instrument._active is not None:
+            raise RuntimeError("another Instrument is active")
+        Instrument._active = self
+        self._previous = sys.getprofile()
+        sys.setprofile(self._make_hook())
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        sys.setprofile(self._previous)
+        self._previous = None
+        Instrument._active = None
+
+    def reset(self) -> None:
+        """The `reset` function discards the statistics collected so far."""
+        self._counters.clear()
+
+    def snapshot(self) -> Dict[Tuple[Optional[type], str], OpStats]:
+        """
+        The `snapshot` function returns a copy of the statistics collected so far.
+
+        :return: a dict mapping (class, operation name) to `OpStats`, where the class
+            is None for a function whose first argument is not a geometry object. It can
+            be taken inside or after a `with` block.
+        """
+        return {
+            key: OpStats(
+                counter.calls,
+                counter.nanos / 1e9,
+                counter.max_bits,
+                counter.sum_bits / counter.sized if counter.sized else 0.0,
+            )
+            for key, counter in self._counters.items()
+        }
+
+    def report(self) -> str:
+        """
+        The `report` function formats the statistics as a table, slowest operation first.
+
+        :return: one line per (class, operation) with calls, total time, time per
+            call and the maximum and mean result bit lengths.
+        """
+        lines = [
+            f"{'class':<16} {'operation':<16} {'calls':>10} {'total s':>10} "
+            f"{'us/call':>9} {'max bits':>9} {'mean bits':>9}"
+        ]
+        stats = sorted(self.snapshot().items(), key=lambda item: -item[1].seconds)
+        for (cls, op_name), stat in stats:
+            cls_name = "-" if cls is None else cls.__qualname__
+            lines.append(
+                f"{cls_name:<16} {op_name:<16} {stat.calls:>10} {stat.seconds:>10.4f} "
+                f"{1e6 * stat.seconds / stat.calls:>9.2f} {stat.max_bits:>9} "
+                f"{stat.mean_bits:>9.1f}"
+            )
+        return "\n".join(lines)
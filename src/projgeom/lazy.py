@@ -0,0 +1,287 @@
+"""
+Lazy Construction Graph (lazy.py)
+
+This code adds a lazy expression layer over the `ProjectivePlane` and
+    `CayleyKleinPlane` API. A `LazyObject` wraps a node of a construction
+    graph: `meet`, `parametrize`, `perp` and `aux` do not compute anything but
+    return a new node, and `dot` returns a `LazyScalar` node. Arithmetic only
+    happens when an answer is requested: a boolean (`incident`, `coincident`,
+    `==`), or the concrete object or its coordinates (`value()`, `coord`).
+
+Nodes are hash-consed in a `LazyGraph`. Before a node is created its key,
+    the operation together with the identities of its operands, is looked up,
+    so a subexpression that is built twice is the same node and is evaluated
+    at most once. Since `a.meet(b)` and `b.meet(a)` differ only in sign, the
+    second one reuses the first one through a cheap negation. The pg_plane.py
+    and ck_plane.py functions run unchanged on lazy objects. For example the
+    altitudes computed by `orthocenter` below are the ones `tri_altitude`
+    already built, so only the final meet is new work:
+
+    >>> from projgeom.ck_plane import orthocenter, tri_altitude
+    >>> from projgeom.hyp_object import HyperbolicPoint
+    >>> graph = LazyGraph()
+    >>> triangle = graph.leaves([HyperbolicPoint([1, 3, 5]), HyperbolicPoint([3, 1, 4]),
+    ...                          HyperbolicPoint([5, 2, 1])])
+    >>> alt_1, alt_2, alt_3 = tri_altitude(triangle)
+    >>> pt_h = orthocenter(triangle)
+    >>> pt_h.incident(alt_3)
+    True
+    >>> graph.computed
+    10
+
+Evaluation is iterative and every node keeps its value, so arbitrarily deep
+    construction chains are safe and later queries reuse all earlier work.
+
+`==` on lazy objects is projective equality of the values, as for concrete
+    objects, and evaluates both sides. `hash` however goes by the node, so
+    nodes can be kept in sets and dicts without being evaluated and their
+    hash does not change when a free point is moved (see dynamic.py). As keys,
+    two different nodes are therefore different even if their values are
+    equal.
+"""
+
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from .pg_plane import ProjectivePlane
+
+
+class LazyGraph:
+    """
+    The `LazyGraph` class interns the nodes of a construction and counts the work done.
+
+    :ivar computed: the number of operations actually evaluated
+    :ivar reused: the number of times a requested node already existed
+
+    Examples:
+        >>> from projgeom.pg_object import PgPoint
+        >>> graph = LazyGraph()
+        >>> pt_a, pt_b = graph.leaves([PgPoint([1, 2, 3]), PgPoint([4, 5, 6])])
+        >>> pt_a.meet(pt_b) is pt_a.meet(pt_b)
+        True
+        >>> pt_a.meet(pt_b).value()
+        PgLine(-3 : 6 : -3)
+    """
+
+    computed: int
+    reused: int
+
+    def __init__(self) -> None:
+        self._nodes: Dict[Tuple, "_Node"] = {}
+        self.computed = 0
+        self.reused = 0
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def _intern(self, cls: type, op: str, args: Tuple, key: Tuple) -> Any:
+        node = self._nodes.get(key)
+        if node is not None:
+            self.reused += 1
+            return node
+        node = self._nodes[key] = cls(self, op, args, len(self._nodes))
+        return node
+
+    def leaf(self, obj: ProjectivePlane) -> "LazyObject":
+        """
+        The `leaf` function wraps a concrete point or line as a node of the graph.
+        Wrapping the same object twice gives the same node.
+        """
+        return self._intern(LazyObject, "leaf", (obj,), ("leaf", id(obj)))
+
+    def leaves(self, objs: Iterable[ProjectivePlane]) -> List["LazyObject"]:
+        """The `leaves` function wraps every object of `objs` with `leaf`."""
+        return [self.leaf(obj) for obj in objs]
+
+    def const(self, value: int) -> "LazyScalar":
+        """The `const` function wraps an integer as a scalar node."""
+        return self._intern(LazyScalar, "const", (value,), ("const", value))
+
+    def scalar(self, value) -> "LazyScalar":
+        """A scalar node for `value`, which is either a `LazyScalar` of this graph or an integer."""
+        if isinstance(value, LazyScalar):
+            return value
+        return self.const(value)
+
+    def node(self, cls: type, op: str, *args: "_Node") -> Any:
+        """The `node` function returns the interned node of `op` applied to `args`."""
+        key = (op,) + tuple(arg.uid for arg in args)
+        return self._intern(cls, op, args, key)
+
+    def evaluate(self, root: "_Node") -> Any:
+        """
+        The `evaluate` function computes the value of a node and of all its missing operands,
+        in post-order with an explicit stack, and stores them on the nodes.
+        """
+        stack = [root]
+        while stack:
+            node = stack[-1]
+            if node._evaluated:
+                stack.pop()
+                continue
+            pending = [arg for arg in node.args if not arg._evaluated]
+            if pending:
+                stack.extend(pending)
+                continue
+            stack.pop()
+            node._value = _OPS[node.op](*(arg._value for arg in node.args))
+            node._evaluated = True
+            if node.op not in ("leaf", "const"):
+                self.computed += 1
+        return root._value
+
+
+class _Node:
+    __slots__ = ("graph", "op", "args", "uid", "_value", "_evaluated")
+
+    graph: LazyGraph
+    op: str
+    args: Tuple["_Node", ...]
+    uid: int
+    _value: Any
+    _evaluated: bool
+
+    def __init__(self, graph: LazyGraph, op: str, args: Tuple, uid: int) -> None:
+        self.graph = graph
+        self.op = op
+        self.uid = uid
+        if op in ("leaf", "const"):
+            self.args = ()
+            self._value = args[0]
+            self._evaluated = True
+        else:
+            self.args = args
+            self._value = None
+            self._evaluated = False
+
+    def value(self) -> Any:
+        """The `value` function evaluates the node and returns the concrete result."""
+        if self._evaluated:
+            return self._value
+        return self.graph.evaluate(self)
+
+    def __repr__(self):
+        """repr(self)"""
+        return f"{self.__class__.__name__}(#{self.uid} {self.op})"
+
+
+class LazyScalar(_Node):
+    """
+    The `LazyScalar` class is an unevaluated scalar, for example the result of `dot`.
+    It can be passed as a coefficient to `parametrize` without being evaluated.
+    """
+
+    __slots__ = ()
+
+    def __int__(self) -> int:
+        return int(self.value())
+
+    __index__ = __int__
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, LazyScalar):
+            other = other.value()
+        return self.value() == other
+
+    def __hash__(self) -> int:
+        return hash(self.value())
+
+    def __neg__(self) -> "LazyScalar":
+        return self.graph.node(LazyScalar, "neg", self)
+
+
+class LazyObject(_Node, ProjectivePlane["LazyObject", Any]):
+    """
+    The `LazyObject` class is an unevaluated point or line of a construction graph.
+
+    Examples:
+        >>> from projgeom.ell_object import EllipticPoint
+        >>> from projgeom.ck_plane import orthocenter
+        >>> graph = LazyGraph()
+        >>> triangle = graph.leaves([EllipticPoint([1, 3, 5]), EllipticPoint([3, 1, 4]),
+        ...                          EllipticPoint([5, 2, 1])])
+        >>> pt_h = orthocenter(triangle)
+        >>> graph.computed
+        0
+        >>> pt_h == orthocenter([pt.value() for pt in triangle])
+        True
+    """
+
+    __slots__ = ()
+
+    @property
+    def coord(self):
+        """The coordinates of the evaluated object."""
+        return self.value().coord
+
+    def dual_type(self) -> type:
+        return LazyObject
+
+    def __eq__(self, other) -> bool:
+        """
+        The `__eq__` function checks if the values of two nodes (or of a node and a concrete
+        object) are projectively equal. Both are evaluated, unless they are the same node.
+
+        Examples:
+            >>> from projgeom.pg_object import PgPoint
+            >>> graph = LazyGraph()
+            >>> pt_a, pt_b = graph.leaves([PgPoint([1, 2, 3]), PgPoint([2, 4, 6])])
+            >>> pt_a == pt_b, pt_a == PgPoint([-1, -2, -3]), len({pt_a, pt_b})
+            (True, True, 2)
+        """
+        if self is other:
+            return True
+        if isinstance(other, LazyObject):
+            other = other.value()
+        return self.value() == other
+
+    def __hash__(self) -> int:
+        return hash(self.uid)
+
+    def meet(self, rhs: "LazyObject") -> "LazyObject":
+        graph = self.graph
+        swapped = graph._nodes.get(("meet", rhs.uid, self.uid))
+        if swapped is not None and ("meet", self.uid, rhs.uid) not in graph._nodes:
+            return graph.node(LazyObject, "neg", swapped)
+        return graph.node(LazyObject, "meet", self, rhs)
+
+    def aux(self) -> "LazyObject":
+        return self.graph.node(LazyObject, "aux", self)
+
+    def perp(self) -> "LazyObject":
+        return self.graph.node(LazyObject, "perp", self)
+
+    def dot(self, line: "LazyObject") -> LazyScalar:
+        return self.graph.node(LazyScalar, "dot", self, line)
+
+    def parametrize(self, lambda_, pt_q: "LazyObject", mu_) -> "LazyObject":
+        graph = self.graph
+        return graph.node(
+            LazyObject,
+            "parametrize",
+            self,
+            graph.scalar(lambda_),
+            pt_q,
+            graph.scalar(mu_),
+        )
+
+    def incident(self, line: "LazyObject") -> bool:
+        return self.value().incident(line.value())
+
+    def coincident(self, pt_q: "LazyObject", pt_r: "LazyObject") -> bool:
+        return self.value().coincident(pt_q.value(), pt_r.value())
+
+
+def _neg(obj):
+    if isinstance(obj, int):
+        return -obj
+    return obj.parametrize(-1, obj, 0)
+
+
+_OPS: Dict[str, Callable[..., Any]] = {
+    "meet": lambda a, b: a.meet(b),
+    "neg": _neg,
+    "aux": lambda a: a.aux(),
+    "perp": lambda a: a.perp(),
+    "dot": lambda a, b: a.dot(b),
+    "parametrize": lambda a, lam, q, mu: a.parametrize(lam, q, mu),
+}
@@ -63,6 +63,8 @@ class MyCKPoint(PgObject["MyCKLine"]):
           \\ /
     """
 
+    __slots__ = ()
+
     def dual_type(self) -> type:
         """Returns the type of the dual object (MyCKLine for MyCKPoint).
 
@@ -120,6 +122,8 @@ class MyCKLine(PgObject[MyCKPoint]):
           \\ /
     """
 
+    __slots__ = ()
+
     def dual_type(self) -> type:
         """Returns the type of the dual object (MyCKPoint for MyCKLine).
 
@@ -0,0 +1,172 @@
+"""
+Reflection Group Orbits (orbit.py)
+
+This code enumerates the orbit of a point, a line or a figure (e.g. a
+    triangle) under the group generated by the reflections in a set of
+    mirror lines of a Cayley-Klein geometry, for example to produce the
+    vertices of a hyperbolic or elliptic tessellation.
+
+The orbit is explored breadth first, one level at a time: level k holds the
+    images that are first reached by a product of k reflections. A whole
+    level is reflected in each mirror with a single matrix product
+    (`Reflection.apply_array`), and every image is brought to canonical
+    coordinates with `canonical_array`, so that:
+
+1. coordinates do not grow with the common factors that the products
+   introduce, and
+2. projectively equal images have equal coordinates, and duplicates are
+   found by looking up the canonical key in a set.
+
+A figure is unordered: a triangle and its images with permuted vertices are
+    the same element of the orbit.
+
+The orbit of an infinite group (e.g. a hyperbolic triangle group) is
+    infinite. `orbit_levels` and `orbit` are generators, so the orbit can be
+    consumed as it is produced, and they stop after `max_depth` levels or
+    `max_size` elements, whichever comes first.
+
+Examples:
+    >>> from projgeom.ell_object import EllipticLine, EllipticPoint
+    >>> mirrors = [EllipticLine([1, 0, 0]), EllipticLine([0, 1, 0]), EllipticLine([1, -1, 0])]
+    >>> pts = list(orbit(mirrors, EllipticPoint([1, 2, 3])))
+    >>> len(pts)
+    8
+    >>> pts[:3]
+    [EllipticPoint(1 : 2 : 3), EllipticPoint(1 : -2 : -3), EllipticPoint(1 : -2 : 3)]
+"""
+
+from typing import Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .pg_array import canonical_array, to_coord_array
+from .pg_object import PgObject
+from .transform import Mirror, reflection
+
+Seed = Union[PgObject, Sequence[PgObject]]
+
+
+def _frontier(figures: List[List[List[int]]]) -> np.ndarray:
+    """The (N, K, 3) array of N figures, with int64 dtype if the coordinates fit."""
+    try:
+        return np.array(figures, dtype=np.int64)
+    except OverflowError:
+        return np.array(figures, dtype=object)
+
+
+def _figure(seed: Seed) -> List[PgObject]:
+    figure = [seed] if isinstance(seed, PgObject) else list(seed)
+    if not figure:
+        raise ValueError("the seed figure must not be empty")
+    if any(type(obj) is not type(figure[0]) for obj in figure):
+        raise TypeError("all objects of the seed figure must be of the same type")
+    return figure
+
+
+def orbit_levels(
+    mirrors: Sequence[Mirror],
+    seed: Seed,
+    max_depth: Optional[int] = None,
+    max_size: Optional[int] = None,
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    The `orbit_levels` function generates the orbit of a seed level by level, as coordinate arrays.
+
+    :param mirrors: the mirror lines, all of the same type, e.g. `HyperbolicLine`
+    :type mirrors: Sequence[Mirror]
+    :param seed: a point or line, or a sequence of points or lines (a figure)
+    :type seed: Union[PgObject, Sequence[PgObject]]
+    :param max_depth: stop after the images under products of `max_depth` reflections
+    :type max_depth: Optional[int]
+    :param max_size: stop after `max_size` elements of the orbit
+    :type max_size: Optional[int]
+    :return: an iterator of pairs `(k, figures)`, where `figures` is an (N, K, 3) array
+        of the N new figures of level k, each with its K objects in canonical
+        coordinates. Level 0 is the seed itself. Levels without new figures are
+        not yielded; the iteration ends when a level has no new figures.
+    :raises ValueError: no mirrors are given, or the seed figure is empty.
+    :raises TypeError: the mirrors, or the objects of the figure, are not all of one type.
+
+    Examples:
+        >>> from projgeom.hyp_object import HyperbolicLine, HyperbolicPoint
+        >>> mirrors = [HyperbolicLine([1, 0, 0]), HyperbolicLine([0, 1, 0]),
+        ...            HyperbolicLine([1, 1, 2])]
+        >>> [len(figs) for _, figs in orbit_levels(mirrors, HyperbolicPoint([1, 2, 5]),
+        ...                                        max_depth=4)]
+        [1, 3, 5, 8, 13]
+    """
+    if not mirrors:
+        raise ValueError("at least one mirror is required")
+    if any(type(mirror) is not type(mirrors[0]) for mirror in mirrors):
+        raise TypeError("all mirrors must be of the same type")
+    figure = _figure(seed)
+    refls = [reflection(mirror) for mirror in mirrors]
+    lines = type(figure[0]) is type(mirrors[0])
+
+    frontier = canonical_array(to_coord_array(figure))[np.newaxis]
+    seen = {tuple(sorted(map(tuple, frontier[0].tolist())))}
+    yield 0, frontier
+    depth = 0
+    while max_depth is None or depth < max_depth:
+        if max_size is not None and len(seen) >= max_size:
+            return
+        depth += 1
+        flat = frontier.reshape(-1, 3)
+        new_figures: List[List[List[int]]] = []
+        for refl in refls:
+            images = canonical_array(refl.apply_array(flat, lines))
+            for fig in images.reshape(frontier.shape).tolist():
+                key = tuple(sorted(map(tuple, fig)))
+                if key not in seen:
+                    seen.add(key)
+                    new_figures.append(fig)
+                    if len(seen) == max_size:
+                        break
+            else:
+                continue
+            break
+        if not new_figures:
+            return
+        frontier = _frontier(new_figures)
+        yield depth, frontier
+
+
+def orbit(
+    mirrors: Sequence[Mirror],
+    seed: Seed,
+    max_depth: Optional[int] = None,
+    max_size: Optional[int] = None,
+) -> Iterator:
+    """
+    The `orbit` function generates the elements of the orbit of a seed, breadth first.
+
+    :param mirrors: the mirror lines, all of the same type, e.g. `HyperbolicLine`
+    :type mirrors: Sequence[Mirror]
+    :param seed: a point or line, or a sequence of points or lines (a figure)
+    :type seed: Union[PgObject, Sequence[PgObject]]
+    :param max_depth: stop after the images under products of `max_depth` reflections
+    :type max_depth: Optional[int]
+    :param max_size: stop after `max_size` elements of the orbit
+    :type max_size: Optional[int]
+    :return: an iterator of objects of the type of `seed` if it is a single object, and
+        otherwise of tuples of such objects, in canonical coordinates. The seed
+        comes first, and every element is yielded once.
+
+    Examples:
+        >>> from projgeom.hyp_object import HyperbolicLine, HyperbolicPoint
+        >>> mirrors = [HyperbolicLine([1, 0, 0]), HyperbolicLine([0, 1, 0]),
+        ...            HyperbolicLine([1, 1, 2])]
+        >>> triangle = [HyperbolicPoint([0, 0, 1]), HyperbolicPoint([1, 0, 2]),
+        ...             HyperbolicPoint([1, 1, 3])]
+        >>> for tri in orbit(mirrors, triangle, max_size=3):
+        ...     print(tri)
+        (HyperbolicPoint(0 : 0 : 1), HyperbolicPoint(1 : 0 : 2), HyperbolicPoint(1 : 1 : 3))
+        (HyperbolicPoint(0 : 0 : 1), HyperbolicPoint(1 : 0 : -2), HyperbolicPoint(1 : -1 : -3))
+        (HyperbolicPoint(0 : 0 : 1), HyperbolicPoint(1 : 0 : 2), HyperbolicPoint(1 : -1 : 3))
+    """
+    single = isinstance(seed, PgObject)
+    elem_type = type(_figure(seed)[0])
+    for _, figures in orbit_levels(mirrors, seed, max_depth, max_size):
+        for fig in figures.tolist():
+            objs = tuple(elem_type(coord) for coord in fig)
+            yield objs[0] if single else objs
@@ -0,0 +1,183 @@
+"""
+Parallel Batch Checking (parallel.py)
+
+This code runs a pure function such as `check_pappus`, `check_desargue` or
+    `persp` over a large batch of configurations on a pool of worker
+    processes.
+
+Every configuration is a tuple of arguments, and the function is called as
+    `func(*config)`. The configurations may come from a list or from any
+    iterable, including a generator that produces them on the fly. They are
+    cut into chunks of `chunk_size` items, and each chunk is pickled, sent to a
+    `ProcessPoolExecutor` worker and evaluated there in one go, so the cost of
+    pickling and inter-process communication is amortized over the chunk.
+    At most `max_pending` chunks are in flight at any time, so a stream of
+    millions of configurations is consumed lazily with bounded memory.
+
+The module provides two entry points:
+
+1. run_batch(): streams the per-item results, either in input order or in
+   completion order.
+2. count_results(): aggregates the results into a `collections.Counter`,
+   counting in the workers so only one small counter per chunk travels back.
+
+The function must be picklable, i.e. defined at the top level of a module.
+"""
+
+from collections import Counter, deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, wait
+from itertools import islice
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence
+
+CHUNK_SIZE = 1024
+
+
+def _run_chunk(func: Callable, chunk: Sequence[Sequence]) -> List[Any]:
+    return [func(*config) for config in chunk]
+
+
+def _count_chunk(func: Callable, chunk: Sequence[Sequence]) -> Counter:
+    return Counter(func(*config) for config in chunk)
+
+
+def _chunks(configs: Iterable[Sequence], chunk_size: int) -> Iterator[List[Sequence]]:
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+    iterator = iter(configs)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def _map_chunks(
+    worker: Callable,
+    func: Callable,
+    configs: Iterable[Sequence],
+    chunk_size: int,
+    max_workers: Optional[int],
+    ordered: bool,
+    max_pending: Optional[int],
+    executor: Optional[Executor],
+) -> Iterator[Any]:
+    """Applies `worker(func, chunk)` to every chunk and yields the chunk results."""
+    own_executor = executor is None
+    pool = ProcessPoolExecutor(max_workers) if executor is None else executor
+    if max_pending is None:
+        max_pending = 2 * (getattr(pool, "_max_workers", None) or 1)
+    pending: deque = deque()
+    try:
+        for chunk in _chunks(configs, chunk_size):
+            if len(pending) >= max_pending:
+                if ordered:
+                    yield pending.popleft().result()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        pending.remove(future)
+                        yield future.result()
+            pending.append(pool.submit(worker, func, chunk))
+        if ordered:
+            while pending:
+                yield pending.popleft().result()
+        else:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    yield future.result()
+    finally:
+        for future in pending:
+            future.cancel()
+        if own_executor:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
+def run_batch(
+    func: Callable,
+    configs: Iterable[Sequence],
+    chunk_size: int = CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+    ordered: bool = True,
+    max_pending: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Iterator[Any]:
+    """
+    The `run_batch` function evaluates `func(*config)` for every configuration on a process pool.
+
+    :param func: a picklable function, e.g. `check_pappus`
+    :type func: Callable
+    :param configs: a list or stream of argument tuples
+    :type configs: Iterable[Sequence]
+    :param chunk_size: the number of configurations sent to a worker at once
+    :type chunk_size: int
+    :param max_workers: the number of worker processes; defaults to the number of CPUs
+    :type max_workers: Optional[int]
+    :param ordered: if True, results come in input order; otherwise in completion order
+    :type ordered: bool
+    :param max_pending: the maximum number of chunks in flight; defaults to twice the workers
+    :type max_pending: Optional[int]
+    :param executor: an existing executor to use instead of a new process pool
+    :type executor: Optional[Executor]
+    :return: an iterator over the results. Exceptions raised by `func` are re-raised here.
+
+    Examples:
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> from projgeom.pg_object import PgPoint
+        >>> from projgeom.pg_plane import coincident
+        >>> pts = [PgPoint([1, 0, 0]), PgPoint([0, 1, 0]), PgPoint([1, 1, 0]), PgPoint([0, 0, 1])]
+        >>> configs = [(pts[0], pts[1], pts[i]) for i in range(4)]
+        >>> with ThreadPoolExecutor(2) as pool:
+        ...     list(run_batch(coincident, configs, chunk_size=3, executor=pool))
+        [True, True, True, False]
+    """
+    for chunk_result in _map_chunks(
+        _run_chunk,
+        func,
+        configs,
+        chunk_size,
+        max_workers,
+        ordered,
+        max_pending,
+        executor,
+    ):
+        yield from chunk_result
+
+
+def count_results(
+    func: Callable,
+    configs: Iterable[Sequence],
+    chunk_size: int = CHUNK_SIZE,
+    max_workers: Optional[int] = None,
+    max_pending: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> Counter:
+    """
+    The `count_results` function counts how often `func(*config)` returns each value.
+
+    The parameters are those of `run_batch`. The results are counted per chunk in
+    the workers, so only one counter per chunk is sent back.
+
+    :return: a `Counter` mapping every result (e.g. True and False) to its number of occurrences.
+
+    Examples:
+        >>> from concurrent.futures import ThreadPoolExecutor
+        >>> from projgeom.pg_object import PgPoint
+        >>> from projgeom.pg_plane import coincident
+        >>> pts = [PgPoint([1, 0, 0]), PgPoint([0, 1, 0]), PgPoint([1, 1, 0]), PgPoint([0, 0, 1])]
+        >>> configs = [(pts[0], pts[1], pts[i]) for i in range(4)]
+        >>> with ThreadPoolExecutor(2) as pool:
+        ...     count_results(coincident, configs, chunk_size=3, executor=pool)
+        Counter({True: 3, False: 1})
+    """
+    total: Counter = Counter()
+    for counts in _map_chunks(
+        _count_chunk,
+        func,
+        configs,
+        chunk_size,
+        max_workers,
+        False,
+        max_pending,
+        executor,
+    ):
+        total.update(counts)
+    return total
@@ -20,6 +20,8 @@ class PerspPoint(PgObject["PerspLine"]):
           \\ /
     """
 
+    __slots__ = ()
+
     def dual_type(self) -> type:
         """Returns the type of the dual object (PerspLine for PerspPoint).
 
@@ -102,6 +104,8 @@ class PerspLine(PgObject[PerspPoint]):
           \\ /
     """
 
+    __slots__ = ()
+
     def dual_type(self) -> type:
         """Returns the type of the dual object (PerspPoint for PerspLine).
 
@@ -0,0 +1,719 @@
+"""
+PgArray.py
+
+This code defines array containers for points and lines of the projective
+    plane. Where a `PgObject` holds the homogeneous coordinates of a single
+    object, a `PgArray` holds the coordinates of N objects at once as an
+    (N, 3) integer NumPy array, so that `meet`, `dot`, `incident`,
+    `parametrize` and `aux` are evaluated for all rows in one vectorized
+    call instead of one Python call per object.
+
+The module provides vectorized counterparts of the scalar kernel in
+    `pg_object.py`:
+
+1. dot_array: Row-wise dot product of two coordinate arrays.
+2. cross_array: Row-wise cross product of two coordinate arrays.
+3. plckr_array: Row-wise linear combination of two coordinate arrays.
+4. det_array: Row-wise determinant of three coordinate arrays, and
+   coincident_array, which tests an array of triples for collinearity.
+5. perp_array: Row-wise pole or polar for a Cayley-Klein point or line type.
+
+All of them broadcast, so a single (3,) vector (for example the coordinates
+    of a scalar `PgObject`) can be combined with every row of an (N, 3) array.
+
+The scalar kernel is exact because Python ints never overflow. To keep that
+    guarantee while running at native speed, the array kernels bound the bit
+    length of every row before multiplying. Rows whose result provably fits
+    in int64 are computed natively; the remaining rows are recomputed with
+    exact Python ints, and the result is then returned with object dtype.
+
+The `PgPointArray` and `PgLineArray` classes mirror `PgPoint` and `PgLine`:
+    the meet of two point arrays is a line array and vice versa, and indexing
+    an array with an integer gives back the scalar object.
+"""
+
+from typing import (
+    Generic,
+    Iterator,
+    List,
+    Self,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+from weakref import WeakKeyDictionary
+
+import numpy as np
+
+from .pg_object import PgLine, PgObject, PgPoint
+
+Dual = TypeVar("Dual", bound="PgArray")
+
+
+def as_coord_array(coord) -> np.ndarray:
+    """
+    The `as_coord_array` function converts its argument to an integer coordinate array.
+
+    :param coord: an array-like of shape (N, 3) (or (3,)) holding integers
+    :return: a NumPy array with an integer or object dtype.
+    :raises ValueError: The last axis must have length three and the entries must be integers.
+
+    Examples:
+        >>> as_coord_array([[1, 2, 3], [4, 5, 6]]).shape
+        (2, 3)
+        >>> as_coord_array([[2**70, 1, 1]]).dtype
+        dtype('O')
+    """
+    arr = np.asarray(coord)
+    if arr.dtype != object and not np.issubdtype(arr.dtype, np.integer):
+        raise ValueError("coord must be an array of integers")
+    if arr.ndim == 0 or arr.shape[-1] != 3:
+        raise ValueError("coord must be an array of shape (N, 3)")
+    return arr
+
+
+# Magnitude bits available in a signed 64-bit integer.
+INT64_BITS = 63
+
+
+def bit_length_array(arr: np.ndarray) -> np.ndarray:
+    """
+    The `bit_length_array` function bounds the bit length of the magnitude of every entry.
+
+    For integer dtypes the bound is read off the float64 exponent, which may
+    overestimate by one bit but never underestimates. For object arrays the
+    exact `int.bit_length` is used.
+
+    :param arr: an integer or object array
+    :type arr: np.ndarray
+    :return: an int64 array of the same shape.
+
+    Examples:
+        >>> bit_length_array(np.array([0, 1, 255, -256]))
+        array([0, 1, 8, 9])
+        >>> bit_length_array(np.array([2**100], dtype=object))
+        array([101])
+    """
+    if arr.dtype == object:
+        return _bit_length(arr).astype(np.int64)
+    _, exp = np.frexp(np.abs(arr.astype(np.float64)))
+    return exp.astype(np.int64)
+
+
+_bit_length = np.frompyfunc(lambda x: abs(int(x)).bit_length(), 1, 1)
+
+
+def _row_bits(arr: np.ndarray) -> np.ndarray:
+    """Bit-length bound of the largest coordinate of every row."""
+    return bit_length_array(arr).max(axis=-1)
+
+
+def _batched(kernel, safe: np.ndarray, *operands: np.ndarray) -> np.ndarray:
+    """
+    Evaluates `kernel` in int64 on the rows flagged `safe` and on exact Python ints
+    (object dtype) on the remaining rows. The operands must already be broadcast to
+    a common shape whose last axis is the coordinate axis.
+    """
+    if safe.all():
+        return kernel(*(op.astype(np.int64) for op in operands))
+    if not safe.any():
+        return kernel(*(op.astype(object) for op in operands))
+    fast = kernel(*(op[safe].astype(np.int64) for op in operands))
+    exact = kernel(*(op[~safe].astype(object) for op in operands))
+    result = np.empty(safe.shape + fast.shape[1:], dtype=object)
+    result[safe] = fast.astype(object)
+    result[~safe] = exact
+    return result
+
+
+def _dot_kernel(arr_a: np.ndarray, arr_b: np.ndarray) -> np.ndarray:
+    return (
+        arr_a[..., 0] * arr_b[..., 0]
+        + arr_a[..., 1] * arr_b[..., 1]
+        + arr_a[..., 2] * arr_b[..., 2]
+    )
+
+
+def _cross_kernel(arr_a: np.ndarray, arr_b: np.ndarray) -> np.ndarray:
+    return np.stack(
+        [
+            arr_a[..., 1] * arr_b[..., 2] - arr_a[..., 2] * arr_b[..., 1],
+            arr_a[..., 2] * arr_b[..., 0] - arr_a[..., 0] * arr_b[..., 2],
+            arr_a[..., 0] * arr_b[..., 1] - arr_a[..., 1] * arr_b[..., 0],
+        ],
+        axis=-1,
+    )
+
+
+def _plckr_kernel(lam, arr_a, mu, arr_b) -> np.ndarray:
+    return lam * arr_a + mu * arr_b
+
+
+def _det_kernel(arr_a: np.ndarray, arr_b: np.ndarray, arr_c: np.ndarray) -> np.ndarray:
+    return _dot_kernel(arr_a, _cross_kernel(arr_b, arr_c))
+
+
+def dot_array(arr_a: np.ndarray, arr_b: np.ndarray) -> np.ndarray:
+    """
+    The `dot_array` function calculates the row-wise dot product of two coordinate arrays.
+
+    Rows whose result provably fits in int64 are computed natively; the
+    others are recomputed exactly with Python ints, in which case the result
+    has object dtype.
+
+    :param arr_a: an array of shape (N, 3) or (3,)
+    :type arr_a: np.ndarray
+    :param arr_b: an array of shape (N, 3) or (3,)
+    :type arr_b: np.ndarray
+    :return: an array of shape (N,) holding the dot products.
+
+    Examples:
+        >>> dot_array(np.array([[1, 2, 3], [0, 1, 0]]), np.array([4, 5, 6]))
+        array([32,  5])
+        >>> dot_array(np.array([[2**40, 0, 0], [1, 1, 1]]), np.array([2**40, 0, 0]))
+        array([1208925819614629174706176, 1099511627776], dtype=object)
+    """
+    arr_a, arr_b = np.broadcast_arrays(arr_a, arr_b)
+    safe = _row_bits(arr_a) + _row_bits(arr_b) + 2 <= INT64_BITS
+    return _batched(_dot_kernel, safe, arr_a, arr_b)
+
+
+def cross_array(arr_a: np.ndarray, arr_b: np.ndarray) -> np.ndarray:
+    """
+    The `cross_array` function calculates the row-wise cross product of two coordinate arrays.
+
+    Rows whose result provably fits in int64 are computed natively; the
+    others are recomputed exactly with Python ints, in which case the result
+    has object dtype.
+
+    :param arr_a: an array of shape (N, 3) or (3,)
+    :type arr_a: np.ndarray
+    :param arr_b: an array of shape (N, 3) or (3,)
+    :type arr_b: np.ndarray
+    :return: an array of shape (N, 3) holding the cross products.
+
+    Examples:
+        >>> cross_array(np.array([[1, 2, 3], [0, 1, 0]]), np.array([4, 5, 6]))
+        array([[-3,  6, -3],
+               [ 6,  0, -4]])
+        >>> cross_array(np.array([[2**40, 0, 1]]), np.array([0, 2**40, 0]))
+        array([[-1099511627776, 0, 1208925819614629174706176]], dtype=object)
+    """
+    arr_a, arr_b = np.broadcast_arrays(arr_a, arr_b)
+    safe = _row_bits(arr_a) + _row_bits(arr_b) + 1 <= INT64_BITS
+    return _batched(_cross_kernel, safe, arr_a, arr_b)
+
+
+def plckr_array(lambda_, arr_a: np.ndarray, mu_, arr_b: np.ndarray) -> np.ndarray:
+    """Row-wise homogeneous parametrization of points or lines
+
+    Rows whose result provably fits in int64 are computed natively; the
+    others are recomputed exactly with Python ints, in which case the result
+    has object dtype.
+
+    :param `lambda_`: a scalar, or an array of shape (N,) with one coefficient per row of `arr_a`
+    :param arr_a: an array of shape (N, 3) or (3,)
+    :type arr_a: np.ndarray
+    :param `mu_`: a scalar, or an array of shape (N,) with one coefficient per row of `arr_b`
+    :param arr_b: an array of shape (N, 3) or (3,)
+    :type arr_b: np.ndarray
+    :return: an array of shape (N, 3) holding `lambda_ * arr_a + mu_ * arr_b`.
+
+    Examples:
+        >>> plckr_array(np.array([1, 2]), np.array([[1, 2, 3], [1, 0, 0]]), 2, np.array([4, 5, 6]))
+        array([[ 9, 12, 15],
+               [10, 10, 12]])
+    """
+    lam, arr_a, mu, arr_b = np.broadcast_arrays(
+        np.asarray(lambda_)[..., np.newaxis],
+        arr_a,
+        np.asarray(mu_)[..., np.newaxis],
+        arr_b,
+    )
+    bits = np.maximum(
+        _row_bits(lam) + _row_bits(arr_a), _row_bits(mu) + _row_bits(arr_b)
+    )
+    safe = bits + 1 <= INT64_BITS
+    return _batched(_plckr_kernel, safe, lam, arr_a, mu, arr_b)
+
+
+def det_array(arr_a: np.ndarray, arr_b: np.ndarray, arr_c: np.ndarray) -> np.ndarray:
+    """
+    The `det_array` function calculates the row-wise determinant `dot(a, cross(b, c))` of
+    three coordinate arrays.
+
+    Rows whose result provably fits in int64 are computed natively; the
+    others are recomputed exactly with Python ints, in which case the result
+    has object dtype.
+
+    :param arr_a: an array of shape (N, 3) or (3,)
+    :type arr_a: np.ndarray
+    :param arr_b: an array of shape (N, 3) or (3,)
+    :type arr_b: np.ndarray
+    :param arr_c: an array of shape (N, 3) or (3,)
+    :type arr_c: np.ndarray
+    :return: an array of shape (N,) holding the determinants.
+
+    Examples:
+        >>> det_array(np.array([[1, 2, 3], [1, 0, 0]]), np.array([4, 5, 6]), np.array([7, 8, 10]))
+        array([-3,  2])
+    """
+    arr_a, arr_b, arr_c = np.broadcast_arrays(arr_a, arr_b, arr_c)
+    bits = _row_bits(arr_a) + _row_bits(arr_b) + _row_bits(arr_c)
+    safe = bits + 3 <= INT64_BITS
+    return _batched(_det_kernel, safe, arr_a, arr_b, arr_c)
+
+
+def coincident_array(triples: np.ndarray) -> np.ndarray:
+    """
+    The `coincident_array` function checks an array of triples of points for collinearity
+    (or of triples of lines for concurrency).
+
+    :param triples: an integer array of shape (N, 3, 3); `triples[i]` holds the coordinates
+        of the three objects of triple i, one per row
+    :type triples: np.ndarray
+    :return: a boolean array of shape (N,).
+
+    Examples:
+        >>> coincident_array(np.array([[[1, 2, 3], [4, 5, 6], [7, 8, 9]],
+        ...                            [[1, 0, 0], [0, 1, 0], [0, 0, 1]]]))
+        array([ True, False])
+    """
+    triples = np.asarray(triples)
+    if triples.shape[-2:] != (3, 3):
+        raise ValueError("triples must have shape (..., 3, 3)")
+    return det_array(triples[..., 0, :], triples[..., 1, :], triples[..., 2, :]) == 0
+
+
+def outer_dot_array(arr_a: np.ndarray, arr_b: np.ndarray) -> np.ndarray:
+    """
+    The `outer_dot_array` function calculates the dot product of every row of `arr_a` with
+    every row of `arr_b`, i.e. `arr_a @ arr_b.T`.
+
+    Rows of `arr_a` whose products provably fit in int64 go through a native
+    matrix product; the others are recomputed exactly with Python ints, in which
+    case the result has object dtype.
+
+    :param arr_a: an array of shape (M, 3)
+    :type arr_a: np.ndarray
+    :param arr_b: an array of shape (N, 3)
+    :type arr_b: np.ndarray
+    :return: an array of shape (M, N).
+
+    Examples:
+        >>> outer_dot_array(np.array([[1, 2, 3], [1, 0, 0]]), np.array([[4, 5, 6], [1, 1, -1]]))
+        array([[32,  0],
+               [ 4,  1]])
+    """
+    if arr_a.shape[0] == 0 or arr_b.shape[0] == 0:
+        return np.zeros((arr_a.shape[0], arr_b.shape[0]), dtype=np.int64)
+    safe = _row_bits(arr_a) + _row_bits(arr_b).max() + 2 <= INT64_BITS
+    if safe.all():
+        return arr_a.astype(np.int64) @ arr_b.astype(np.int64).T
+    if not safe.any():
+        return arr_a.astype(object) @ arr_b.astype(object).T
+    result = np.empty((arr_a.shape[0], arr_b.shape[0]), dtype=object)
+    result[safe] = (arr_a[safe].astype(np.int64) @ arr_b.astype(np.int64).T).astype(
+        object
+    )
+    result[~safe] = arr_a[~safe].astype(object) @ arr_b.astype(object).T
+    return result
+
+
+# The maps found by `_perp_map`, per class. The classes are weakly referenced, so
+# that classes created on the fly (e.g. by `conic_object.cayley_klein`) can be freed.
+_PERP_MAPS: "WeakKeyDictionary[type, Tuple[bool, np.ndarray]]" = WeakKeyDictionary()
+
+
+def _perp_map(elem_type: type) -> Tuple[bool, np.ndarray]:
+    """
+    Probes `elem_type.perp` once per class and returns (True, M) if it is the linear
+    map `coord @ M`, or (False, c) if it is the constant `c`.
+    """
+    result = _PERP_MAPS.get(elem_type)
+    if result is None:
+        result = _PERP_MAPS[elem_type] = _find_perp_map(elem_type)
+    return result
+
+
+def _find_perp_map(elem_type: type) -> Tuple[bool, np.ndarray]:
+    matrix = getattr(elem_type, "perp_matrix", None)
+    if matrix is not None:
+        # perp is `matrix @ coord`, i.e. `coord @ matrix.T` for a row vector
+        return True, as_coord_array([list(col) for col in zip(*matrix)])
+    # The probes compare exact coordinates, which `auto_normalize` would rescale.
+    owners: List[Type[PgObject]] = [
+        cls
+        for cls in elem_type.__mro__
+        if issubclass(cls, PgObject) and "auto_normalize" in vars(cls)
+    ]
+    saved = [cls.auto_normalize for cls in owners]
+    for cls in owners:
+        cls.auto_normalize = False
+    try:
+        return _probe_perp(elem_type)
+    finally:
+        for cls, flag in zip(owners, saved):
+            cls.auto_normalize = flag
+
+
+def _probe_perp(elem_type: type) -> Tuple[bool, np.ndarray]:
+    """The probes of `_find_perp_map`, run with `auto_normalize` off."""
+    images = np.array(
+        [elem_type(list(row)).perp().coord for row in np.eye(3, dtype=int).tolist()],
+        dtype=object,
+    )
+    probes = ([3, -5, 7], [-2, 11, 4])
+    if all(
+        elem_type(probe).perp().coord
+        == tuple((np.array(probe, object) @ images).tolist())
+        for probe in probes
+    ):
+        return True, as_coord_array(images.tolist())
+    if all(elem_type(probe).perp().coord == tuple(images[0]) for probe in probes) and (
+        (images == images[0]).all()
+    ):
+        return False, as_coord_array(images[0].tolist())
+    raise ValueError(f"{elem_type.__name__}.perp is neither linear nor constant")
+
+
+def perp_array(elem_type: type, arr: np.ndarray) -> np.ndarray:
+    """
+    The `perp_array` function calculates the row-wise pole or polar of points or lines of a
+    Cayley-Klein geometry.
+
+    The `perp` method of `elem_type` is probed once on basis vectors, unless the
+    class gives its `perp_matrix` (see conic_object.py). A linear pole or polar
+    becomes an exact matrix product; a constant one (such as the line at
+    infinity of `PerspPoint`) is broadcast to every row.
+
+    :param elem_type: a point or line class with a `perp` method, e.g. `EllipticPoint`
+    :type elem_type: type
+    :param arr: an array of shape (N, 3)
+    :type arr: np.ndarray
+    :return: an array of shape (N, 3) with the coordinates of the poles or polars.
+    :raises ValueError: `elem_type.perp` is neither linear nor constant.
+
+    Examples:
+        >>> from projgeom.myck_object import MyCKPoint
+        >>> perp_array(MyCKPoint, np.array([[1, 2, 3], [0, 1, 0]]))
+        array([[-2,  2, -6],
+               [ 0,  1,  0]])
+    """
+    linear, mat = _perp_map(elem_type)
+    arr = as_coord_array(arr)
+    if linear:
+        return outer_dot_array(arr, mat.T)
+    return np.broadcast_to(mat, arr.shape).copy()
+
+
+def canonical_array(arr: np.ndarray) -> np.ndarray:
+    """Row-wise canonical representatives of homogeneous vectors
+
+    The `canonical_array` function is the vectorized form of `canonical`: every row
+    is divided by the gcd of its entries and its sign is fixed so that the first
+    non-zero entry is positive. Zero rows are returned unchanged.
+
+    :param arr: an array of shape (N, 3)
+    :type arr: np.ndarray
+    :return: an array of shape (N, 3).
+
+    Examples:
+        >>> canonical_array(np.array([[-6, 4, 10], [0, -7, 0], [0, 0, 0]]))
+        array([[ 3, -2, -5],
+               [ 0,  1,  0],
+               [ 0,  0,  0]])
+    """
+    divisor = np.gcd.reduce(arr, axis=-1)
+    first = np.argmax(arr != 0, axis=-1)[..., np.newaxis]
+    negative = np.take_along_axis(arr, first, axis=-1)[..., 0] < 0
+    divisor = np.where(negative, -divisor, divisor)
+    divisor = np.where(divisor == 0, 1, divisor)
+    return arr // divisor[..., np.newaxis]
+
+
+def to_coord_array(objs) -> np.ndarray:
+    """
+    The `to_coord_array` function returns the (N, 3) coordinate array of a collection of objects.
+
+    :param objs: a `PgArray`, an (N, 3) array-like of integers, or a sequence of `PgObject`
+    :return: an (N, 3) integer or object array.
+
+    Examples:
+        >>> to_coord_array([PgPoint([1, 2, 3]), PgPoint([4, 5, 6])])
+        array([[1, 2, 3],
+               [4, 5, 6]])
+        >>> to_coord_array([]).shape
+        (0, 3)
+    """
+    if isinstance(objs, PgArray):
+        return objs.coord
+    if not isinstance(objs, np.ndarray):
+        objs = [getattr(obj, "coord", obj) for obj in objs]
+        if len(objs) == 0:
+            return np.zeros((0, 3), dtype=np.int64)
+    arr = as_coord_array(objs)
+    if arr.ndim != 2:
+        raise ValueError("coord must be an array of shape (N, 3)")
+    return arr
+
+
+def _coord_of(obj: Union["PgArray", PgObject]) -> np.ndarray:
+    """Coordinates of an array (N, 3) or of a scalar object (3,), as a NumPy array."""
+    if isinstance(obj, PgArray):
+        return obj.coord
+    return as_coord_array(obj.coord)
+
+
+class PgArray(Generic[Dual]):
+    """
+    The `PgArray` class represents N geometric objects of a projective plane with integer coordinates.
+
+    :param coord: The `coord` parameter is an array-like of shape (N, 3) holding the
+        homogeneous coordinates of the objects, one object per row.
+    :raises ValueError: The `coord` parameter must be an (N, 3) array of integers.
+
+    Examples:
+        >>> arr = PgArray([[3, 4, 5], [1, 0, 0]])
+        >>> len(arr)
+        2
+        >>> arr.coord
+        array([[3, 4, 5],
+               [1, 0, 0]])
+    """
+
+    coord: np.ndarray
+
+    def __init__(self, coord) -> None:
+        """
+        The function initializes an array of objects with the given coordinates.
+
+        :param coord: an array-like of shape (N, 3) holding integers
+
+        Examples:
+            >>> PgArray(np.zeros((0, 3), dtype=np.int64)).coord.shape
+            (0, 3)
+        """
+        coord = as_coord_array(coord)
+        if coord.ndim != 2:
+            raise ValueError("coord must be an array of shape (N, 3)")
+        self.coord = coord
+
+    @classmethod
+    def from_objects(cls, objs: Sequence[PgObject]) -> Self:
+        """
+        The `from_objects` function packs a sequence of scalar objects into an array.
+
+        :param objs: a sequence of `PgObject` instances
+        :type objs: Sequence[PgObject]
+        :return: an instance of the array class holding the coordinates of `objs`.
+
+        Examples:
+            >>> pts = PgPointArray.from_objects([PgPoint([1, 2, 3]), PgPoint([4, 5, 6])])
+            >>> pts[1]
+            PgPoint(4 : 5 : 6)
+        """
+        if len(objs) == 0:
+            return cls(np.zeros((0, 3), dtype=np.int64))
+        return cls([list(obj.coord) for obj in objs])
+
+    def to_objects(self) -> List[PgObject]:
+        """
+        The `to_objects` function unpacks the array into a list of scalar objects.
+
+        :return: a list of instances of `elem_type()`.
+
+        Examples:
+            >>> PgLineArray([[1, 2, 3]]).to_objects()
+            [PgLine(1 : 2 : 3)]
+        """
+        Elem = self.elem_type()
+        return [Elem(row) for row in self.coord.tolist()]
+
+    def __len__(self) -> int:
+        return self.coord.shape[0]
+
+    def __iter__(self) -> Iterator[PgObject]:
+        return iter(self.to_objects())
+
+    def __getitem__(self, index):
+        """
+        Integer indices give a scalar object; slices, masks and index arrays give an array.
+
+        Examples:
+            >>> pts = PgPointArray([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+            >>> pts[0]
+            PgPoint(1 : 2 : 3)
+            >>> len(pts[1:])
+            2
+        """
+        if isinstance(index, (int, np.integer)):
+            return self.elem_type()(self.coord[index].tolist())
+        return type(self)(self.coord[index])
+
+    def __repr__(self):
+        """repr(self)"""
+        return f"{self.__class__.__name__}({self.coord.tolist()})"
+
+    def __eq__(self, other) -> np.ndarray:  # type: ignore[override]
+        """
+        The function checks row-wise projective equality, like `PgObject.__eq__` does for one object.
+
+        :param other: an array of the same type, or a scalar object of the element type
+        :return: a boolean array of shape (N,).
+
+        Examples:
+            >>> pts = PgPointArray([[1, 2, 3], [4, 5, 6]])
+            >>> pts == PgPoint([2, 4, 6])
+            array([ True, False])
+        """
+        return ~np.asarray(cross_array(self.coord, _coord_of(other)).any(axis=-1))
+
+    def normalize(self) -> Self:
+        """
+        The `normalize` function returns the same projective objects with canonical coordinates,
+        row by row, like `PgObject.normalize` does for one object.
+
+        Examples:
+            >>> PgPointArray([[-6, 4, 10], [2, 4, 6]]).normalize()
+            PgPointArray([[3, -2, -5], [1, 2, 3]])
+        """
+        return type(self)(canonical_array(self.coord))
+
+    def elem_type(self) -> type:
+        """Returns the type of the scalar objects held by this array."""
+        return PgObject
+
+    def dual_type(self) -> type:
+        """Returns the type of the dual array (PgLineArray for PgPointArray, PgPointArray for PgLineArray).
+
+        :return: The type of the dual array.
+
+        Examples:
+            >>> PgPointArray([[1, 2, 3]]).dual_type()
+            <class 'projgeom.pg_array.PgLineArray'>
+        """
+        return PgLineArray
+
+    def aux(self) -> Dual:
+        """
+        The `aux` function returns the dual array with a copy of the `coord` attribute, so that
+        no row is incident with the corresponding row of `self`.
+
+        Examples:
+            >>> pts = PgPointArray([[1, 2, 3], [0, 0, 1]])
+            >>> pts.incident(pts.aux())
+            array([False, False])
+        """
+        return self.dual_type()(self.coord.copy())
+
+    def dot(self, line) -> np.ndarray:
+        """
+        The `dot` function calculates the row-wise dot product.
+
+        :param line: an array of the dual type, or a scalar object of the dual element type
+        :return: an integer array of shape (N,).
+
+        Examples:
+            >>> PgPointArray([[3, 4, 5], [1, 0, 0]]).dot(PgLine([30, 40, 50]))
+            array([500,  30])
+        """
+        return dot_array(self.coord, _coord_of(line))
+
+    def parametrize(self, lambda_, pt_q, mu_) -> Self:
+        """Row-wise homogeneous parametrization of points or lines
+
+        :param lambda_: a scalar, or an array of shape (N,)
+        :param pt_q: an array of the same type, or a scalar object of the element type
+        :param mu_: a scalar, or an array of shape (N,)
+        :return: an array of the same type holding `lambda_ * self + mu_ * pt_q`.
+
+        Examples:
+            >>> pts = PgPointArray([[1, 2, 3]])
+            >>> pts.parametrize(1, PgPoint([4, 5, 6]), 2)
+            PgPointArray([[9, 12, 15]])
+        """
+        return type(self)(plckr_array(lambda_, self.coord, mu_, _coord_of(pt_q)))
+
+    def incident(self, rhs) -> np.ndarray:
+        """
+        The function checks row-wise incidence.
+
+        :param rhs: an array of the dual type, or a scalar object of the dual element type
+        :return: a boolean array of shape (N,).
+
+        Examples:
+            >>> pts = PgPointArray([[1, 2, 3], [1, 0, 0]])
+            >>> pts.incident(PgLine([1, 1, -1]))
+            array([ True, False])
+        """
+        return self.dot(rhs) == 0
+
+    def coincident(self, pt_q, pt_r) -> np.ndarray:
+        """
+        The function checks row-wise whether three points are collinear (or three lines concurrent).
+
+        :param pt_q: an array of the same type, or a scalar object of the element type
+        :param pt_r: an array of the same type, or a scalar object of the element type
+        :return: a boolean array of shape (N,).
+
+        Examples:
+            >>> pts = PgPointArray([[7, 8, 9], [1, 0, 0]])
+            >>> pts.coincident(PgPoint([1, 2, 3]), PgPoint([4, 5, 6]))
+            array([ True, False])
+        """
+        return det_array(self.coord, _coord_of(pt_q), _coord_of(pt_r)) == 0
+
+    def meet(self, rhs) -> Dual:
+        """
+        The `meet` function performs a row-wise join or meet operation.
+
+        :param rhs: an array of the same type, or a scalar object of the element type
+        :return: an array of the dual type.
+
+        Examples:
+            >>> p1 = PgPointArray([[1, 2, 3], [1, 0, 0]])
+            >>> p1.meet(PgPoint([4, 5, 6]))
+            PgLineArray([[-3, 6, -3], [0, -6, 5]])
+        """
+        return self.dual_type()(cross_array(self.coord, _coord_of(rhs)))
+
+
+class PgPointArray(PgArray["PgLineArray"]):
+    """Array of Projective Geometry Points
+
+    The `PgPointArray` class holds N points of the projective plane; its dual is `PgLineArray`.
+
+    Examples:
+        >>> pts = PgPointArray([[1, 2, 3], [4, 5, 6]])
+        >>> lns = pts.aux()
+        >>> assert isinstance(lns, PgLineArray)
+        >>> assert not pts.incident(lns).any()
+    """
+
+    def elem_type(self) -> type:
+        return PgPoint
+
+    def dual_type(self) -> type:
+        return PgLineArray
+
+
+class PgLineArray(PgArray[PgPointArray]):
+    """Array of Projective Geometry Lines
+
+    The `PgLineArray` class holds N lines of the projective plane; its dual is `PgPointArray`.
+
+    Examples:
+        >>> lns = PgLineArray([[1, 2, 3], [4, 5, 6]])
+        >>> pts = lns.aux()
+        >>> assert isinstance(pts, PgPointArray)
+        >>> assert not lns.incident(pts).any()
+    """
+
+    def elem_type(self) -> type:
+        return PgLine
+
+    def dual_type(self) -> type:
+        return PgPointArray
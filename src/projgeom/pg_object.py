@@ -23,6 +23,8 @@ The code achieves its purpose through several key functions:
 1. dot: Calculates the dot product of two vectors, which is used to check if points lie on lines.
 2. cross: Computes the cross product of two vectors, used to find intersections of lines.
 3. plckr: Performs a linear combination of two vectors, useful for parametrizing points and lines.
+4. det: Computes the determinant of three vectors, used to check if three points are collinear.
+5. canonical: Divides a vector by the gcd of its entries and makes its first non-zero entry positive.
 
 The main logic flow involves creating PgPoint and PgLine objects, then
     using their methods to perform geometric operations. For example, you can
@@ -41,21 +43,23 @@ Overall, this code provides a foundation for working with projective geometry,
     consistent with the mathematical principles of projective spaces.
 """
 
-from typing import List, Self, TypeVar, cast
+from math import gcd
+from operator import attrgetter
+from typing import ClassVar, List, Optional, Self, Sequence, Tuple, TypeVar, cast
 
 from .pg_plane import ProjectivePlane, Value
 
 Dual = TypeVar("Dual", bound="PgObject")
 
 
-def dot(vec_a: List[int], vec_b: List[int]) -> int:
+def dot(vec_a: Sequence[int], vec_b: Sequence[int]) -> int:
     """
     The `dot` function calculates the dot product of two lists of integers.
 
     :param vec_a: a is a list of integers
-    :type vec_a: List[int]
+    :type vec_a: Sequence[int]
     :param vec_b: The parameter `vec_b` is a list of integers
-    :type vec_b: List[int]
+    :type vec_b: Sequence[int]
     :return: The function `dot` returns the dot product of two lists of integers.
 
     .. svgbob::
@@ -72,14 +76,14 @@ def dot(vec_a: List[int], vec_b: List[int]) -> int:
     return vec_a[0] * vec_b[0] + vec_a[1] * vec_b[1] + vec_a[2] * vec_b[2]
 
 
-def cross(vec_a: List[int], vec_b: List[int]) -> List[int]:
+def cross(vec_a: Sequence[int], vec_b: Sequence[int]) -> List[int]:
     """
     The `cross` function calculates the cross product of two vectors.
 
     :param vec_a: a is a list of integers
-    :type vec_a: List[int]
+    :type vec_a: Sequence[int]
     :param vec_b: The parameter `vec_b` is a list of integers
-    :type vec_b: List[int]
+    :type vec_b: Sequence[int]
     :return: The function `cross` returns a list of three integers.
 
     .. svgbob::
@@ -109,19 +113,21 @@ def cross(vec_a: List[int], vec_b: List[int]) -> List[int]:
     ]
 
 
-def plckr(lambda_: int, vec_a: List[int], mu_: int, vec_b: List[int]) -> List[int]:
+def plckr(
+    lambda_: int, vec_a: Sequence[int], mu_: int, vec_b: Sequence[int]
+) -> List[int]:
     """Homogeneous parametrization of point or line
 
     :param `lambda_`: `lambda_` is an integer representing the scalar coefficient for
         the first vector vec_a in the Plucker operation
     :type lambda_: int
     :param vec_a: The parameter `vec_a` is a list of three integers
-    :type vec_a: List[int]
+    :type vec_a: Sequence[int]
     :param `mu_`: The `mu_` parameter represents a scalar value that is used in the
         Plucker operation
     :type mu_: int
     :param vec_b: The parameter `vec_b` is a list of integers
-    :type vec_b: List[int]
+    :type vec_b: Sequence[int]
     :return: The `plckr` function returns a list of three integers.
 
     Examples:
@@ -137,48 +143,178 @@ def plckr(lambda_: int, vec_a: List[int], mu_: int, vec_b: List[int]) -> List[in
     ]
 
 
+def det(vec_a: Sequence[int], vec_b: Sequence[int], vec_c: Sequence[int]) -> int:
+    """
+    The `det` function calculates the determinant of the 3x3 matrix with rows `vec_a`, `vec_b`
+    and `vec_c`, i.e. `dot(vec_a, cross(vec_b, vec_c))`, without building the cross product.
+
+    :param vec_a: The parameter `vec_a` is a sequence of three integers
+    :type vec_a: Sequence[int]
+    :param vec_b: The parameter `vec_b` is a sequence of three integers
+    :type vec_b: Sequence[int]
+    :param vec_c: The parameter `vec_c` is a sequence of three integers
+    :type vec_c: Sequence[int]
+    :return: The function `det` returns an integer.
+
+    Examples:
+        >>> det([1, 2, 3], [4, 5, 6], [7, 8, 10])
+        -3
+        >>> det([1, 2, 3], [4, 5, 6], [7, 8, 9])
+        0
+    """
+    b_0, b_1, b_2 = vec_b
+    c_0, c_1, c_2 = vec_c
+    return (
+        vec_a[0] * (b_1 * c_2 - b_2 * c_1)
+        + vec_a[1] * (b_2 * c_0 - b_0 * c_2)
+        + vec_a[2] * (b_0 * c_1 - b_1 * c_0)
+    )
+
+
+def canonical(vec: Sequence[int]) -> List[int]:
+    """Canonical representative of a homogeneous vector
+
+    The `canonical` function divides the vector by the gcd of its entries and
+    fixes the sign so that the first non-zero entry is positive. Two non-zero
+    vectors represent the same projective object if and only if their
+    canonical forms are equal.
+
+    :param vec: The parameter `vec` is a sequence of three integers
+    :type vec: Sequence[int]
+    :return: The function `canonical` returns a list of three integers. The zero vector is returned unchanged.
+
+    Examples:
+        >>> canonical([-6, 4, 10])
+        [3, -2, -5]
+        >>> canonical([0, -7, 0])
+        [0, 1, 0]
+        >>> canonical([0, 0, 0])
+        [0, 0, 0]
+    """
+    divisor = gcd(vec[0], vec[1], vec[2])
+    if divisor == 0:
+        return list(vec)
+    if vec[0] < 0 or (vec[0] == 0 and (vec[1] < 0 or (vec[1] == 0 and vec[2] < 0))):
+        divisor = -divisor
+    return [vec[0] // divisor, vec[1] // divisor, vec[2] // divisor]
+
+
 # The `PgObject` class represents a geometric object in a projective plane with integer coordinates.
 class PgObject(ProjectivePlane[Dual, int]):
     """
     The `PgObject` class represents a geometric object in a projective plane with integer coordinates.
 
-    :param coord: The `coord` parameter represents a list of three integers that represent the
-        coordinates of the geometric object.
-    :type coord: List[int]
-    :raises ValueError: The `coord` parameter must be a list of three integers.
+    :param coord: The `coord` parameter represents a sequence of three integers that represent the
+        coordinates of the geometric object. They are stored as an immutable tuple.
+    :type coord: Sequence[int]
+    :raises ValueError: The `coord` parameter must be a sequence of three integers.
+
+    Instances are slotted: they carry no per-instance `__dict__`, only the coordinate
+    tuple and the cached canonical key. Subclasses declare an empty `__slots__` to
+    keep it that way. `coord` is a read-only property, so the cached key can never
+    go stale.
 
     Examples:
         >>> pt_p = PgObject([3, 4, 5])
         >>> pt_p.coord
-        [3, 4, 5]
+        (3, 4, 5)
+
+    Setting `auto_normalize` to True makes every constructor store the canonical
+    form of its coordinates, so that chained constructions stay in small integers.
+    It can be set on `PgObject` for all geometries or on a point class and its
+    dual line class only.
+
+        >>> PgObject.auto_normalize = True
+        >>> PgObject([30, -40, 50]).coord
+        (3, -4, 5)
+        >>> PgObject.auto_normalize = False
     """
 
-    coord: List[int]
+    __slots__ = ("_coord", "_key")
+
+    _coord: Tuple[int, ...]
+    auto_normalize: ClassVar[bool] = False
+    _key: Optional[Tuple[int, int, int]]
 
     # impl PgObject:
 
-    def __init__(self, coord: List[int]) -> None:
+    def __init__(self, coord: Sequence[int]) -> None:
         """
         The function initializes an object with a given coordinate.
 
-        :param coord: The `coord` parameter is a list of integers that represents the coordinates of a
+        :param coord: The `coord` parameter is a sequence of integers that represents the coordinates of a
             point in a three-dimensional space
-        :type coord: List[int]
+        :type coord: Sequence[int]
 
         Examples:
             >>> pt_p = PgObject([3, 4, 5])
             >>> pt_p.coord
-            [3, 4, 5]
+            (3, 4, 5)
         """
+        if type(coord) is not tuple:
+            coord = tuple(coord)
         if len(coord) != 3:
-            raise ValueError("coord must be a list of three integers")
-        self.coord = coord
+            raise ValueError("coord must be a sequence of three integers")
+        if self.auto_normalize:
+            coord = tuple(canonical(coord))
+        self._coord = coord
+        self._key = None
+
+    coord = property(
+        attrgetter("_coord"),
+        doc="""The homogeneous coordinates, as a tuple of three integers (read-only).
+
+        Examples:
+            >>> pt_p = PgObject([3, 4, 5])
+            >>> pt_p.coord = (1, 2, 3)  # doctest: +IGNORE_EXCEPTION_DETAIL
+            Traceback (most recent call last):
+                ...
+            AttributeError: property 'coord' has no setter
+        """,
+    )
+
+    def canonical_key(self) -> Tuple[int, int, int]:
+        """
+        The `canonical_key` function returns the canonical coordinates as a tuple. It is computed
+        once and cached on the instance, and it is what `__hash__` is based on.
+
+        :return: a tuple of three integers that is the same for all representatives of the object.
+        :raises ValueError: the coordinates are all zero, so there is no projective object.
+
+        Examples:
+            >>> PgObject([30, -40, 50]).canonical_key()
+            (3, -4, 5)
+            >>> PgObject([-3, 4, -5]).canonical_key()
+            (3, -4, 5)
+        """
+        key = self._key
+        if key is None:
+            key = cast(Tuple[int, int, int], tuple(canonical(self._coord)))
+            if key == (0, 0, 0):
+                raise ValueError("the zero vector has no canonical key")
+            self._key = key
+        return key
+
+    def normalize(self) -> Self:
+        """
+        The `normalize` function returns the same projective object with canonical coordinates:
+        divided by the gcd of the three coordinates, with the first non-zero coordinate positive.
+
+        :return: a new object of the same type.
+
+        Examples:
+            >>> from projgeom.pg_object import PgPoint
+            >>> PgPoint([-6, 4, 10]).normalize()
+            PgPoint(3 : -2 : -5)
+        """
+        key = self._key
+        return type(self)(key if key is not None else tuple(canonical(self._coord)))
 
     # impl PartialEq for PgObject:
 
     def __repr__(self):
         """repr(self)"""
-        return f"{self.__class__.__name__}({self.coord[0]} : {self.coord[1]} : {self.coord[2]})"
+        return f"{self.__class__.__name__}({self._coord[0]} : {self._coord[1]} : {self._coord[2]})"
 
     def __str__(self):
         """[summary]
@@ -191,15 +327,22 @@ class PgObject(ProjectivePlane[Dual, int]):
             >>> print(pt_p)
             (3 : 4 : 5)
         """
-        return f"({self.coord[0]} : {self.coord[1]} : {self.coord[2]})"
+        return f"({self._coord[0]} : {self._coord[1]} : {self._coord[2]})"
 
     def __eq__(self, other) -> bool:
         """
-        The function checks if two PgObject instances are equal by comparing their coordinates.
+        The function checks if two PgObject instances are equal, i.e. if their coordinates are
+        proportional.
+
+        If both canonical keys are cached already (e.g. after hashing), they are compared;
+        otherwise the cross product test is used, so that a one-off comparison does not
+        pay for two gcd reductions.
 
         :param other: The `other` parameter is of type `PgObject`
-        :return: The `__eq__` method is returning a boolean value. It returns `True` if the `coord`
-            attribute of `self` and `other` are equal, and `False` otherwise.
+        :return: The `__eq__` method is returning a boolean value. It returns `True` if the
+            coordinates of `self` and `other` are proportional, and `False` otherwise. As with
+            the cross product test, the zero vector compares equal to every object; it cannot
+            be hashed, so it must not be put in a set or used as a dict key.
 
         Examples:
            >>> pt_p = PgObject([3, 4, 5])
@@ -209,7 +352,44 @@ class PgObject(ProjectivePlane[Dual, int]):
         """
         if type(self) is not type(other):
             return False
-        return cross(self.coord, other.coord) == [0, 0, 0]
+        key = self._key
+        if key is not None:
+            other_key = other._key
+            if other_key is not None:
+                return key == other_key
+        vec_a, vec_b = self._coord, other._coord
+        return (
+            vec_a[1] * vec_b[2] == vec_a[2] * vec_b[1]
+            and vec_a[2] * vec_b[0] == vec_a[0] * vec_b[2]
+            and vec_a[0] * vec_b[1] == vec_a[1] * vec_b[0]
+        )
+
+    def __hash__(self) -> int:
+        """
+        The function hashes the canonical key, so that projectively equal objects of the same
+        type land in the same bucket of a set or dict.
+
+        :raises ValueError: the coordinates are all zero.
+
+        Examples:
+           >>> pts = {PgObject([3, 4, 5]), PgObject([-6, -8, -10]), PgObject([1, 0, 0])}
+           >>> len(pts)
+           2
+        """
+        return hash(self.canonical_key())
+
+    def __reduce__(self):
+        """
+        The function pickles the object as its class and coordinate tuple only, leaving out
+        the cached canonical key.
+
+        Examples:
+           >>> import pickle
+           >>> from projgeom.pg_object import PgPoint
+           >>> pickle.loads(pickle.dumps(PgPoint([3, 4, 5])))
+           PgPoint(3 : 4 : 5)
+        """
+        return (type(self), (self._coord,))
 
     # impl ProjectivePlane<PgLine, int> for PgObject:
 
@@ -231,11 +411,11 @@ class PgObject(ProjectivePlane[Dual, int]):
 
     def aux(self) -> Dual:
         """
-        The `aux` function returns a `Dual` object with a copy of the `coord` attribute.
+        The `aux` function returns a `Dual` object with the same coordinates.
         :return: The `aux` function is returning a `Dual` object.
         """
-        # Line = self.dual_type()
-        return self.dual_type()(self.coord.copy())
+        # The coordinate tuple is immutable, so it can be shared without a copy.
+        return self.dual_type()(self._coord)
 
     def dot(self, line) -> int:
         """
@@ -250,7 +430,7 @@ class PgObject(ProjectivePlane[Dual, int]):
             >>> pt_p.dot(ln_l)
             500
         """
-        return dot(self.coord, line.coord)
+        return dot(self._coord, line._coord)
 
     def parametrize(self, lambda_: Value, pt_q: Self, mu_: Value) -> Self:
         """Homogeneous parametrization of point or line
@@ -270,9 +450,9 @@ class PgObject(ProjectivePlane[Dual, int]):
             True
         """
         Point = type(self)
-        # Cast pt_q to PgObject[Dual] to access .coord
+        # Cast pt_q to PgObject[Dual] to access ._coord
         pg_q = cast("PgObject[Dual]", pt_q)
-        return Point(plckr(lambda_, self.coord, mu_, pg_q.coord))
+        return Point(plckr(lambda_, self._coord, mu_, pg_q._coord))
 
     # impl ProjectivePlanePrimitive<PgLine> for PgObject:
 
@@ -290,7 +470,25 @@ class PgObject(ProjectivePlane[Dual, int]):
             >>> pt_p.incident(ln_l)
             False
         """
-        return dot(self.coord, rhs.coord) == 0
+        return dot(self._coord, rhs._coord) == 0
+
+    def coincident(self, pt_q: Self, pt_r: Self) -> bool:
+        """
+        The function checks if three points are collinear (or three lines concurrent) by
+        testing whether the determinant of their coordinates vanishes.
+
+        :param pt_q: The parameter `pt_q` is an object of the same type
+        :type pt_q: Self
+        :param pt_r: The parameter `pt_r` is an object of the same type
+        :type pt_r: Self
+        :return: a boolean value.
+
+        Examples:
+            >>> from projgeom.pg_object import PgPoint
+            >>> PgPoint([1, 2, 3]).coincident(PgPoint([4, 5, 6]), PgPoint([7, 8, 9]))
+            True
+        """
+        return det(self._coord, pt_q._coord, pt_r._coord) == 0
 
     def meet(self, rhs: Self) -> Dual:
         """
@@ -308,9 +506,9 @@ class PgObject(ProjectivePlane[Dual, int]):
             >>> p1.meet(p2)
             PgLine(-3 : 6 : -3)
         """
-        # Cast rhs to PgObject[Dual] to access .coord
+        # Cast rhs to PgObject[Dual] to access ._coord
         pg_rhs = cast("PgObject[Dual]", rhs)
-        return self.dual_type()(cross(self.coord, pg_rhs.coord))
+        return self.dual_type()(cross(self._coord, pg_rhs._coord))
 
 
 class PgPoint(PgObject["PgLine"]):
@@ -330,6 +528,8 @@ class PgPoint(PgObject["PgLine"]):
           \\ /
     """
 
+    __slots__ = ()
+
     def dual_type(self) -> type:
         """
         The `dual` function returns the type `PgLine`.
@@ -362,5 +562,7 @@ class PgLine(PgObject[PgPoint]):
         >>> assert not ln_l.incident(pt_p)
     """
 
+    __slots__ = ()
+
     def dual_type(self) -> type:
         return PgPoint
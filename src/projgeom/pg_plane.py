@@ -20,11 +20,14 @@ The class defines several abstract methods that need to be implemented by any co
 - parametrize(): Creates a new object on the line through two given points
 - incident(): Checks if two objects are incident (i.e., if a point lies on a line)
 
+and a default coincident() method built from meet() and incident().
+
 The code also defines several standalone functions that work with ProjectivePlane objects:
 
 1. check_axiom(): Verifies basic properties of projective geometry, such as the commutativity of equality and incidence.
 
-2. coincident(): Checks if three points are collinear (lie on the same line).
+2. coincident(): Checks if three points are collinear (lie on the same line). It dispatches to
+   the `coincident()` method, which concrete classes implement as a determinant test.
 
 3. check_pappus(): Implements Pappus's hexagon theorem, which is a fundamental theorem in projective geometry.
 
@@ -67,6 +70,8 @@ class ProjectivePlane(Generic[Dual, Value]):
     represents the object implementing the trait.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def dual_type(self) -> type:
         """Returns the dual of this point or line."""
@@ -96,31 +101,20 @@ class ProjectivePlane(Generic[Dual, Value]):
         """Check if two objects are incident"""
         return self.dot(line) == 0
 
-    # def coincident(
-    #     self, pt_q: "ProjectivePlane[Dual, Value]", pt_r: "ProjectivePlane[Dual, Value]"
-    # ) -> bool:
-    #     r"""
-    #     The `coincident` function checks if three points `pt_p`, `pt_q`, and `pt_r` are collinear.
-
-    #     :param pt_q: pt_q is an instance of the class ProjectivePlanePrimitive<Point>
-    #     :type pt_q: "ProjectivePlane[Dual, Value]"
-    #     :param pt_r: The parameter `pt_r` is of type `ProjectivePlanePrimitive<Point>`
-    #     :type pt_r: "ProjectivePlane[Dual, Value]"
-    #     :return: A boolean value is being returned.
-
-    #     .. svgbob::
-    #        :align: center
-
-    #              |  /
-    #            \ | /       coincidence
-    #             \|/
-    #              o      -----o------o---o---
-    #             /|\           A      B   C
-    #            / | \
-    #           l  |  \
-    #              m   n
-    #     """
-    #     return self.meet(pt_q).incident(pt_r)
+    def coincident(self, pt_q: Self, pt_r: Self) -> bool:
+        r"""
+        The `coincident` function checks if three points `self`, `pt_q`, and `pt_r` are collinear
+        (or, dually, if three lines are concurrent).
+
+        Subclasses with coordinates override it with a direct determinant test.
+
+        :param pt_q: pt_q is an object of the same type
+        :type pt_q: Self
+        :param pt_r: The parameter `pt_r` is an object of the same type
+        :type pt_r: Self
+        :return: A boolean value is being returned.
+        """
+        return self.meet(pt_q).incident(pt_r)
 
     # def harm_conj(
     #     self, pt_a: "ProjectivePlane[Dual, Value]", pt_b: "ProjectivePlane[Dual, Value]"
@@ -193,7 +187,7 @@ def coincident(pt_p: Point, pt_q: Point, pt_r: Point) -> bool:
         >>> coincident(PgPoint([0, 1, 0]), PgPoint([0, 0, 1]), PgPoint([1, 0, 0]))
         False
     """
-    return pt_p.meet(pt_q).incident(pt_r)
+    return pt_p.coincident(pt_q, pt_r)
 
 
 def check_pappus(coline1: List[Point], coline2: List[Point]) -> bool:
@@ -0,0 +1,332 @@
+"""
+Streaming Pipelines (pipeline.py)
+
+This code processes streams of points or lines that are too large to hold in
+    memory, such as "read all points, meet each with a fixed line, take the
+    pole, keep those incident with a given line, write them out".
+
+A `Pipeline` is a lazily evaluated chain of stages over a stream of chunks.
+    A chunk is the (N, 3) coordinate array of N objects together with their
+    type, for example `HyperbolicPoint`. Every stage works on a whole chunk
+    at once with the batched kernels of `pg_array.py`, so the cost per object
+    is close to that of the kernels and not that of a Python method call.
+    Nothing is computed until the pipeline is iterated, and only one chunk
+    per stage is alive at any time, so the memory use does not depend on the
+    length of the stream.
+
+Examples:
+    >>> from projgeom.hyp_object import HyperbolicLine, HyperbolicPoint
+    >>> pts = (HyperbolicPoint([i, 1, 2]) for i in range(10))
+    >>> pipe = (
+    ...     Pipeline.from_objects(pts, chunk_size=4)
+    ...     .meet(HyperbolicPoint([0, 0, 1]))
+    ...     .perp()
+    ...     .filter_incident(HyperbolicLine([1, 1, 0]))
+    ... )
+    >>> list(pipe.objects())
+    [HyperbolicPoint(1 : -1 : 0)]
+
+A pipeline is an iterator: it can be consumed only once.
+"""
+
+import os
+import uuid
+from itertools import islice
+from typing import Callable, Iterable, Iterator, NamedTuple, Optional
+
+import numpy as np
+
+from .ff_object import FfObject
+from .pg_array import (
+    as_coord_array,
+    bit_length_array,
+    canonical_array,
+    cross_array,
+    dot_array,
+    perp_array,
+    plckr_array,
+    to_coord_array,
+)
+from .pg_object import PgObject
+from .serialize import coord_width, encode, pack_header
+
+# Default number of objects per chunk.
+CHUNK_SIZE = 4096
+
+
+class Chunk(NamedTuple):
+    """N objects of one type, as their type and an (N, 3) coordinate array."""
+
+    elem_type: type
+    coord: np.ndarray
+
+
+def _dual(elem_type: type) -> type:
+    # Cached on the class itself rather than in a global cache, so that classes
+    # created on the fly (e.g. by `conic_object.cayley_klein`) can be freed.
+    dual = vars(elem_type).get("_pipeline_dual")
+    if dual is None:
+        dual = elem_type([0, 0, 1]).dual_type()
+        setattr(elem_type, "_pipeline_dual", dual)
+    return dual
+
+
+def _check_type(elem_type: type) -> type:
+    if not issubclass(elem_type, PgObject) or issubclass(elem_type, FfObject):
+        raise TypeError(f"{elem_type.__name__} objects cannot be streamed")
+    return elem_type
+
+
+class Pipeline:
+    """
+    The `Pipeline` class represents a lazily evaluated stream of chunks.
+
+    A pipeline is created with `from_objects`, `from_coords` or `from_store`.
+    The stage methods (`meet`, `aux`, `perp`, `parametrize`, `normalize`,
+    `map`, `filter`, `filter_incident`) return a new pipeline and compute
+    nothing. Iterating over a pipeline yields its chunks; `objects`, `count`
+    and `save` consume it.
+
+    :param chunks: an iterable of `Chunk`
+    :type chunks: Iterable[Chunk]
+    """
+
+    def __init__(self, chunks: Iterable[Chunk]) -> None:
+        self._chunks = iter(chunks)
+
+    def __iter__(self) -> Iterator[Chunk]:
+        return self._chunks
+
+    # sources
+
+    @classmethod
+    def from_objects(
+        cls, objs: Iterable[PgObject], chunk_size: int = CHUNK_SIZE
+    ) -> "Pipeline":
+        """
+        The `from_objects` function streams objects of one type in chunks of `chunk_size`.
+
+        :param objs: an iterable of objects of the same type, e.g. a generator
+        :type objs: Iterable[PgObject]
+        :param chunk_size: the number of objects per chunk
+        :type chunk_size: int
+        :return: a pipeline over the objects.
+        :raises TypeError: the objects are not all of the same type.
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be positive")
+
+        def chunks() -> Iterator[Chunk]:
+            iterator = iter(objs)
+            while batch := list(islice(iterator, chunk_size)):
+                elem_type = _check_type(type(batch[0]))
+                if any(type(obj) is not elem_type for obj in batch):
+                    raise TypeError("all objects must be of the same type")
+                yield Chunk(elem_type, to_coord_array(batch))
+
+        return cls(chunks())
+
+    @classmethod
+    def from_coords(cls, elem_type: type, coords: Iterable) -> "Pipeline":
+        """
+        The `from_coords` function streams coordinate arrays as objects of `elem_type`.
+
+        :param elem_type: the type of the objects, e.g. `PgPoint`
+        :type elem_type: type
+        :param coords: an iterable of (N, 3) integer arrays, one per chunk
+        :type coords: Iterable
+        :return: a pipeline over the objects.
+
+        Examples:
+            >>> import numpy as np
+            >>> from projgeom.pg_object import PgPoint
+            >>> chunks = (np.array([[i, 1, 0], [i, 0, 1]]) for i in range(3))
+            >>> Pipeline.from_coords(PgPoint, chunks).count()
+            6
+        """
+        _check_type(elem_type)
+        return cls(Chunk(elem_type, as_coord_array(coord)) for coord in coords)
+
+    @classmethod
+    def from_store(cls, store, chunk_size: int = CHUNK_SIZE) -> "Pipeline":
+        """
+        The `from_store` function streams the objects of a `MappedStore` in chunks of `chunk_size`.
+
+        :param store: an open `projgeom.store.MappedStore`
+        :param chunk_size: the number of objects per chunk
+        :type chunk_size: int
+        :return: a pipeline over the objects; only one chunk is read at a time.
+        """
+        _check_type(store.elem_type)
+        starts = range(0, len(store), chunk_size)
+        return cls(
+            Chunk(store.elem_type, store.coords(slice(start, start + chunk_size)))
+            for start in starts
+        )
+
+    # stages
+
+    def map(self, func: Callable, elem_type: Optional[type] = None) -> "Pipeline":
+        """
+        The `map` function applies a function to the coordinate array of every chunk.
+
+        :param func: a function from an (N, 3) array to an (N, 3) array
+        :type func: Callable
+        :param elem_type: the type of the resulting objects; unchanged by default
+        :type elem_type: Optional[type]
+        :return: a new pipeline.
+        """
+        return Pipeline(
+            Chunk(elem_type or chunk.elem_type, func(chunk.coord)) for chunk in self
+        )
+
+    def meet(self, obj: PgObject) -> "Pipeline":
+        """
+        The `meet` function joins every point with a fixed point, or intersects every line
+        with a fixed line.
+
+        :param obj: a fixed object of the same type as the stream
+        :type obj: PgObject
+        :return: a new pipeline over the dual objects.
+        """
+        coord = as_coord_array(obj.coord)
+        return Pipeline(
+            Chunk(_dual(chunk.elem_type), cross_array(chunk.coord, coord))
+            for chunk in self
+        )
+
+    def aux(self) -> "Pipeline":
+        """The `aux` function turns every object into the dual object with the same coordinates."""
+        return Pipeline(Chunk(_dual(chunk.elem_type), chunk.coord) for chunk in self)
+
+    def perp(self) -> "Pipeline":
+        """The `perp` function takes the pole or polar of every object of a Cayley-Klein geometry."""
+        return Pipeline(
+            Chunk(_dual(chunk.elem_type), perp_array(chunk.elem_type, chunk.coord))
+            for chunk in self
+        )
+
+    def parametrize(self, lambda_: int, obj: PgObject, mu_: int) -> "Pipeline":
+        """
+        The `parametrize` function replaces every object `p` with `lambda_ * p + mu_ * obj`.
+
+        :param lambda_: the coefficient of the streamed objects
+        :type lambda_: int
+        :param obj: a fixed object of the same type as the stream
+        :type obj: PgObject
+        :param mu_: the coefficient of `obj`
+        :type mu_: int
+        :return: a new pipeline.
+        """
+        coord = as_coord_array(obj.coord)
+        return self.map(lambda arr: plckr_array(lambda_, arr, mu_, coord))
+
+    def normalize(self) -> "Pipeline":
+        """The `normalize` function brings every object to its canonical coordinates."""
+        return self.map(canonical_array)
+
+    def filter(self, predicate: Callable) -> "Pipeline":
+        """
+        The `filter` function keeps the objects for which a vectorized predicate holds.
+
+        :param predicate: a function from an (N, 3) array to a boolean array of length N
+        :type predicate: Callable
+        :return: a new pipeline. Chunks that become empty are dropped.
+        """
+
+        def chunks() -> Iterator[Chunk]:
+            for chunk in self:
+                mask = np.asarray(predicate(chunk.coord), dtype=bool)
+                if mask.any():
+                    yield Chunk(chunk.elem_type, chunk.coord[mask])
+
+        return Pipeline(chunks())
+
+    def filter_incident(self, obj: PgObject, keep: bool = True) -> "Pipeline":
+        """
+        The `filter_incident` function keeps the objects incident with a fixed object.
+
+        :param obj: a fixed object of the dual type
+        :type obj: PgObject
+        :param keep: if False, keep the objects that are not incident instead
+        :type keep: bool
+        :return: a new pipeline.
+        """
+        coord = as_coord_array(obj.coord)
+        return self.filter(lambda arr: (dot_array(arr, coord) == 0) == keep)
+
+    # sinks
+
+    def objects(self) -> Iterator[PgObject]:
+        """
+        The `objects` function consumes the pipeline and yields its objects one by one.
+        """
+        for chunk in self:
+            cls = chunk.elem_type
+            yield from (cls(row) for row in chunk.coord.tolist())
+
+    def count(self) -> int:
+        """The `count` function consumes the pipeline and returns the number of objects."""
+        return sum(len(chunk.coord) for chunk in self)
+
+    def save(self, path, width: int = 8, elem_type: Optional[type] = None) -> int:
+        """
+        The `save` function consumes the pipeline and writes its objects to a store file.
+
+        The file can be opened with `projgeom.store.MappedStore`. As the stream
+        is written chunk by chunk, the coordinate width must be chosen up front.
+        The objects are written to a temporary file next to `path`, which replaces
+        `path` only when the whole stream has been written: if an error occurs,
+        `path` is left as it was.
+
+        :param path: the file to write
+        :param width: the number of bytes per coordinate
+        :type width: int
+        :param elem_type: the type of the objects; required only if the stream is empty,
+            which then gives a valid store file without objects
+        :type elem_type: Optional[type]
+        :return: the number of objects written.
+        :raises ValueError: a coordinate does not fit in `width` bytes, the stream
+            contains objects of different types (or not of `elem_type`), or the stream
+            is empty and `elem_type` is not given.
+
+        Examples:
+            >>> import os, tempfile
+            >>> from projgeom.pg_object import PgLine
+            >>> from projgeom.store import MappedStore
+            >>> path = os.path.join(tempfile.mkdtemp(), "lines.pgb")
+            >>> Pipeline.from_objects([PgLine([1, 2, 3])] * 5).aux().save(path)
+            5
+            >>> with MappedStore(path) as store:
+            ...     store[4]
+            PgPoint(1 : 2 : 3)
+        """
+        count = 0
+        # Created like open(path, "wb") would create `path`, i.e. with the umask applied.
+        tmp_path = f"{os.fspath(path)}.{uuid.uuid4().hex[:12]}.tmp"
+        flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+        fd = os.open(tmp_path, flags, 0o666)
+        try:
+            with os.fdopen(fd, "wb") as file:
+                if elem_type is not None:
+                    file.write(pack_header(elem_type, 0, width, 0))
+                for chunk in self:
+                    if elem_type is None:
+                        elem_type = chunk.elem_type
+                        file.write(pack_header(elem_type, 0, width, 0))
+                    elif chunk.elem_type is not elem_type:
+                        raise ValueError("all objects must be of the same type")
+                    bits = int(bit_length_array(chunk.coord).max(initial=0))
+                    if coord_width(bits) > width:
+                        raise ValueError(f"coordinates do not fit in {width} bytes")
+                    file.write(encode(chunk.coord.ravel(), width))
+                    count += len(chunk.coord)
+                if elem_type is None:
+                    raise ValueError("elem_type is required for an empty stream")
+                file.seek(0)
+                file.write(pack_header(elem_type, 0, width, count))
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return count
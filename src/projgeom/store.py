@@ -0,0 +1,209 @@
+"""
+Memory-Mapped Store (store.py)
+
+This code writes large collections of points or lines to a binary file and
+    reads them back through a memory map, so that a file of several
+    gigabytes opens instantly and only the rows that are actually used are
+    read from disk.
+
+The file format is the packed batch format of `serialize.py`: a short
+    header naming the class of the objects (and hence the geometry and
+    whether they are points or lines), the modulus for finite field
+    objects, the width of a coordinate in bytes and the number of objects,
+    followed by all coordinates as little-endian signed integers of that
+    width. A file written by `save` can therefore also be read with
+    `serialize.unpack`, and vice versa.
+
+Coordinates of 1, 2, 4 or 8 bytes are mapped directly as an (N, 3) NumPy
+    integer array, which can be sliced and passed on to the array kernels of
+    `pg_array.py` without a copy. Wider coordinates (big integers) are
+    mapped as raw bytes and decoded to exact Python ints only for the rows
+    that are requested.
+"""
+
+import os
+from typing import Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .ff_object import FfObject, check_modulus
+from .pg_array import bit_length_array, to_coord_array
+from .pg_object import PgObject
+from .serialize import coord_width, decode, encode, pack, pack_header, read_header
+
+# Number of rows encoded or decoded per step when streaming.
+CHUNK_ROWS = 1 << 16
+
+# Upper bound on the header size: a 65535-byte tag and a 65535-byte modulus.
+_MAX_HEADER = 17 + 2 * 65535
+
+PathLike = Union[str, os.PathLike]
+
+
+def save(path: PathLike, objs: Sequence[PgObject], elem_type: Optional[type] = None):
+    """
+    The `save` function writes a sequence of objects of one type to a file.
+
+    :param path: the file to write
+    :param objs: a sequence of objects of the same registered type
+    :type objs: Sequence[PgObject]
+    :param elem_type: the type of the objects; required only if `objs` is empty
+    :type elem_type: Optional[type]
+
+    Examples:
+        >>> import os, tempfile
+        >>> from projgeom.hyp_object import HyperbolicLine
+        >>> path = os.path.join(tempfile.mkdtemp(), "lines.pgb")
+        >>> save(path, [HyperbolicLine([1, 2, 3]), HyperbolicLine([4, 5, -6])])
+        >>> with MappedStore(path) as store:
+        ...     store.elem_type.__name__, len(store), store[1]
+        ('HyperbolicLine', 2, HyperbolicLine(4 : 5 : -6))
+    """
+    data = pack(objs, elem_type)
+    with open(path, "wb") as file:
+        file.write(data)
+
+
+def save_coords(path: PathLike, elem_type: type, coord, modulus: int = 0):
+    """
+    The `save_coords` function writes an (N, 3) coordinate array to a file as objects of `elem_type`.
+
+    The array is written in chunks, so no packed copy of the whole collection is
+    made in memory.
+
+    :param path: the file to write
+    :param elem_type: the registered type of the objects
+    :type elem_type: type
+    :param coord: an (N, 3) array-like of integers, or a `PgArray`
+    :param modulus: the modulus of finite field objects, 0 otherwise
+    :type modulus: int
+    :raises TypeError: `elem_type` is not registered (see `serialize.register`); the
+        file is then not created.
+    :raises ValueError: `elem_type` is a finite field type and `modulus` is not a prime;
+        the file is then not created.
+
+    Examples:
+        >>> import os, tempfile
+        >>> import numpy as np
+        >>> from projgeom.pg_object import PgPoint
+        >>> path = os.path.join(tempfile.mkdtemp(), "points.pgb")
+        >>> save_coords(path, PgPoint, np.arange(12).reshape(4, 3))
+        >>> with MappedStore(path) as store:
+        ...     store.width, store.coords(slice(1, 3)).tolist()
+        (1, [[3, 4, 5], [6, 7, 8]])
+    """
+    if issubclass(elem_type, FfObject):
+        check_modulus(modulus)
+    coord = to_coord_array(coord)
+    bits = int(bit_length_array(coord).max()) if coord.size else 0
+    width = coord_width(bits)
+    header = pack_header(elem_type, modulus, width, len(coord))
+    with open(path, "wb") as file:
+        file.write(header)
+        for start in range(0, len(coord), CHUNK_ROWS):
+            file.write(encode(coord[start : start + CHUNK_ROWS].ravel(), width))
+
+
+class MappedStore:
+    """
+    The `MappedStore` class gives read-only access to a file written by `save` or `save_coords`.
+
+    Opening a store reads only the header; the coordinates are memory-mapped.
+    Indexing with an integer returns a single object, indexing with a slice
+    returns a list of objects, and iterating streams all objects in chunks.
+    A store is a context manager; `close` (or leaving the `with` block) drops
+    its memory map, which is unmapped once the arrays returned by `coords` are
+    released as well.
+
+    :param path: the file to open
+    :raises ValueError: the file is not a valid store or it is truncated.
+
+    Examples:
+        >>> import os, tempfile
+        >>> from projgeom.ff_object import FfPoint
+        >>> path = os.path.join(tempfile.mkdtemp(), "ff.pgb")
+        >>> save(path, [FfPoint([i, 1, 2], 11) for i in range(5)])
+        >>> with MappedStore(path) as store:
+        ...     store.modulus, store[-2:]
+        (11, [FfPoint(3 : 1 : 2), FfPoint(4 : 1 : 2)])
+        >>> len(store)
+        Traceback (most recent call last):
+            ...
+        ValueError: I/O operation on a closed store
+    """
+
+    def __init__(self, path: PathLike) -> None:
+        with open(path, "rb") as file:
+            head = file.read(_MAX_HEADER)
+            size = os.fstat(file.fileno()).st_size
+        self.path = path
+        self.elem_type, self.modulus, self.width, count, offset = read_header(head)
+        if size != offset + 3 * count * self.width:
+            raise ValueError("the file size does not match its header")
+        self._data: np.ndarray
+        if self.width in (1, 2, 4, 8):
+            dtype = np.dtype(f"<i{self.width}")
+            shape = (count, 3)
+        else:
+            dtype = np.dtype(np.uint8)
+            shape = (count, 3 * self.width)
+        if count == 0:
+            self._data = np.zeros(shape, dtype=dtype)
+        else:
+            self._data = np.memmap(
+                path, dtype=dtype, mode="r", offset=offset, shape=shape
+            )
+        self.closed = False
+
+    def close(self) -> None:
+        """The `close` function releases the memory map; the store cannot be used afterwards."""
+        self._data = np.empty((0, self._data.shape[1]), dtype=self._data.dtype)
+        self.closed = True
+
+    def __enter__(self) -> "MappedStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _check_open(self) -> None:
+        if self.closed:
+            raise ValueError("I/O operation on a closed store")
+
+    def __len__(self) -> int:
+        self._check_open()
+        return len(self._data)
+
+    def coords(self, index: slice = slice(None)) -> np.ndarray:
+        """
+        The `coords` function returns the coordinates of a range of objects as an (M, 3) array.
+
+        :param index: a slice of the rows to return; all rows by default
+        :type index: slice
+        :return: a read-only view of the memory map if the coordinates fit in 8 bytes,
+            and a decoded object array otherwise.
+        """
+        self._check_open()
+        rows = self._data[index]
+        if self.width in (1, 2, 4, 8):
+            return rows
+        return decode(np.ascontiguousarray(rows), self.width).reshape(-1, 3)
+
+    def _objects(self, rows: np.ndarray) -> List[PgObject]:
+        cls = self.elem_type
+        if issubclass(cls, FfObject):
+            return [cls(row, self.modulus) for row in rows.tolist()]
+        return [cls(row) for row in rows.tolist()]
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._objects(self.coords(index))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("store index out of range")
+        return self._objects(self.coords(slice(index, index + 1)))[0]
+
+    def __iter__(self) -> Iterator[PgObject]:
+        for start in range(0, len(self), CHUNK_ROWS):
+            yield from self._objects(self.coords(slice(start, start + CHUNK_ROWS)))
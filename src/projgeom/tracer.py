@@ -0,0 +1,407 @@
+"""
+Construction Tracer (tracer.py)
+
+This code compiles a construction written against the `ProjectivePlane` and
+    `CayleyKleinPlane` API, such as `harm_conj`, `involution`, `orthocenter`
+    or `check_pappus`, into a batched kernel over (N, 3) coordinate arrays.
+    The construction is not rewritten: `compile_construction` runs it once on
+    placeholder objects that record every operation they see.
+
+Every argument of the construction must be a point, a line or an int, one
+    array per argument. Functions that take a list, such as `orthocenter` or
+    `check_pappus`, are compiled through a wrapper with positional arguments:
+
+    >>> from projgeom.ck_plane import orthocenter
+    >>> from projgeom.hyp_object import HyperbolicPoint
+    >>> def ortho(pt_a, pt_b, pt_c):
+    ...     return orthocenter([pt_a, pt_b, pt_c])
+    >>> kernel = compile_construction(
+    ...     ortho, HyperbolicPoint([1, 3, 5]), HyperbolicPoint([3, 1, 4]),
+    ...     HyperbolicPoint([5, 2, 1]))
+    >>> kernel(np.array([[1, 3, 5]]), np.array([[3, 1, 4]]), np.array([[5, 2, 1]]))
+    array([[  140, -3798, -3074]])
+    >>> orthocenter([HyperbolicPoint([1, 3, 5]), HyperbolicPoint([3, 1, 4]),
+    ...              HyperbolicPoint([5, 2, 1])])
+    HyperbolicPoint(140 : -3798 : -3074)
+
+The recorded program is a straight-line sequence of operations on registers:
+
+- `meet` is a cross product, `dot` a dot product and `parametrize` a
+  Plucker combination of two registers,
+- `perp` is the linear map (or constant) of the geometry, probed once by
+  `pg_array.perp_array`, and `aux` reuses the coordinates,
+- `==`, `incident` and `coincident` become zero tests,
+- scalars returned by `dot` may be negated, added, subtracted and multiplied.
+
+The placeholders carry the concrete objects of a sample input and compute
+    on them too, so whenever the construction branches on a boolean (an `if`,
+    an `assert`, `and` / `or`), the branch taken by the sample is followed
+    and recorded as a guard. The compiled kernel evaluates the program on all
+    rows with the vectorized kernels of pg_array.py and checks the guards.
+    Rows that would take another branch, such as degenerate configurations,
+    are recomputed by calling the original function on scalar objects, so the
+    results always agree with the Python construction.
+
+Like the scalar classes, the kernel is exact: every step falls back to
+    Python ints where int64 could overflow.
+
+With `auto_normalize` on for a point or line class, the scalar construction
+    rescales every intermediate object, and the kernel does not. The point and
+    line results of the kernel are therefore normalized at the end, and agree
+    with the Python construction. Intermediate objects may still differ by a
+    factor, so scalar results, such as those of `dot`, may differ by a factor
+    as well.
+"""
+
+from typing import Any, Callable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from .ck_plane import CayleyKleinPlane
+from .ff_object import FfObject
+from .pg_array import (
+    INT64_BITS,
+    as_coord_array,
+    bit_length_array,
+    canonical_array,
+    cross_array,
+    det_array,
+    dot_array,
+    perp_array,
+    plckr_array,
+)
+from .pg_object import PgObject
+
+
+def _exact(arr_a, arr_b, extra_bits: int, mul: bool) -> Tuple[Any, Any]:
+    """Casts both operands to object dtype unless the result provably fits in int64."""
+    bits_a = int(np.max(bit_length_array(np.asarray(arr_a)), initial=0))
+    bits_b = int(np.max(bit_length_array(np.asarray(arr_b)), initial=0))
+    bits = bits_a + bits_b if mul else max(bits_a, bits_b)
+    if bits + extra_bits <= INT64_BITS:
+        return arr_a, arr_b
+    return np.asarray(arr_a, dtype=object), np.asarray(arr_b, dtype=object)
+
+
+def _add(arr_a, arr_b):
+    arr_a, arr_b = _exact(arr_a, arr_b, 1, False)
+    return arr_a + arr_b
+
+
+def _sub(arr_a, arr_b):
+    arr_a, arr_b = _exact(arr_a, arr_b, 1, False)
+    return arr_a - arr_b
+
+
+def _mul(arr_a, arr_b):
+    arr_a, arr_b = _exact(arr_a, arr_b, 1, True)
+    return arr_a * arr_b
+
+
+def _neg(arr):
+    return _sub(0, arr)
+
+
+def _is_zero(arr) -> np.ndarray:
+    return np.asarray(arr == 0, dtype=bool)
+
+
+def _is_zero_vec(arr) -> np.ndarray:
+    return np.asarray(np.asarray(arr == 0, dtype=bool).all(axis=-1))
+
+
+class _Tape:
+    """The recorded program: `(register, function, operand registers)` triples."""
+
+    def __init__(self) -> None:
+        self.ops: List[Tuple[int, Callable, Tuple[int, ...]]] = []
+        self.guards: List[Tuple[int, bool]] = []
+        self.num_regs = 0
+
+    def emit(self, func: Callable, *args: int) -> int:
+        reg = self.num_regs
+        self.num_regs += 1
+        self.ops.append((reg, func, args))
+        return reg
+
+    def const(self, value) -> int:
+        return self.emit(lambda: value)
+
+
+class _Traced:
+    __slots__ = ("tape", "reg", "value")
+
+    def __init__(self, tape: _Tape, reg: int, value) -> None:
+        self.tape = tape
+        self.reg = reg
+        self.value = value
+
+
+class _TracedBool(_Traced):
+    """A recorded zero test; using it as a Python bool records a guard."""
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        value = bool(self.value)
+        self.tape.guards.append((self.reg, value))
+        return value
+
+
+def _scalar_reg(tape: _Tape, value) -> Tuple[int, Any]:
+    if isinstance(value, _TracedScalar):
+        return value.reg, value.value
+    if isinstance(value, _Traced):
+        raise TypeError("expected a scalar")
+    return tape.const(value), value
+
+
+class _TracedScalar(_Traced):
+    """A recorded scalar, for example the result of `dot`."""
+
+    __slots__ = ()
+
+    def _binary(self, func: Callable, other, value, swap: bool = False):
+        reg, _ = _scalar_reg(self.tape, other)
+        args = (reg, self.reg) if swap else (self.reg, reg)
+        return _TracedScalar(self.tape, self.tape.emit(func, *args), value)
+
+    def __add__(self, other):
+        return self._binary(_add, other, self.value + _value_of(other))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self._binary(_sub, other, self.value - _value_of(other))
+
+    def __rsub__(self, other):
+        return self._binary(_sub, other, _value_of(other) - self.value, swap=True)
+
+    def __mul__(self, other):
+        return self._binary(_mul, other, self.value * _value_of(other))
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return _TracedScalar(self.tape, self.tape.emit(_neg, self.reg), -self.value)
+
+    def __eq__(self, other):  # type: ignore[override]
+        diff = self - other
+        reg = self.tape.emit(_is_zero, diff.reg)
+        return _TracedBool(self.tape, reg, diff.value == 0)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __int__(self) -> int:
+        raise TypeError("a traced scalar has no concrete value")
+
+
+def _value_of(value):
+    return value.value if isinstance(value, _Traced) else value
+
+
+class _TracedObject(_Traced, CayleyKleinPlane["_TracedObject", Any]):
+    """A recorded point or line."""
+
+    __slots__ = ()
+
+    def _make(self, func: Callable, args: Sequence[int], value) -> "_TracedObject":
+        return _TracedObject(self.tape, self.tape.emit(func, *args), value)
+
+    def dual_type(self) -> type:
+        return _TracedObject
+
+    def __eq__(self, other):  # type: ignore[override]
+        reg = self.tape.emit(
+            lambda a, b: _is_zero_vec(cross_array(a, b)), self.reg, other.reg
+        )
+        return _TracedBool(self.tape, reg, self.value == other.value)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def meet(self, rhs: "_TracedObject") -> "_TracedObject":
+        return self._make(cross_array, (self.reg, rhs.reg), self.value.meet(rhs.value))
+
+    def aux(self) -> "_TracedObject":
+        return _TracedObject(self.tape, self.reg, self.value.aux())
+
+    def perp(self) -> "_TracedObject":
+        elem_type = type(self.value)
+        return self._make(
+            lambda a: perp_array(elem_type, a), (self.reg,), self.value.perp()
+        )
+
+    def dot(self, line: "_TracedObject") -> _TracedScalar:
+        reg = self.tape.emit(dot_array, self.reg, line.reg)
+        return _TracedScalar(self.tape, reg, self.value.dot(line.value))
+
+    def parametrize(self, lambda_, pt_q: "_TracedObject", mu_) -> "_TracedObject":
+        lam_reg, lam = _scalar_reg(self.tape, lambda_)
+        mu_reg, mu = _scalar_reg(self.tape, mu_)
+        value = self.value.parametrize(lam, pt_q.value, mu)
+        return self._make(plckr_array, (lam_reg, self.reg, mu_reg, pt_q.reg), value)
+
+    def incident(self, line: "_TracedObject") -> _TracedBool:  # type: ignore[override]
+        reg = self.tape.emit(lambda a, b: _is_zero(dot_array(a, b)), self.reg, line.reg)
+        return _TracedBool(self.tape, reg, self.value.incident(line.value))
+
+    def coincident(self, pt_q, pt_r) -> _TracedBool:  # type: ignore[override]
+        reg = self.tape.emit(
+            lambda a, b, c: _is_zero(det_array(a, b, c)),
+            self.reg,
+            pt_q.reg,
+            pt_r.reg,
+        )
+        value = self.value.coincident(pt_q.value, pt_r.value)
+        return _TracedBool(self.tape, reg, value)
+
+
+def _flatten(result) -> Tuple[List[Any], bool]:
+    if isinstance(result, (tuple, list)):
+        return list(result), True
+    return [result], False
+
+
+class CompiledConstruction:
+    """
+    The `CompiledConstruction` class is a construction compiled by `compile_construction`.
+
+    Calling it with one (N, 3) coordinate array per object argument (and one (N,) array
+    or int per scalar argument) evaluates the construction for all N rows. Each result
+    becomes an array: (N, 3) coordinates for a point or line, (N,) for a scalar or a
+    boolean. A tuple or list of results gives a tuple of arrays. Points and lines of a
+    class with `auto_normalize` on are returned normalized.
+
+    :ivar num_ops: the number of recorded operations
+    :ivar num_guards: the number of recorded branch conditions
+    """
+
+    def __init__(self, func: Callable, sample: Sequence, tape: _Tape, outputs) -> None:
+        self.func = func
+        self._types = [type(arg) for arg in sample]
+        self._tape = tape
+        self._outputs, self._is_seq = outputs
+        self.num_ops = len(tape.ops)
+        self.num_guards = len(tape.guards)
+
+    def __call__(self, *inputs):
+        if len(inputs) != len(self._types):
+            raise TypeError(f"expected {len(self._types)} arguments")
+        arrays = [
+            np.asarray(arg) if issubclass(t, int) else as_coord_array(arg)
+            for t, arg in zip(self._types, inputs)
+        ]
+        for t, arr in zip(self._types, arrays):
+            if arr.ndim not in ((0, 1) if issubclass(t, int) else (2,)):
+                raise ValueError(
+                    "expected an (N, 3) array per point or line, "
+                    "and an int or an (N,) array per scalar"
+                )
+        lengths = {len(arr) for arr in arrays if arr.ndim > 0}
+        if len(lengths) > 1:
+            raise ValueError("all arrays must have the same number of rows")
+        num = lengths.pop() if lengths else 1
+        regs: List[Any] = [None] * self._tape.num_regs
+        for i, arr in enumerate(arrays):
+            regs[i] = arr
+        for reg, func, args in self._tape.ops[len(arrays) :]:
+            regs[reg] = func(*(regs[a] for a in args))
+        valid = np.ones(num, dtype=bool)
+        for reg, expected in self._tape.guards:
+            valid &= regs[reg] == expected
+        results = [self._output(regs, out, num) for out in self._outputs]
+        rows = np.flatnonzero(~valid)
+        if rows.size > 0:
+            results = self._fallback(arrays, rows, results)
+        return tuple(results) if self._is_seq else results[0]
+
+    def _output(self, regs, out, num: int) -> np.ndarray:
+        kind, payload, elem_type = out
+        if kind == "const":
+            return np.full(num, payload)
+        arr = np.asarray(regs[payload])
+        if kind == "array":
+            return np.broadcast_to(arr, (num,)).copy()
+        if getattr(elem_type, "auto_normalize", False):
+            arr = canonical_array(arr)
+        return np.broadcast_to(arr, (num, 3)).copy()
+
+    def _fallback(self, arrays, rows: np.ndarray, results: List[np.ndarray]):
+        """Recomputes the rows that failed a guard with the original function."""
+        values: List[List[Any]] = [[] for _ in results]
+        for row in rows:
+            args = [
+                (
+                    int(arr[row] if arr.ndim > 0 else arr)
+                    if issubclass(t, int)
+                    else t(arr[row].tolist())
+                )
+                for t, arr in zip(self._types, arrays)
+            ]
+            for i, leaf in enumerate(_flatten(self.func(*args))[0]):
+                values[i].append(getattr(leaf, "coord", leaf))
+        merged = []
+        for result, vals in zip(results, values):
+            fixed = np.array(vals)
+            if fixed.dtype.kind not in "iub" or result.dtype != fixed.dtype:
+                result = result.astype(object)
+                fixed = np.array(vals, dtype=object).reshape(
+                    (len(vals),) + result.shape[1:]
+                )
+            result[rows] = fixed
+            merged.append(result)
+        return merged
+
+
+def compile_construction(func: Callable, *sample) -> CompiledConstruction:
+    """
+    The `compile_construction` function traces `func` on a sample input and returns a batched kernel.
+
+    :param func: a function of points, lines and integer scalars written against the
+        `ProjectivePlane` / `CayleyKleinPlane` API, returning a point, line, scalar, boolean,
+        or a tuple or list of those
+    :param sample: one concrete argument per parameter of `func`. Their types are the types
+        of the objects the kernel works on, and the branches they take are the ones compiled.
+    :return: a `CompiledConstruction`.
+    :raises TypeError: an argument is not an integer-coordinate point or line (`PgObject`,
+        excluding the finite-field objects) or an int.
+
+    Examples:
+        >>> from projgeom.pg_object import PgPoint
+        >>> from projgeom.pg_plane import harm_conj
+        >>> kernel = compile_construction(
+        ...     harm_conj, PgPoint([1, 0, 0]), PgPoint([0, 1, 0]), PgPoint([1, 1, 0]))
+        >>> pt_a = np.array([[1, 0, 0], [1, 2, 0]])
+        >>> pt_b = np.array([[0, 1, 0], [0, 1, 1]])
+        >>> pt_c = np.array([[1, 1, 0], [1, 3, 1]])
+        >>> kernel(pt_a, pt_b, pt_c)
+        array([[ 1, -1,  0],
+               [ 6,  6, -6]])
+        >>> harm_conj(PgPoint([1, 2, 0]), PgPoint([0, 1, 1]), PgPoint([1, 3, 1]))
+        PgPoint(6 : 6 : -6)
+    """
+    tape = _Tape()
+    placeholders: List[Union[_TracedScalar, _TracedObject]] = []
+    for arg in sample:
+        reg = tape.emit(lambda: None)
+        if isinstance(arg, int):
+            placeholders.append(_TracedScalar(tape, reg, arg))
+        elif isinstance(arg, PgObject) and not isinstance(arg, FfObject):
+            placeholders.append(_TracedObject(tape, reg, arg))
+        else:
+            raise TypeError(f"cannot trace an argument of type {type(arg).__name__}")
+    outputs: List[Tuple[str, Any, Optional[type]]] = []
+    leaves, is_seq = _flatten(func(*placeholders))
+    for leaf in leaves:
+        if isinstance(leaf, _TracedObject):
+            outputs.append(("object", leaf.reg, type(leaf.value)))
+        elif isinstance(leaf, (_TracedScalar, _TracedBool)):
+            outputs.append(("array", leaf.reg, None))
+        elif isinstance(leaf, (bool, int)):
+            outputs.append(("const", leaf, None))
+        elif hasattr(leaf, "coord"):
+            reg = tape.const(as_coord_array(leaf.coord))
+            outputs.append(("object", reg, type(leaf)))
+        else:
+            raise TypeError(f"cannot compile a result of type {type(leaf).__name__}")
+    return CompiledConstruction(func, sample, tape, (outputs, is_seq))
@@ -0,0 +1,390 @@
+"""
+Projective Transformations (transform.py)
+
+This code represents a projective transformation of the plane (a
+    collineation) by an exact 3x3 integer matrix M, acting on homogeneous
+    coordinates as p -> M p.
+
+`involution()` in pg_plane.py and `reflect()` in ck_plane.py construct the
+    image of every point from scratch with `meet`, `aux`, `harm_conj` and
+    several `dot` products. Both maps are linear in the coordinates of the
+    point, so they can be turned into a matrix once and then applied to any
+    number of points, or to a whole coordinate array in a single matrix
+    product:
+
+1. from_involution(): the harmonic homology with a given centre and axis,
+   M = (o . m) I - 2 o m^T, which maps p to `involution(origin, mirror, p)`.
+2. from_reflection(): the reflection in a line of a Cayley-Klein geometry,
+   i.e. the involution with centre `mirror.perp()` and axis `mirror`.
+3. from_points(): the unique collineation mapping four points in general
+   position to four others.
+
+`Reflection` is the reflection in a fixed mirror line, built once: it keeps
+    the pole of the mirror together with the matrices that act on points and
+    on lines. `reflection()` returns the same `Reflection` object for equal
+    mirrors, so a program that reflects many points in a few mirrors builds
+    each of them only once.
+
+Transformations compose exactly with `@` and are inverted with the
+    adjugate matrix, so no fractions ever appear. Since a matrix and its
+    non-zero multiples give the same map, the matrix is kept divided by the
+    gcd of its entries. If points are transformed by M, lines are
+    transformed by the inverse transpose of M; `dual()` returns that
+    transformation, using the adjugate in place of the inverse.
+"""
+
+from math import gcd
+from typing import Any, Dict, Optional, Protocol, Sequence, Tuple, TypeVar
+
+import numpy as np
+
+from .pg_array import PgArray, as_coord_array, outer_dot_array
+from .pg_object import PgObject, cross, det, dot
+
+Obj = TypeVar("Obj", bound=PgObject)
+Arr = TypeVar("Arr", PgArray, np.ndarray)
+Matrix = Tuple[Tuple[int, int, int], Tuple[int, int, int], Tuple[int, int, int]]
+
+# The number of reflections `reflection()` keeps per mirror type.
+_REFLECTION_CACHE_SIZE = 1024
+
+
+class Mirror(Protocol):
+    """A line of a Cayley-Klein geometry: integer coordinates and a pole."""
+
+    @property
+    def coord(self) -> Tuple[int, ...]: ...
+
+    def perp(self) -> Any: ...
+
+    def canonical_key(self) -> Tuple[int, int, int]: ...
+
+
+def _canonical_matrix(rows: Sequence[Sequence[int]]) -> Matrix:
+    divisor = gcd(*(x for row in rows for x in row))
+    first = next(x for row in rows for x in row if x != 0)
+    if first < 0:
+        divisor = -divisor
+    return tuple(tuple(x // divisor for x in row) for row in rows)  # type: ignore
+
+
+def _matmul(mat_a: Matrix, mat_b: Matrix) -> Matrix:
+    cols = list(zip(*mat_b))
+    return tuple(tuple(dot(row, col) for col in cols) for row in mat_a)  # type: ignore
+
+
+def adjugate(mat: Sequence[Sequence[int]]) -> Matrix:
+    """
+    The `adjugate` function returns the adjugate of a 3x3 integer matrix, `det(M) * M^-1`.
+
+    :param mat: three rows of three integers
+    :type mat: Sequence[Sequence[int]]
+    :return: the adjugate as a tuple of three row tuples.
+
+    Examples:
+        >>> adjugate([[2, 0, 0], [0, 1, 0], [0, 0, -1]])
+        ((-1, 0, 0), (0, -2, 0), (0, 0, 2))
+    """
+    # The columns of the adjugate are the cross products of pairs of rows.
+    cols = [cross(mat[1], mat[2]), cross(mat[2], mat[0]), cross(mat[0], mat[1])]
+    return tuple(zip(*cols))  # type: ignore
+
+
+class Collineation:
+    """
+    The `Collineation` class represents a projective transformation by a 3x3 integer matrix.
+
+    :param matrix: three rows of three integers; the matrix must be invertible
+    :type matrix: Sequence[Sequence[int]]
+    :raises ValueError: The matrix is not 3x3 or it is singular.
+
+    Examples:
+        >>> from projgeom.pg_object import PgPoint
+        >>> trans = Collineation([[2, 0, 0], [0, 2, 0], [1, 0, 2]])
+        >>> trans(PgPoint([1, 1, 0]))
+        PgPoint(2 : 2 : 1)
+        >>> (trans @ trans.inverse()).matrix
+        ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+    """
+
+    __slots__ = ("matrix",)
+
+    matrix: Matrix
+
+    def __init__(self, matrix: Sequence[Sequence[int]]) -> None:
+        if len(matrix) != 3 or any(len(row) != 3 for row in matrix):
+            raise ValueError("matrix must have three rows of three integers")
+        if det(*matrix) == 0:
+            raise ValueError("matrix must be invertible")
+        self.matrix = _canonical_matrix(matrix)
+
+    @classmethod
+    def identity(cls) -> "Collineation":
+        """The `identity` function returns the identity transformation."""
+        return cls([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+
+    @classmethod
+    def from_involution(cls, origin: PgObject, mirror: PgObject) -> "Collineation":
+        """
+        The `from_involution` function returns the matrix form of `involution(origin, mirror, .)`.
+
+        :param origin: the centre of the involution
+        :type origin: PgObject
+        :param mirror: the axis of the involution, not incident with `origin`
+        :type mirror: PgObject
+        :return: a transformation of objects of the type of `origin`.
+        :raises ValueError: `origin` is incident with `mirror`.
+
+        Examples:
+            >>> from projgeom.pg_object import PgPoint, PgLine
+            >>> from projgeom.pg_plane import involution
+            >>> origin, mirror = PgPoint([1, 0, 1]), PgLine([0, 1, 1])
+            >>> trans = Collineation.from_involution(origin, mirror)
+            >>> trans(PgPoint([1, 2, 1])) == involution(origin, mirror, PgPoint([1, 2, 1]))
+            True
+            >>> trans @ trans == Collineation.identity()
+            True
+        """
+        return cls(_involution_matrix(origin.coord, mirror.coord))
+
+    @classmethod
+    def from_reflection(cls, mirror: Mirror) -> "Collineation":
+        """
+        The `from_reflection` function returns the reflection in a line of a Cayley-Klein geometry.
+
+        :param mirror: a line with a `perp` method, e.g. a `HyperbolicLine`
+        :type mirror: Mirror
+        :return: a transformation of points, equal to `involution(mirror.perp(), mirror, .)`.
+
+        Examples:
+            >>> from projgeom.hyp_object import HyperbolicLine, HyperbolicPoint
+            >>> trans = Collineation.from_reflection(HyperbolicLine([0, 1, 0]))
+            >>> trans(HyperbolicPoint([1, 2, 1]))
+            HyperbolicPoint(1 : -2 : 1)
+        """
+        return cls(_involution_matrix(mirror.perp().coord, mirror.coord))
+
+    @classmethod
+    def from_points(
+        cls, src: Sequence[PgObject], dst: Sequence[PgObject]
+    ) -> "Collineation":
+        """
+        The `from_points` function returns the collineation that maps four points to four points.
+
+        :param src: four points, no three of them collinear
+        :type src: Sequence[PgObject]
+        :param dst: their four images, no three of them collinear
+        :type dst: Sequence[PgObject]
+        :return: the unique transformation mapping `src[i]` to `dst[i]`.
+        :raises ValueError: three of the points are collinear.
+
+        Examples:
+            >>> from projgeom.pg_object import PgPoint
+            >>> src = [PgPoint(c) for c in ([1, 0, 0], [0, 1, 0], [0, 0, 1], [1, 1, 1])]
+            >>> dst = [PgPoint(c) for c in ([1, 2, 0], [0, 1, 3], [2, 0, 1], [1, 1, 1])]
+            >>> trans = Collineation.from_points(src, dst)
+            >>> [trans(pt) == pt_q for pt, pt_q in zip(src, dst)]
+            [True, True, True, True]
+        """
+        if len(src) != 4 or len(dst) != 4:
+            raise ValueError("four points and four images are required")
+        return cls(
+            _matmul(_from_frame(dst), adjugate(_from_frame(src)))  # type: ignore
+        )
+
+    def __matmul__(self, other: "Collineation") -> "Collineation":
+        """
+        The function composes two transformations: `(s @ t)(p) == s(t(p))`.
+        """
+        return Collineation(_matmul(self.matrix, other.matrix))
+
+    def inverse(self) -> "Collineation":
+        """The `inverse` function returns the inverse transformation, via the adjugate matrix."""
+        return Collineation(adjugate(self.matrix))
+
+    def dual(self) -> "Collineation":
+        """
+        The `dual` function returns the transformation induced on the dual objects
+        (lines, if `self` transforms points), whose matrix is the inverse transpose.
+
+        Examples:
+            >>> from projgeom.pg_object import PgPoint
+            >>> trans = Collineation([[1, 2, 0], [0, 1, 3], [2, 0, 1]])
+            >>> pt_p, pt_q = PgPoint([1, 4, 2]), PgPoint([3, 0, 1])
+            >>> trans.dual()(pt_p.meet(pt_q)) == trans(pt_p).meet(trans(pt_q))
+            True
+        """
+        return Collineation(tuple(zip(*adjugate(self.matrix))))  # type: ignore
+
+    def __call__(self, obj: Obj) -> Obj:
+        """
+        The function transforms a single object.
+
+        :param obj: a point or line with integer coordinates
+        :return: an object of the same type with coordinates `M @ obj.coord`.
+        """
+        return type(obj)([dot(row, obj.coord) for row in self.matrix])
+
+    def apply_array(self, arr: Arr) -> Arr:
+        """
+        The `apply_array` function transforms every row of a coordinate array at once.
+
+        :param arr: an (N, 3) integer array, or a `PgArray`
+        :return: the transformed coordinates, as an array of the same kind. The
+            product is exact: rows that could overflow int64 are computed with
+            Python ints.
+
+        Examples:
+            >>> trans = Collineation([[2, 0, 0], [0, 2, 0], [1, 0, 2]])
+            >>> trans.apply_array(np.array([[1, 1, 0], [0, 0, 1]]))
+            array([[2, 2, 1],
+                   [0, 0, 2]])
+        """
+        if isinstance(arr, PgArray):
+            return type(arr)(self.apply_array(arr.coord))
+        return outer_dot_array(as_coord_array(arr), as_coord_array(self.matrix))
+
+    def __eq__(self, other) -> bool:
+        """Two transformations are equal when their matrices are proportional."""
+        return isinstance(other, Collineation) and self.matrix == other.matrix
+
+    def __hash__(self) -> int:
+        return hash(self.matrix)
+
+    def __repr__(self) -> str:
+        return f"Collineation({[list(row) for row in self.matrix]})"
+
+
+class Reflection(Collineation):
+    """
+    The `Reflection` class represents the reflection in a line of a Cayley-Klein geometry.
+
+    The pole of the mirror and the matrices acting on points and on lines are
+    computed once, when the reflection is created. Calling the reflection on a
+    point or a line takes one matrix-vector product; `apply_array` reflects a
+    whole coordinate array in one matrix product.
+
+    :param mirror: a line with a `perp` method, e.g. a `HyperbolicLine`
+    :type mirror: Mirror
+    :raises ValueError: the mirror is incident with its pole (an isotropic line).
+
+    Examples:
+        >>> from projgeom.hyp_object import HyperbolicLine, HyperbolicPoint
+        >>> refl = Reflection(HyperbolicLine([0, 1, 0]))
+        >>> refl.pole
+        HyperbolicPoint(0 : 1 : 0)
+        >>> refl(HyperbolicPoint([1, 2, 1]))
+        HyperbolicPoint(1 : -2 : 1)
+        >>> refl(HyperbolicLine([1, 1, 1]))
+        HyperbolicLine(1 : -1 : 1)
+    """
+
+    __slots__ = ("mirror", "pole", "line_matrix")
+
+    mirror: Mirror
+    pole: PgObject
+    line_matrix: Matrix
+
+    def __init__(self, mirror: Mirror) -> None:
+        pole = mirror.perp()
+        super().__init__(_involution_matrix(pole.coord, mirror.coord))
+        self.mirror = mirror
+        self.pole = pole
+        # The matrix is an involution, so its inverse transpose is (up to a
+        # scalar) its transpose.
+        self.line_matrix = tuple(zip(*self.matrix))  # type: ignore
+
+    def __call__(self, obj: Obj) -> Obj:
+        """
+        The function reflects a point or a line.
+
+        :param obj: a point, or a line of the type of the mirror
+        :return: the mirror image of `obj`, an object of the same type.
+        """
+        matrix = self.line_matrix if type(obj) is type(self.mirror) else self.matrix
+        return type(obj)([dot(row, obj.coord) for row in matrix])
+
+    def apply_array(self, arr: Arr, lines: bool = False) -> Arr:
+        """
+        The `apply_array` function reflects every row of a coordinate array at once.
+
+        :param arr: an (N, 3) integer array, or a `PgArray`
+        :param lines: if True, the rows are lines and not points
+        :type lines: bool
+        :return: the reflected coordinates, as an array of the same kind.
+
+        Examples:
+            >>> from projgeom.ell_object import EllipticLine
+            >>> refl = Reflection(EllipticLine([0, 0, 1]))
+            >>> refl.apply_array(np.array([[1, 2, 3], [0, 1, 1]]))
+            array([[ 1,  2, -3],
+                   [ 0,  1, -1]])
+        """
+        if isinstance(arr, PgArray):
+            return type(arr)(self.apply_array(arr.coord, lines))
+        matrix = self.line_matrix if lines else self.matrix
+        return outer_dot_array(as_coord_array(arr), as_coord_array(matrix))
+
+    def __repr__(self) -> str:
+        return f"Reflection({self.mirror!r})"
+
+
+def reflection(mirror: Mirror) -> Reflection:
+    """
+    The `reflection` function returns the reflection in a mirror line, built once per mirror.
+
+    The results are cached, so all calls with equal mirrors (of the same type
+    and with proportional coordinates) return the same `Reflection` object.
+    Its `mirror` is the mirror in canonical coordinates, whichever of the
+    equal mirrors it was first asked for.
+
+    :param mirror: a line with a `perp` method, e.g. a `HyperbolicLine`
+    :type mirror: Mirror
+    :return: the reflection in `mirror`.
+
+    Examples:
+        >>> from projgeom.hyp_object import HyperbolicLine
+        >>> refl = reflection(HyperbolicLine([0, -2, 0]))
+        >>> refl is reflection(HyperbolicLine([0, 1, 0]))
+        True
+        >>> refl.mirror
+        HyperbolicLine(0 : 1 : 0)
+    """
+    mirror_type: type = type(mirror)
+    # Cached on the class itself rather than in a global cache, so that classes
+    # created on the fly (e.g. by `conic_object.cayley_klein`) can be freed.
+    cache: Optional[Dict[Tuple[int, int, int], Reflection]]
+    cache = vars(mirror_type).get("_reflections")
+    if cache is None:
+        cache = {}
+        setattr(mirror_type, "_reflections", cache)
+    key = mirror.canonical_key()
+    refl = cache.get(key)
+    if refl is None:
+        if len(cache) >= _REFLECTION_CACHE_SIZE:
+            del cache[next(iter(cache))]  # drop the oldest entry
+        refl = cache[key] = Reflection(mirror_type(key))
+    return refl
+
+
+def _involution_matrix(origin: Sequence[int], mirror: Sequence[int]) -> Matrix:
+    """The matrix (o . m) I - 2 o m^T of the harmonic homology with centre o and axis m."""
+    o_m = dot(origin, mirror)
+    if o_m == 0:
+        raise ValueError("origin must not be incident with mirror")
+    return tuple(
+        tuple((o_m if i == j else 0) - 2 * origin[i] * mirror[j] for j in range(3))
+        for i in range(3)
+    )  # type: ignore
+
+
+def _from_frame(pts: Sequence[PgObject]) -> Matrix:
+    """
+    Matrix mapping the standard frame e1, e2, e3, (1, 1, 1) to four points:
+    its columns are the first three points scaled so that they sum to the fourth.
+    """
+    mat = tuple(zip(*(pt.coord for pt in pts[:3])))
+    scale = [dot(row, pts[3].coord) for row in adjugate(mat)]
+    if det(*mat) == 0 or 0 in scale:
+        raise ValueError("no three of the four points may be collinear")
+    return tuple(tuple(x * s for x, s in zip(row, scale)) for row in mat)  # type: ignore
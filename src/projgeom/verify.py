@@ -0,0 +1,239 @@
+"""
+Probabilistic Theorem Verifier (verify.py)
+
+This code checks a construction written against the `ProjectivePlane` API
+    on many random instances over a large prime field, in the
+    Schwartz-Zippel style, instead of on one concrete configuration.
+
+A construction is any function that takes points (and optionally scalars)
+    and returns a boolean, for example Pappus' theorem with the collinear
+    triples built by `parametrize`:
+
+    def pappus(pt_a, pt_b, pt_d, pt_e, s, t, u, v):
+        return check_pappus(
+            [pt_a, pt_b, pt_a.parametrize(s, pt_b, t)],
+            [pt_d, pt_e, pt_d.parametrize(u, pt_e, v)],
+        )
+
+The verifier calls it with uniformly random `FfPoint` objects and scalars
+    of GF(p). Every coordinate computed along the way is a polynomial in the
+    random inputs, and every boolean the construction looks at comes from a
+    zero test (`incident`, `coincident` or `==`) of such a polynomial. While running, the
+    verifier tracks an upper bound on the degree of every polynomial and adds
+    up the degrees of all zero tests of a trial into D.
+
+By the Schwartz-Zippel lemma a non-zero polynomial of degree d vanishes at a
+    random point with probability at most d / p. With probability at least
+    1 - D / p no zero test of a trial deviates from its generic outcome, so
+    the trial returns the same answer as the generic (symbolic) instance. If
+    the statement is false, the chance that all t trials still pass is at
+    most (D / p)^t, which is the `error_bound` reported.
+
+All arithmetic is modular with word-sized values, so a few dozen trials
+    take milliseconds even for constructions whose integer coordinates would
+    run into thousands of bits.
+"""
+
+import random
+from typing import Callable, NamedTuple, Optional, Tuple, TypeVar
+
+from .ff_object import FfObject, FfPoint
+from .pg_object import cross, dot, plckr
+
+Dual = TypeVar("Dual", bound="_TrackedObject")
+
+# The Mersenne prime 2^61 - 1.
+DEFAULT_MODULUS = 2305843009213693951
+
+
+class VerifyResult(NamedTuple):
+    """Outcome of `verify`"""
+
+    holds: bool
+    """True if every trial returned True."""
+    trials: int
+    failures: int
+    degree: int
+    """Largest sum of zero-test degrees over the trials (D)."""
+    error_bound: float
+    """Upper bound on the probability that a false statement passes all trials."""
+    counterexample: Optional[Tuple]
+    """The inputs of the first failing trial, if any."""
+
+
+class _DegreeTracker:
+    """Sum of the degrees of the zero tests of one trial."""
+
+    __slots__ = ("total",)
+
+    def __init__(self) -> None:
+        self.total = 0
+
+    def record(self, degree: int) -> None:
+        self.total += degree
+
+
+def _degree(value) -> int:
+    return getattr(value, "degree", 0)
+
+
+class _Scalar(int):
+    """An element of GF(p) together with an upper bound on its degree in the random inputs."""
+
+    degree: int
+
+    def __new__(cls, value: int, degree: int):
+        obj = super().__new__(cls, value)
+        obj.degree = degree
+        return obj
+
+    def __add__(self, other):
+        return _Scalar(int(self) + int(other), max(self.degree, _degree(other)))
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return _Scalar(int(self) - int(other), max(self.degree, _degree(other)))
+
+    def __rsub__(self, other):
+        return _Scalar(int(other) - int(self), max(self.degree, _degree(other)))
+
+    def __mul__(self, other):
+        return _Scalar(int(self) * int(other), self.degree + _degree(other))
+
+    __rmul__ = __mul__
+
+    def __neg__(self):
+        return _Scalar(-int(self), self.degree)
+
+
+class _TrackedObject(FfObject[Dual]):
+    """A point or line of GF(p) that also tracks the degree of its coordinates."""
+
+    __slots__ = ("degree", "tracker")
+
+    degree: int
+    tracker: _DegreeTracker
+
+    def __init__(self, coord, modulus, degree=0, tracker=None) -> None:
+        super().__init__(coord, modulus)
+        self.degree = degree
+        self.tracker = tracker if tracker is not None else _DegreeTracker()
+
+    def _make(self, cls: type, coord, degree: int):
+        return cls(coord, self.modulus, degree, self.tracker)
+
+    def __eq__(self, other) -> bool:
+        self.tracker.record(self.degree + _degree(other))
+        return super().__eq__(other)
+
+    __hash__ = FfObject.__hash__
+
+    def aux(self) -> Dual:
+        return self._make(self.dual_type(), super().aux().coord, self.degree)
+
+    def dot(self, line) -> int:
+        value = dot(self.coord, line.coord) % self.modulus
+        return _Scalar(value, self.degree + _degree(line))
+
+    def parametrize(self, lambda_, pt_q, mu_):
+        degree = max(_degree(lambda_) + self.degree, _degree(mu_) + _degree(pt_q))
+        coord = plckr(int(lambda_), self.coord, int(mu_), pt_q.coord)
+        return self._make(type(self), coord, degree)
+
+    def incident(self, rhs) -> bool:
+        self.tracker.record(self.degree + _degree(rhs))
+        return super().incident(rhs)
+
+    def coincident(self, pt_q, pt_r) -> bool:
+        self.tracker.record(self.degree + _degree(pt_q) + _degree(pt_r))
+        return super().coincident(pt_q, pt_r)
+
+    def meet(self, rhs):
+        coord = cross(self.coord, rhs.coord)
+        return self._make(self.dual_type(), coord, self.degree + _degree(rhs))
+
+
+class _TrackedPoint(_TrackedObject["_TrackedLine"]):
+    __slots__ = ()
+
+    def dual_type(self) -> type:
+        return _TrackedLine
+
+
+class _TrackedLine(_TrackedObject[_TrackedPoint]):
+    __slots__ = ()
+
+    def dual_type(self) -> type:
+        return _TrackedPoint
+
+
+def verify(
+    construction: Callable[..., bool],
+    num_points: int,
+    num_scalars: int = 0,
+    trials: int = 32,
+    modulus: int = DEFAULT_MODULUS,
+    seed: Optional[int] = None,
+) -> VerifyResult:
+    """
+    The `verify` function evaluates a construction on random instances over GF(p).
+
+    :param construction: a function of `num_points` points followed by `num_scalars` scalars,
+        written against the `ProjectivePlane` API, that returns a boolean
+    :type construction: Callable[..., bool]
+    :param num_points: the number of random points passed to `construction`
+    :type num_points: int
+    :param num_scalars: the number of random scalars passed after the points
+    :type num_scalars: int
+    :param trials: the number of random instances
+    :type trials: int
+    :param modulus: a large prime p; the default is 2^61 - 1
+    :type modulus: int
+    :param seed: seed of the random number generator, for reproducible runs
+    :type seed: Optional[int]
+    :return: a `VerifyResult`. An `AssertionError` raised by the construction (for example
+        from a degenerate triangle) counts as a failed trial.
+
+    Examples:
+        >>> from projgeom.pg_plane import check_pappus, coincident
+        >>> def pappus(pt_a, pt_b, pt_d, pt_e, s, t, u, v):
+        ...     coline1 = [pt_a, pt_b, pt_a.parametrize(s, pt_b, t)]
+        ...     coline2 = [pt_d, pt_e, pt_d.parametrize(u, pt_e, v)]
+        ...     return check_pappus(coline1, coline2)
+        >>> result = verify(pappus, 4, 4, trials=10, seed=1)
+        >>> result.holds, result.degree
+        (True, 16)
+        >>> result.error_bound < 1e-150
+        True
+        >>> verify(coincident, 3, trials=10, seed=1).holds
+        False
+    """
+    rng = random.Random(seed)
+    failures = 0
+    max_degree = 0
+    counterexample = None
+    for _ in range(trials):
+        tracker = _DegreeTracker()
+        points = [
+            _TrackedPoint(
+                [rng.randrange(modulus) for _ in range(3)], modulus, 1, tracker
+            )
+            for _ in range(num_points)
+        ]
+        scalars = [_Scalar(rng.randrange(modulus), 1) for _ in range(num_scalars)]
+        try:
+            passed = bool(construction(*points, *scalars))
+        except AssertionError:
+            passed = False
+        max_degree = max(max_degree, tracker.total)
+        if not passed:
+            failures += 1
+            if counterexample is None:
+                counterexample = tuple(
+                    FfPoint(pt.coord, modulus) for pt in points
+                ) + tuple(int(s) for s in scalars)
+    error_bound = min(1.0, max_degree / modulus) ** trials
+    return VerifyResult(
+        failures == 0, trials, failures, max_degree, error_bound, counterexample
+    )
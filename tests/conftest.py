@@ -1,10 +1,26 @@
 """
-Dummy conftest.py for projgeom.
+conftest.py for projgeom.
 
-If you don't know what this is for, just leave it empty.
 Read more about conftest.py under:
 - https://docs.pytest.org/en/stable/fixture.html
 - https://docs.pytest.org/en/stable/writing_plugins.html
 """
 
-# import pytest
+import pytest
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_configure(config):
+    # Benchmarks only run once by default; time them with --benchmark-enable.
+    # This is set here rather than in setup.cfg's addopts so that pytest still
+    # runs when pytest-benchmark is not installed.
+    if config.pluginmanager.hasplugin("benchmark"):
+        config.option.benchmark_disable = True
+
+
+def pytest_ignore_collect(collection_path, config):
+    # Without the plugin there is no ``benchmark`` fixture to run them with.
+    if collection_path.name == "test_benchmark.py":
+        if not config.pluginmanager.hasplugin("benchmark"):
+            return True
+    return None
@@ -0,0 +1,177 @@
+"""
+Benchmarks for the primitives and theorem checkers (pytest-benchmark)
+
+Every benchmark is parametrized over the geometries and over coordinate
+magnitudes from small integers up to 1000-bit values. The normal test run
+only executes each benchmark once (see ``tests/conftest.py``); to time
+them, run:
+
+    pytest tests/test_benchmark.py --benchmark-enable --benchmark-group-by=group
+"""
+
+import random
+
+import pytest
+
+from projgeom.ck_plane import orthocenter, tri_altitude
+from projgeom.ell_object import EllipticPoint
+from projgeom.hyp_object import HyperbolicPoint
+from projgeom.myck_object import MyCKPoint
+from projgeom.persp_object import PerspPoint
+from projgeom.pg_object import PgPoint, cross, dot, plckr
+from projgeom.pg_plane import (
+    check_desargue,
+    check_pappus,
+    coincident,
+    harm_conj,
+    involution,
+)
+
+pytest.importorskip("pytest_benchmark")
+
+BITS = [8, 64, 256, 1000]
+PG_TYPES = [PgPoint, EllipticPoint, HyperbolicPoint, MyCKPoint, PerspPoint]
+CK_TYPES = [EllipticPoint, HyperbolicPoint, MyCKPoint, PerspPoint]
+
+bits = pytest.mark.parametrize("bits", BITS)
+pg_types = pytest.mark.parametrize("point_type", PG_TYPES, ids=lambda t: t.__name__)
+ck_types = pytest.mark.parametrize("point_type", CK_TYPES, ids=lambda t: t.__name__)
+
+
+def random_coords(num, bits, seed=0):
+    """Generate `num` random non-zero triplets of `bits`-bit integers"""
+    rng = random.Random(bits * 1000 + seed)
+    result = []
+    while len(result) < num:
+        vec = [rng.getrandbits(bits) * rng.choice([-1, 1]) for _ in range(3)]
+        if any(vec):
+            result.append(vec)
+    return result
+
+
+def random_points(point_type, num, bits):
+    return [point_type(c) for c in random_coords(num, bits)]
+
+
+@bits
+def test_dot(benchmark, bits):
+    vec_a, vec_b = random_coords(2, bits)
+    benchmark(dot, vec_a, vec_b)
+
+
+@bits
+def test_cross(benchmark, bits):
+    vec_a, vec_b = random_coords(2, bits)
+    benchmark(cross, vec_a, vec_b)
+
+
+@bits
+def test_plckr(benchmark, bits):
+    vec_a, vec_b = random_coords(2, bits)
+    lambda_, mu_ = random_coords(1, bits, seed=1)[0][:2]
+    benchmark(plckr, lambda_, vec_a, mu_, vec_b)
+
+
+@pg_types
+@bits
+def test_meet(benchmark, point_type, bits):
+    pt_a, pt_b = random_points(point_type, 2, bits)
+    benchmark(pt_a.meet, pt_b)
+
+
+@pg_types
+@bits
+def test_incident(benchmark, point_type, bits):
+    pt_a, pt_b, pt_c = random_points(point_type, 3, bits)
+    benchmark(pt_c.incident, pt_a.meet(pt_b))
+
+
+@pg_types
+@bits
+def test_aux(benchmark, point_type, bits):
+    (pt_a,) = random_points(point_type, 1, bits)
+    benchmark(pt_a.aux)
+
+
+@pg_types
+@bits
+def test_parametrize(benchmark, point_type, bits):
+    pt_a, pt_b = random_points(point_type, 2, bits)
+    lambda_, mu_ = random_coords(1, bits, seed=1)[0][:2]
+    benchmark(pt_a.parametrize, lambda_, pt_b, mu_)
+
+
+@pg_types
+@bits
+def test_eq(benchmark, point_type, bits):
+    (pt_a,) = random_points(point_type, 1, bits)
+    pt_b = point_type([3 * x for x in pt_a.coord])
+    assert benchmark(pt_a.__eq__, pt_b)
+
+
+@ck_types
+@bits
+def test_perp_point(benchmark, point_type, bits):
+    (pt_a,) = random_points(point_type, 1, bits)
+    benchmark(pt_a.perp)
+
+
+@ck_types
+@bits
+def test_perp_line(benchmark, point_type, bits):
+    pt_a, pt_b = random_points(point_type, 2, bits)
+    benchmark(pt_a.meet(pt_b).perp)
+
+
+@pg_types
+@bits
+def test_coincident(benchmark, point_type, bits):
+    pt_a, pt_b = random_points(point_type, 2, bits)
+    pt_c = pt_a.parametrize(3, pt_b, 5)
+    assert benchmark(coincident, pt_a, pt_b, pt_c)
+
+
+@pg_types
+@bits
+def test_check_pappus(benchmark, point_type, bits):
+    pt_a, pt_b, pt_d, pt_e = random_points(point_type, 4, bits)
+    coline1 = [pt_a, pt_b, pt_a.parametrize(3, pt_b, 5)]
+    coline2 = [pt_d, pt_e, pt_d.parametrize(7, pt_e, 2)]
+    assert benchmark(check_pappus, coline1, coline2)
+
+
+@pg_types
+@bits
+def test_check_desargue(benchmark, point_type, bits):
+    tri_1 = random_points(point_type, 3, bits)
+    tri_2 = random_points(point_type, 3, bits + 1)
+    assert benchmark(check_desargue, tri_1, tri_2)
+
+
+@pg_types
+@bits
+def test_harm_conj(benchmark, point_type, bits):
+    pt_a, pt_b = random_points(point_type, 2, bits)
+    pt_c = pt_a.parametrize(3, pt_b, 5)
+    benchmark(harm_conj, pt_a, pt_b, pt_c)
+
+
+@pg_types
+@bits
+def test_involution(benchmark, point_type, bits):
+    origin, pt_a, pt_b, pt_p = random_points(point_type, 4, bits)
+    benchmark(involution, origin, pt_a.meet(pt_b), pt_p)
+
+
+@ck_types
+@bits
+def test_orthocenter(benchmark, point_type, bits):
+    triangle = random_points(point_type, 3, bits)
+    benchmark(orthocenter, triangle)
+
+
+@ck_types
+@bits
+def test_tri_altitude(benchmark, point_type, bits):
+    triangle = random_points(point_type, 3, bits)
+    benchmark(tri_altitude, triangle)
@@ -0,0 +1,60 @@
+import doctest
+
+import numpy as np
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, sampled_from
+
+import projgeom.ck_array
+from projgeom.ck_array import orthocenter_array, tri_altitude_array
+from projgeom.ck_plane import orthocenter, tri_altitude
+from projgeom.conic_object import cayley_klein
+from projgeom.ell_object import EllipticPoint
+from projgeom.hyp_object import HyperbolicPoint
+from projgeom.myck_object import MyCKPoint
+from projgeom.persp_object import PerspPoint
+
+QuadPoint, QuadLine = cayley_klein("Quad", [[1, 0, 0], [0, 2, 1], [0, 1, -3]])
+
+POINT_TYPES = [EllipticPoint, HyperbolicPoint, MyCKPoint, PerspPoint, QuadPoint]
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.ck_array).failed == 0
+
+
+def check(point_type, triangles) -> None:
+    alts = tri_altitude_array(point_type, triangles)
+    centers = orthocenter_array(point_type, triangles)
+    assert alts.shape == (len(triangles), 3, 3)
+    assert centers.shape == (len(triangles), 3)
+    for k, tri in enumerate(np.asarray(triangles).tolist()):
+        triangle = [point_type(row) for row in tri]
+        expected = [alt.coord for alt in tri_altitude(triangle)]
+        assert [tuple(row) for row in alts[k].tolist()] == expected
+        assert tuple(centers[k].tolist()) == orthocenter(triangle).coord
+
+
+@pytest.mark.parametrize("point_type", POINT_TYPES)
+def test_matches_scalar(point_type) -> None:
+    rng = np.random.default_rng(0)
+    check(point_type, rng.integers(-(2**15), 2**15, size=(200, 3, 3)))
+
+
+@given(
+    sampled_from(POINT_TYPES),
+    lists(integers(-(2**40), 2**40), min_size=9, max_size=9),
+)
+def test_big_coordinates(point_type, coords) -> None:
+    triangles = np.array(coords, dtype=object).reshape(1, 3, 3)
+    triangles[0, 0, 0] *= 2**30
+    check(point_type, triangles)
+
+
+def test_shapes() -> None:
+    empty = np.zeros((0, 3, 3), dtype=int)
+    assert orthocenter_array(EllipticPoint, empty).shape == (0, 3)
+    with pytest.raises(ValueError):
+        orthocenter_array(EllipticPoint, np.zeros((4, 3)))
+    with pytest.raises(ValueError):
+        tri_altitude_array(EllipticPoint, np.zeros((4, 2, 3)))
@@ -0,0 +1,106 @@
+import doctest
+from itertools import combinations
+
+import numpy as np
+from hypothesis import given, settings
+from hypothesis.strategies import integers, lists, tuples
+
+import projgeom.collinear
+from projgeom.collinear import collinear_subsets, concurrent_bundles
+from projgeom.ell_object import EllipticLine, EllipticPoint
+from projgeom.pg_array import PgPointArray
+from projgeom.pg_object import PgLine, PgPoint
+
+small_points = lists(
+    tuples(integers(-3, 3), integers(-3, 3), integers(1, 2)),
+    min_size=0,
+    max_size=25,
+    unique_by=lambda c: PgPoint(list(c)).canonical_key(),
+)
+
+
+def brute_force(points, min_size=3):
+    """Maximal collinear subsets by testing all lines through pairs"""
+    result = {}
+    for pt_p, pt_q in combinations(points, 2):
+        line = pt_p.meet(pt_q)
+        if line not in result:
+            members = [i for i, pt in enumerate(points) if pt.incident(line)]
+            if len(members) >= min_size:
+                result[line] = members
+    return result
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.collinear).failed == 0
+
+
+@settings(deadline=None)
+@given(small_points)
+def test_matches_brute_force(coords) -> None:
+    points = [PgPoint(list(c)) for c in coords]
+    found = {line: indices.tolist() for line, indices in collinear_subsets(points)}
+    assert found == brute_force(points)
+
+
+@settings(deadline=None)
+@given(small_points, lists(tuples(integers(0, 24), integers(-3, 3)), max_size=10))
+def test_repeated_points(coords, repeats) -> None:
+    points = [PgPoint(list(c)) for c in coords]
+    copies = [(i, s) for i, s in repeats if i < len(points) and s != 0]
+    repeated = points + [PgPoint([s * x for x in coords[i]]) for i, s in copies]
+    original = list(range(len(points))) + [i for i, _ in copies]
+    found = {
+        line: sorted(original[i] for i in indices)
+        for line, indices in collinear_subsets(repeated)
+    }
+    expected = {
+        line: sorted(indices + [i for i, _ in copies if i in indices])
+        for line, indices in brute_force(points).items()
+    }
+    assert found == expected
+
+
+def test_streams_each_line_once() -> None:
+    # a 4 x 4 grid: 4 rows, 4 columns, 2 main diagonals, and 4 short diagonals of 3
+    pts = PgPointArray([[x, y, 1] for x in range(4) for y in range(4)])
+    subsets = list(collinear_subsets(pts))
+    lines = [line for line, _ in subsets]
+    assert len(lines) == len(set(lines)) == 14
+    assert all(isinstance(line, PgLine) for line in lines)
+    assert len(list(collinear_subsets(pts, min_size=4))) == 10
+
+
+def test_big_int_coordinates() -> None:
+    big = 2**70
+    points = [PgPoint([big * i, big + i, 1]) for i in range(5)]
+    points += [PgPoint([1, 2, 3]), PgPoint([big, 0, 1])]
+    ((line, indices),) = collinear_subsets(points)
+    assert indices.tolist() == [0, 1, 2, 3, 4]
+    assert all(points[i].incident(line) for i in indices)
+
+
+def test_concurrent_bundles_are_dual() -> None:
+    lines = [EllipticLine([1, i, i * i]) for i in range(4)]
+    lines += [EllipticLine([0, 1, -1]), EllipticLine([2, 0, 1])]
+    pt_p = lines[0].meet(lines[4])
+    lines.append(lines[0].parametrize(3, lines[4], 5))
+    bundles = list(concurrent_bundles(lines))
+    assert bundles[0][0] == pt_p
+    assert isinstance(bundles[0][0], EllipticPoint)
+    assert bundles[0][1].tolist() == [0, 4, 6]
+
+
+def test_repeated_point_is_reported_once() -> None:
+    pts = [PgPoint([1, 0, 1]), PgPoint([0, 1, 1]), PgPoint([2, 0, 2])]
+    pts += [PgPoint([1, 1, 2]), PgPoint([-1, 0, -1])]
+    ((line, indices),) = collinear_subsets(pts)
+    assert line == PgLine([1, 1, -1])
+    assert indices.tolist() == [0, 1, 2, 3, 4]
+    assert list(collinear_subsets(pts[:3])) == []
+
+
+def test_min_size() -> None:
+    pts = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1]])
+    assert len(list(collinear_subsets(pts, min_size=2))) == 3
+    assert list(collinear_subsets(pts)) == []
@@ -0,0 +1,101 @@
+import doctest
+import gc
+import pickle
+import weakref
+
+import numpy as np
+import pytest
+from hypothesis import assume, given
+from hypothesis.strategies import integers, sampled_from, tuples
+
+import projgeom.conic_object
+from projgeom.ck_plane import CayleyKleinPlane, orthocenter, tri_altitude
+from projgeom.conic_object import cayley_klein
+from projgeom.ell_object import EllipticPoint
+from projgeom.hyp_object import HyperbolicPoint
+from projgeom.myck_object import MyCKPoint
+from projgeom.pg_array import perp_array
+from projgeom.pg_plane import coincident
+from projgeom.pipeline import Pipeline
+from projgeom.transform import reflection
+
+QuadPoint, QuadLine = cayley_klein("Quad", [[1, 0, 0], [0, 2, 1], [0, 1, -3]])
+
+GEOMETRIES = [
+    (EllipticPoint, [[1, 0, 0], [0, 1, 0], [0, 0, 1]]),
+    (HyperbolicPoint, [[1, 0, 0], [0, 1, 0], [0, 0, -1]]),
+    (MyCKPoint, [[-2, 0, 0], [0, 1, 0], [0, 0, -2]]),
+]
+
+coords = tuples(integers(-100, 100), integers(-100, 100), integers(-100, 100))
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.conic_object).failed == 0
+
+
+@given(sampled_from(GEOMETRIES), coords, coords, coords)
+def test_matches_hand_written_geometries(geometry, c_a, c_b, c_c) -> None:
+    point_type, conic = geometry
+    Point, Line = cayley_klein("Test", conic)
+    triangle = [Point(list(c)) for c in (c_a, c_b, c_c)]
+    expected = [point_type(list(c)) for c in (c_a, c_b, c_c)]
+    assume(not coincident(*expected))
+    line_type = expected[0].dual_type()
+    assert triangle[0].perp().coord == expected[0].perp().coord
+    assert point_type(list(triangle[0].perp().perp().coord)) == (
+        expected[0].perp().perp()
+    )
+    assert point_type(list(orthocenter(triangle).coord)) == orthocenter(expected)
+    assert [line_type(list(alt.coord)) for alt in tri_altitude(triangle)] == (
+        tri_altitude(expected)
+    )
+
+
+def test_perp_array() -> None:
+    arr = np.random.default_rng(0).integers(-(2**40), 2**40, size=(50, 3))
+    arr = np.concatenate([arr, np.array([[2**70, 1, -1]], dtype=object)])
+    result = QuadLine.perp_array(arr)
+    assert result.dtype == object
+    expected = [QuadLine(row).perp().coord for row in arr.tolist()]
+    assert [tuple(row) for row in result.tolist()] == expected
+    np.testing.assert_array_equal(perp_array(QuadLine, arr), result)
+
+
+def test_generated_classes_are_not_pinned() -> None:
+    point_class, line_class = cayley_klein("Tmp", [[1, 0, 0], [0, 1, 0], [0, 0, -5]])
+    perp_array(point_class, np.array([[1, 2, 3]]))
+    perp_array(line_class, np.array([[1, 2, 3]]))
+    lines = list(Pipeline.from_objects([point_class([1, 2, 3])]).perp().objects())
+    assert lines == [point_class([1, 2, 3]).perp()]
+    refl = reflection(line_class([1, 2, 3]))
+    assert refl is reflection(line_class([2, 4, 6]))
+    ref = weakref.ref(point_class)
+    del point_class, line_class, lines, refl
+    gc.collect()
+    assert ref() is None
+
+
+def test_classes() -> None:
+    pt_p = QuadPoint([1, 2, 3])
+    assert isinstance(pt_p, CayleyKleinPlane)
+    assert type(pt_p.perp()) is QuadLine and type(pt_p.meet(pt_p)) is QuadLine
+    assert QuadLine.perp_matrix == ((7, 0, 0), (0, 3, 1), (0, 1, -2))
+    assert pickle.loads(pickle.dumps(pt_p)).coord == pt_p.coord
+    with pytest.raises(AttributeError):
+        pt_p.extra = 1
+
+
+def test_invalid_matrices() -> None:
+    with pytest.raises(ValueError):
+        cayley_klein("Bad", [[1, 0, 0], [0, 1, 0], [0, 0, 0]])
+    with pytest.raises(ValueError):
+        cayley_klein("Bad", [[1, 2, 0], [0, 1, 0], [0, 0, 1]])
+    with pytest.raises(ValueError):
+        cayley_klein("Bad", [[1, 0], [0, 1]])
+    Point, Line = cayley_klein(
+        "Degenerate",
+        [[0, 0, 0], [0, 1, 0], [0, 0, 1]],
+        [[1, 0, 0], [0, 0, 0], [0, 0, 0]],
+    )
+    assert Line([2, 3, 4]).perp() == Point([1, 0, 0])
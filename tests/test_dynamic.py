@@ -0,0 +1,152 @@
+import doctest
+
+import pytest
+from hypothesis import assume, given
+from hypothesis.strategies import integers, lists, tuples
+
+import projgeom.dynamic
+from projgeom.ck_plane import altitude, orthocenter
+from projgeom.dynamic import DynamicGraph
+from projgeom.hyp_object import HyperbolicPoint
+from projgeom.pg_object import PgPoint
+from projgeom.pg_plane import check_axiom, coincident, harm_conj
+
+coords = tuples(integers(-50, 50), integers(-50, 50), integers(1, 50))
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.dynamic).failed == 0
+
+
+def build_triangles(graph, count):
+    """`count` independent triangles, each with its orthocenter and an altitude."""
+    frees, outputs = [], []
+    for i in range(count):
+        tri = graph.frees(
+            [
+                HyperbolicPoint([1 + i, 3, 5]),
+                HyperbolicPoint([3, 1 + i, 4]),
+                HyperbolicPoint([5, 2, 1 + i]),
+            ]
+        )
+        frees.append(tri)
+        outputs.append((orthocenter(tri), altitude(tri[0], tri[1].meet(tri[2]))))
+    return frees, outputs
+
+
+def test_move_recomputes_only_dependents() -> None:
+    graph = DynamicGraph()
+    frees, outputs = build_triangles(graph, 200)
+    for pt_h, alt in outputs:
+        pt_h.value(), alt.value()
+    computed = graph.computed
+    graph.move(frees[17][0], HyperbolicPoint([2, 7, 3]))
+    assert [i for i, out in enumerate(outputs) if graph.is_dirty(out[0])] == [17]
+    for pt_h, alt in outputs:
+        pt_h.value(), alt.value()
+    # Only the nodes of triangle 17 that depend on its first vertex are recomputed.
+    assert graph.computed - computed == graph.invalidated
+    assert graph.invalidated < 20
+    tri = [
+        HyperbolicPoint([2, 7, 3]),
+        HyperbolicPoint([3, 18, 4]),
+        HyperbolicPoint([5, 2, 18]),
+    ]
+    assert outputs[17][0].value() == orthocenter(tri)
+    assert outputs[17][1].value() == altitude(tri[0], tri[1].meet(tri[2]))
+
+
+def test_move_all_recomputes_once() -> None:
+    graph = DynamicGraph()
+    (tri,), ((pt_h, _),) = build_triangles(graph, 1)
+    pt_h.value()
+    computed = graph.computed
+    new = [
+        HyperbolicPoint([2, 1, 7]),
+        HyperbolicPoint([1, 4, 9]),
+        HyperbolicPoint([6, 1, 8]),
+    ]
+    graph.move_all(zip(tri, new))
+    invalidated = graph.invalidated
+    # Moving the same points again before evaluating finds everything dirty already.
+    graph.move_all(zip(tri, new))
+    assert graph.invalidated == invalidated
+    assert pt_h.value() == orthocenter(new)
+    assert graph.computed - computed == invalidated
+
+
+@given(lists(coords, min_size=6, max_size=6))
+def test_agrees_with_scratch(rows) -> None:
+    pts = [PgPoint(list(c)) for c in rows]
+    assume(not coincident(*pts[:3]) and not coincident(*pts[3:]))
+    graph = DynamicGraph()
+    pt_a, pt_b, pt_c = graph.frees(pts[:3])
+    pt_m = pt_a.parametrize(2, pt_b, 3)
+    assume(pt_m.value() != pt_a.value() and pt_m.value() != pt_b.value())
+    pt_d = harm_conj(pt_a, pt_b, pt_m)
+    ln_l = pt_d.meet(pt_c)
+    assert ln_l.value() == harm_conj(
+        pts[0], pts[1], pts[0].parametrize(2, pts[1], 3)
+    ).meet(pts[2])
+    graph.move_all(zip([pt_a, pt_b, pt_c], pts[3:]))
+    pt_e = pts[3].parametrize(2, pts[4], 3)
+    assume(pt_e != pts[3] and pt_e != pts[4])
+    assert ln_l.value() == harm_conj(pts[3], pts[4], pt_e).meet(pts[5])
+
+
+def test_leaves_and_invalid_moves() -> None:
+    graph = DynamicGraph()
+    pt_p = PgPoint([1, 2, 3])
+    assert graph.leaf(pt_p) is graph.leaf(pt_p)
+    assert graph.free(pt_p) is not graph.free(pt_p)
+    fixed = graph.leaf(pt_p)
+    with pytest.raises(ValueError):
+        graph.move(fixed, PgPoint([1, 0, 0]))
+    pt_a = graph.free(pt_p)
+    with pytest.raises(ValueError):
+        graph.move(pt_a.meet(fixed), PgPoint([1, 0, 0]))
+    with pytest.raises(ValueError):
+        DynamicGraph().move(pt_a, PgPoint([1, 0, 0]))
+    with pytest.raises(TypeError):
+        graph.move(pt_a, pt_p.meet(PgPoint([1, 0, 0])))
+    assert pt_a.value() == pt_p
+
+
+def test_hash_survives_moves() -> None:
+    graph = DynamicGraph()
+    pt_a, pt_b = graph.frees([PgPoint([1, 2, 3]), PgPoint([4, 5, 6])])
+    ln_l = pt_a.meet(pt_b)
+    labels = {ln_l: "l"}
+    ln_l.value()
+    graph.move(pt_a, PgPoint([1, 0, 0]))
+    assert labels[ln_l] == "l"
+    assert graph.is_dirty(ln_l)  # hashing did not evaluate the moved node
+    assert ln_l == PgPoint([1, 0, 0]).meet(PgPoint([4, 5, 6]))
+
+
+def test_pg_plane_equality_checks() -> None:
+    graph = DynamicGraph()
+    pt_a, pt_b, pt_r = graph.frees(
+        [PgPoint([1, 2, 3]), PgPoint([4, 5, 6]), PgPoint([7, 8, 1])]
+    )
+    ln_l = pt_r.meet(pt_a)
+    pt_c = pt_a.parametrize(2, pt_b, 3)
+    pt_d = harm_conj(pt_a, pt_b, pt_c)
+    pt_e = harm_conj(pt_a, pt_b, pt_d)
+    check_axiom(pt_a, pt_b, ln_l)
+    assert pt_e == pt_c and pt_d != pt_c
+    graph.move(pt_a, PgPoint([3, 1, 2]))
+    check_axiom(pt_a, pt_b, ln_l)
+    assert pt_e == pt_c and pt_e == PgPoint([18, 17, 22])
+    assert pt_d == harm_conj(PgPoint([3, 1, 2]), PgPoint([4, 5, 6]), pt_c.value())
+
+
+def test_deep_chain() -> None:
+    graph = DynamicGraph()
+    pt_a, pt_b = graph.frees([PgPoint([1, 0, 1]), PgPoint([0, 1, 1])])
+    node = pt_a
+    for _ in range(5000):
+        node = node.parametrize(1, pt_b, 1)
+    assert node.value() == PgPoint([1, 5000, 5001])
+    graph.move(pt_a, PgPoint([2, 0, 1]))
+    assert node.value() == PgPoint([2, 5000, 5001])
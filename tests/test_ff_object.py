@@ -0,0 +1,113 @@
+import doctest
+from itertools import product
+
+import pytest
+from hypothesis import assume, given
+from hypothesis.strategies import integers, tuples
+
+import projgeom.ff_object
+from projgeom.ff_object import FfLine, FfObject, FfPoint, is_prime
+from projgeom.pg_plane import (
+    check_axiom,
+    check_desargue,
+    check_pappus,
+    coincident,
+    harm_conj,
+    involution,
+)
+
+P = 1000003
+coords = tuples(
+    integers(-(10**9), 10**9), integers(-(10**9), 10**9), integers(1, 10**9)
+)
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.ff_object).failed == 0
+
+
+def test_coordinates_stay_reduced() -> None:
+    pt_p = FfPoint([10**30, -(10**30), 7], P)
+    ln_l = pt_p.meet(FfPoint([3, 1, 4], P))
+    assert all(0 <= x < P for x in ln_l.coord)
+    assert ln_l.incident(pt_p)
+
+
+def test_aux_never_incident() -> None:
+    for coord in product(range(5), repeat=3):
+        if coord == (0, 0, 0):
+            continue
+        pt_p = FfPoint(list(coord), 5)
+        assert not pt_p.incident(pt_p.aux())
+
+
+def test_hashable_modular_equality() -> None:
+    pts = {FfPoint([1, 2, 3], 7), FfPoint([2, 4, 6], 7), FfPoint([8, 9, 10], 7)}
+    assert len(pts) == 1
+    assert FfPoint([1, 2, 3], 7) != FfLine([1, 2, 3], 7)
+
+
+def test_auto_normalize() -> None:
+    FfObject.auto_normalize = True
+    try:
+        assert FfPoint([3, 6, 2], 7).coord == (1, 2, 3)
+    finally:
+        FfObject.auto_normalize = False
+
+
+@given(coords, coords, coords, coords, integers(1, P - 1), integers(1, P - 1))
+def test_pg_plane_functions(c_a, c_b, c_d, c_e, s, t) -> None:
+    pt_a, pt_b, pt_d, pt_e = (FfPoint(list(c), P) for c in (c_a, c_b, c_d, c_e))
+    assume(pt_a != pt_b and pt_d != pt_e)
+    check_axiom(pt_a, pt_b, pt_d.meet(pt_e))
+    pt_c = pt_a.parametrize(s, pt_b, t)
+    pt_f = pt_d.parametrize(t, pt_e, s)
+    assert check_pappus([pt_a, pt_b, pt_c], [pt_d, pt_e, pt_f])
+    assume(not coincident(pt_a, pt_b, pt_d) and not coincident(pt_a, pt_b, pt_e))
+    assume(not coincident(pt_d, pt_e, pt_a))
+    assert check_desargue([pt_a, pt_b, pt_d], [pt_a, pt_e, pt_c])
+    assume(pt_c != pt_a and pt_c != pt_b)
+    pt_h = harm_conj(pt_a, pt_b, pt_c)
+    assert harm_conj(pt_a, pt_b, pt_h) == pt_c
+    mirror = pt_d.meet(pt_e)
+    assume(not mirror.incident(pt_a))
+    pt_q = involution(pt_a, mirror, pt_b)
+    assert involution(pt_a, mirror, pt_q) == pt_b
+
+
+@given(coords, coords, coords)
+def test_coincident_matches_meet(c_a, c_b, c_c) -> None:
+    pt_a, pt_b, pt_c = (FfPoint(list(c), P) for c in (c_a, c_b, c_c))
+    assert pt_a.coincident(pt_b, pt_c) == pt_a.meet(pt_b).incident(pt_c)
+
+
+def test_immutable() -> None:
+    pt_p = FfPoint([1, 2, 3], 7)
+    with pytest.raises(AttributeError):
+        pt_p.modulus = 11
+    with pytest.raises(AttributeError):
+        pt_p.coord = (1, 1, 1)
+    assert pt_p.modulus == 7 and pt_p.coord == (1, 2, 3)
+
+
+def test_zero_vector() -> None:
+    pt_z = FfPoint([7, 14, 0], 7)
+    assert pt_z == FfPoint([1, 2, 3], 7)
+    with pytest.raises(ValueError):
+        hash(pt_z)
+    pt_p, pt_q = FfPoint([1, 2, 3], 7), FfPoint([2, 4, 6], 7)
+    hash(pt_p)
+    assert pt_p == pt_q and pt_q == pt_p
+
+
+@given(integers(-10, 10**5))
+def test_is_prime_matches_trial_division(num) -> None:
+    expected = num > 1 and all(num % d for d in range(2, int(num**0.5) + 1))
+    assert is_prime(num) == expected
+
+
+def test_modulus_must_be_prime() -> None:
+    for modulus in (0, 1, 4, 9, 561, 2**61 + 1):
+        with pytest.raises(ValueError):
+            FfPoint([1, 2, 3], modulus)
+    assert FfPoint([1, 2, 3], 2**61 - 1).modulus == 2**61 - 1
@@ -0,0 +1,81 @@
+import doctest
+from itertools import combinations
+
+import pytest
+
+import projgeom.ff_table
+from projgeom.ff_object import FfLine, FfPoint
+from projgeom.ff_table import ZERO, FfTable, FfTableLine, FfTablePoint
+from projgeom.pg_plane import check_desargue, check_pappus, coincident, harm_conj
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.ff_table).failed == 0
+
+
+@pytest.mark.parametrize("modulus", [2, 3, 5, 7])
+def test_table_matches_arithmetic(modulus) -> None:
+    plane = FfTable(modulus)
+    assert plane.table.shape == (modulus**2 + modulus + 1, modulus + 1)
+    coords = plane.coords.tolist()
+    assert [plane.index(c) for c in coords] == list(range(plane.size))
+    for i, c_i in enumerate(coords):
+        pt_p = FfPoint(c_i, modulus)
+        on_line = [
+            j for j, c_j in enumerate(coords) if pt_p.incident(FfLine(c_j, modulus))
+        ]
+        assert plane.lines_through(i).tolist() == on_line
+        assert all(plane.incident(j, i) for j in on_line)
+    for i, j in combinations(range(plane.size), 2):
+        expected = FfPoint(coords[i], modulus).meet(FfPoint(coords[j], modulus))
+        assert plane.meet(i, j) == plane.index(expected.coord)
+
+
+def test_zero_vector() -> None:
+    plane = FfTable(3)
+    assert plane.meet(4, 4) == ZERO
+    assert plane.index([3, 0, 6]) == ZERO
+    assert plane.incident(ZERO, 5) and plane.incident(5, ZERO)
+    assert plane.point(4).meet(plane.point(4)) == plane.line(7)
+    assert len({plane.point(4), plane.point(4), plane.point(5)}) == 2
+    with pytest.raises(ValueError):
+        hash(plane.point(4).meet(plane.point(4)))
+
+
+def test_pg_plane_functions() -> None:
+    plane = FfTable(11)
+    pt_a, pt_b, pt_d, pt_e = (plane.point(i) for i in (3, 50, 77, 101))
+    pt_c = pt_a.parametrize(2, pt_b, 5)
+    pt_f = pt_d.parametrize(7, pt_e, 3)
+    assert isinstance(pt_a.meet(pt_b), FfTableLine)
+    assert isinstance(pt_a.meet(pt_b).aux(), FfTablePoint)
+    assert coincident(pt_a, pt_b, pt_c)
+    assert check_pappus([pt_a, pt_b, pt_c], [pt_d, pt_e, pt_f])
+    assert harm_conj(pt_a, pt_b, harm_conj(pt_a, pt_b, pt_c)) == pt_c
+
+
+def test_desargue_sweep_matches_arithmetic() -> None:
+    plane = FfTable(3)
+    pts = plane.points()
+    triangles = [tri for tri in combinations(pts, 3) if not coincident(*tri)][:40]
+    for tri_1 in triangles[:8]:
+        for tri_2 in triangles:
+            ff_1 = [FfPoint(pt.coord, 3) for pt in tri_1]
+            ff_2 = [FfPoint(pt.coord, 3) for pt in tri_2]
+            assert check_desargue(list(tri_1), list(tri_2)) == check_desargue(
+                ff_1, ff_2
+            )
+
+
+def test_table_is_built_in_blocks(monkeypatch) -> None:
+    expected = FfTable(7).table
+    monkeypatch.setattr(projgeom.ff_table, "_BLOCK_SIZE", 20)
+    plane = FfTable(7)
+    assert plane.table.dtype == expected.dtype
+    assert (plane.table == expected).all()
+
+
+@pytest.mark.parametrize("modulus", [0, 1, 4, 6, 9])
+def test_modulus_must_be_prime(modulus) -> None:
+    with pytest.raises(ValueError):
+        FfTable(modulus)
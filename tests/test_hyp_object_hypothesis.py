@@ -68,7 +68,7 @@ def test_hyperbolic_line_perp_returns_point(line):
 def test_hyperbolic_point_perp_coordinates(point):
     """Test that perp transforms coordinates correctly for hyperbolic points"""
     line = point.perp()
-    expected_coords = [point.coord[0], point.coord[1], -point.coord[2]]
+    expected_coords = (point.coord[0], point.coord[1], -point.coord[2])
     assert line.coord == expected_coords
 
 
@@ -76,7 +76,7 @@ def test_hyperbolic_point_perp_coordinates(point):
 def test_hyperbolic_line_perp_coordinates(line):
     """Test that perp transforms coordinates correctly for hyperbolic lines"""
     point = line.perp()
-    expected_coords = [line.coord[0], line.coord[1], -line.coord[2]]
+    expected_coords = (line.coord[0], line.coord[1], -line.coord[2])
     assert point.coord == expected_coords
 
 
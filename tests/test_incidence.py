@@ -0,0 +1,41 @@
+import doctest
+
+import numpy as np
+from hypothesis import given
+from hypothesis.strategies import integers, lists, tuples
+
+import projgeom.incidence
+from projgeom.incidence import incidence_matrix, incidence_pairs
+from projgeom.pg_array import PgPointArray
+from projgeom.pg_object import PgLine, PgPoint
+
+triplets = lists(
+    tuples(integers(-3, 3), integers(-3, 3), integers(-3, 3)), min_size=0, max_size=12
+)
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.incidence).failed == 0
+
+
+@given(triplets, triplets, integers(1, 5))
+def test_matches_scalar_incident(pt_rows, ln_rows, block_size) -> None:
+    points = [PgPoint(row) for row in pt_rows]
+    lines = [PgLine(row) for row in ln_rows]
+    expected = np.array(
+        [[pt.incident(ln) for ln in lines] for pt in points], dtype=bool
+    ).reshape(len(points), len(lines))
+    dense = incidence_matrix(points, lines, block_size=block_size)
+    assert np.array_equal(dense, expected)
+    pairs = incidence_pairs(points, lines, block_size=block_size)
+    assert sorted(map(tuple, pairs.tolist())) == sorted(zip(*np.nonzero(expected)))
+
+
+def test_big_int_coordinates() -> None:
+    big = 2**100
+    points = PgPointArray([[big, 1, 0], [1, 2, 3], [0, 0, 1]])
+    lines = [PgLine([1, -big, 0]), PgLine([1, 1, -1]), PgPoint([0, 0, 1]).aux()]
+    expected = [[pt.incident(ln) for ln in lines] for pt in points]
+    assert expected[0] == [True, False, True]
+    assert incidence_matrix(points, lines).tolist() == expected
+    assert incidence_pairs(points, lines).tolist() == [[0, 0], [0, 2], [1, 1], [2, 0]]
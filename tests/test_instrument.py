@@ -0,0 +1,126 @@
+import doctest
+import sys
+
+import pytest
+
+import projgeom.instrument
+from projgeom.ck_plane import orthocenter
+from projgeom.conic_object import cayley_klein
+from projgeom.ff_object import FfPoint
+from projgeom.instrument import Instrument
+from projgeom.myck_object import MyCKPoint
+from projgeom.pg_object import PgLine, PgPoint
+from projgeom.pg_plane import harm_conj, involution
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.instrument).failed == 0
+
+
+def test_counts_and_bits() -> None:
+    pt_p, pt_q = PgPoint([1, 2, 3]), PgPoint([4, 5, 6])
+    with Instrument() as inst:
+        ln_l = pt_p.meet(pt_q)
+        for _ in range(3):
+            ln_l.dot(PgPoint([2**40, 0, 1]))
+        pt_p.parametrize(2**20, pt_q, 1)
+    stats = inst.snapshot()
+    assert stats[PgPoint, "meet"].calls == 1
+    assert stats[PgPoint, "meet"].max_bits == 3  # (-3, 6, -3)
+    assert stats[PgLine, "dot"].calls == 3
+    assert stats[PgLine, "dot"].max_bits == 42
+    assert stats[PgPoint, "parametrize"].max_bits == 22
+    assert stats[PgPoint, "meet"].seconds > 0
+
+
+def test_functions_and_nested_calls() -> None:
+    origin, mirror = PgPoint([0, 0, 1]), PgLine([0, 1, 1])
+    with Instrument() as inst:
+        involution(origin, mirror, PgPoint([1, 2, 1]))
+        harm_conj(PgPoint([1, 0, 0]), PgPoint([0, 1, 0]), PgPoint([1, 1, 0]))
+        assert FfPoint([1, 2, 3], 7) == FfPoint([2, 4, 6], 7)
+    stats = inst.snapshot()
+    assert stats[PgPoint, "involution"].calls == 1
+    assert stats[PgPoint, "harm_conj"].calls == 2
+    assert stats[FfPoint, "__eq__"].calls == 1
+
+
+class _SuperPoint(PgPoint):
+    __slots__ = ()
+
+    def meet(self, rhs):
+        return super().meet(rhs)
+
+
+class _NestedPoint(PgPoint):
+    __slots__ = ()
+
+    def meet(self, rhs):
+        if self.coord[0] > 1:
+            # the same operation on another object of the same class
+            _NestedPoint([self.coord[0] - 1, 0, 1]).meet(rhs)
+        # the same operation on an object of another class
+        return PgPoint(self.coord).meet(rhs)
+
+
+def test_nested_same_name_calls() -> None:
+    pt_q = PgPoint([0, 1, 0])
+    with Instrument() as inst:
+        _SuperPoint([1, 2, 3]).meet(pt_q)
+        _NestedPoint([3, 0, 1]).meet(pt_q)
+    stats = inst.snapshot()
+    # A call through super() on the same object is one call ...
+    assert stats[_SuperPoint, "meet"].calls == 1
+    # ... but nested calls on other objects are all counted.
+    assert stats[_NestedPoint, "meet"].calls == 3
+    assert stats[PgPoint, "meet"].calls == 3
+
+
+def test_classes_made_inside_the_block() -> None:
+    with Instrument() as inst:
+        point_1, _ = cayley_klein("Tmp", [[1, 0, 0], [0, 1, 0], [0, 0, -5]])
+        point_2, _ = cayley_klein("Tmp", [[1, 0, 0], [0, 2, 0], [0, 0, -1]])
+
+        class _LatePoint(PgPoint):
+            __slots__ = ()
+
+            def meet(self, rhs):
+                return PgPoint(self.coord).meet(rhs)
+
+        orthocenter([point_1([1, 3, 5]), point_1([3, 1, 4]), point_1([5, 2, 1])])
+        point_2([1, 2, 3]).perp()
+        _LatePoint([1, 2, 3]).meet(PgPoint([4, 5, 6]))
+    stats = inst.snapshot()
+    assert point_1.__name__ == point_2.__name__
+    assert stats[point_1, "orthocenter"].calls == 1
+    assert stats[point_1, "meet"].calls == 4
+    assert stats[point_2, "perp"].calls == 1
+    assert stats[_LatePoint, "meet"].calls == 1
+    assert stats[PgPoint, "meet"].calls == 1
+
+
+def test_accumulate_reset_and_report() -> None:
+    triangle = [MyCKPoint([1, 3, 5]), MyCKPoint([3, 1, 4]), MyCKPoint([5, 2, 1])]
+    inst = Instrument()
+    with inst:
+        orthocenter(triangle)
+    with inst:
+        orthocenter(triangle)
+    assert inst.snapshot()[MyCKPoint, "orthocenter"].calls == 2
+    assert "orthocenter" in inst.report().splitlines()[1]
+    inst.reset()
+    assert inst.snapshot() == {}
+
+
+def test_disabled_and_restored() -> None:
+    previous = sys.getprofile()
+    with pytest.raises(ZeroDivisionError):
+        with Instrument():
+            with pytest.raises(RuntimeError):
+                with Instrument():
+                    pass
+            raise ZeroDivisionError
+    assert sys.getprofile() is previous
+    inst = Instrument()
+    PgPoint([1, 2, 3]).meet(PgPoint([4, 5, 6]))
+    assert inst.snapshot() == {}
@@ -0,0 +1,132 @@
+import doctest
+
+from hypothesis import assume, given
+from hypothesis.strategies import integers, tuples
+
+import projgeom.lazy
+from projgeom.ck_plane import orthocenter, tri_altitude
+from projgeom.lazy import LazyGraph, LazyObject
+from projgeom.myck_object import MyCKPoint
+from projgeom.pg_object import PgLine, PgPoint
+from projgeom.pg_plane import (
+    check_axiom,
+    check_pappus,
+    coincident,
+    harm_conj,
+    involution,
+)
+
+coords = tuples(integers(-50, 50), integers(-50, 50), integers(-50, 50))
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.lazy).failed == 0
+
+
+def test_nothing_is_computed_until_requested() -> None:
+    graph = LazyGraph()
+    pt_a, pt_b, pt_c = graph.leaves(
+        [PgPoint([1, 2, 3]), PgPoint([4, 5, 6]), PgPoint([7, 8, 1])]
+    )
+    ln_l = pt_a.meet(pt_b)
+    pt_d = ln_l.aux().meet(pt_c)
+    scalar = ln_l.dot(pt_c)
+    pt_e = pt_a.parametrize(scalar, pt_b, -scalar)
+    assert graph.computed == 0
+    assert isinstance(pt_e, LazyObject)
+    assert (
+        pt_e.coord
+        == PgPoint([1, 2, 3])
+        .parametrize(int(scalar), PgPoint([4, 5, 6]), -int(scalar))
+        .coord
+    )
+    assert pt_d.value() == PgPoint([1, 2, 3]).meet(PgPoint([4, 5, 6])).aux().meet(
+        PgPoint([7, 8, 1])
+    )
+
+
+def test_shared_subexpressions_are_evaluated_once() -> None:
+    graph = LazyGraph()
+    pt_a, pt_b = graph.leaves([PgPoint([1, 2, 3]), PgPoint([4, 5, 6])])
+    ln_1 = pt_a.meet(pt_b)
+    ln_2 = pt_a.meet(pt_b)
+    ln_3 = pt_b.meet(pt_a)
+    assert ln_1 is ln_2
+    assert ln_1 == ln_3
+    assert ln_3.value().coord == PgPoint([4, 5, 6]).meet(PgPoint([1, 2, 3])).coord
+    # the swapped meet is a negation of the first one
+    assert graph.computed == 2
+    assert graph.reused == 1
+    ln_1.value()
+    assert graph.computed == 2
+
+
+def test_leaf_and_const_are_interned() -> None:
+    graph = LazyGraph()
+    pt_p = PgPoint([1, 2, 3])
+    assert graph.leaf(pt_p) is graph.leaf(pt_p)
+    assert graph.const(5) is graph.const(5)
+    assert len(graph) == 2
+
+
+def test_deep_chain() -> None:
+    graph = LazyGraph()
+    pt_a, pt_b = graph.leaves([PgPoint([1, 0, 0]), PgPoint([0, 1, 0])])
+    pt_p = pt_a
+    for i in range(5000):
+        pt_p = pt_p.parametrize(1, pt_b, i % 3)
+    assert pt_p.coord == (1, sum(i % 3 for i in range(5000)), 0)
+
+
+def test_value_equality_and_node_hash() -> None:
+    graph = LazyGraph()
+    pt_a, pt_b = graph.leaves([PgPoint([1, 2, 3]), PgPoint([2, 4, 6])])
+    ln_l = pt_a.meet(pt_b)
+    nodes = {pt_a, pt_b, ln_l, pt_a.meet(pt_b)}
+    assert len(nodes) == 3
+    assert graph.computed == 0  # hashing does not evaluate
+    assert pt_a == pt_b and not pt_a != pt_b
+    assert ln_l == PgLine([0, 0, 0])
+
+
+def test_pg_plane_equality_checks() -> None:
+    objs = [PgPoint([1, 2, 3]), PgPoint([4, 5, 6]), PgPoint([7, 8, 1])]
+    graph = LazyGraph()
+    pt_a, pt_b, pt_r = graph.leaves(objs)
+    check_axiom(pt_a, pt_b, pt_r.meet(pt_a))
+    pt_c = pt_a.parametrize(2, pt_b, 3)
+    pt_d = harm_conj(pt_a, pt_b, pt_c)
+    assert pt_d == harm_conj(objs[0], objs[1], pt_c.value())
+    assert harm_conj(pt_a, pt_b, pt_d) == pt_c
+    assert harm_conj(pt_a, pt_b, pt_d) == PgPoint([14, 19, 24])
+    assert pt_d != pt_c
+
+
+@given(coords, coords, coords, coords, integers(1, 9), integers(1, 9))
+def test_pg_plane_functions_agree(c_a, c_b, c_d, c_e, s, t) -> None:
+    objs = [PgPoint(list(c)) for c in (c_a, c_b, c_d, c_e)]
+    assume(objs[0] != objs[1] and objs[2] != objs[3])
+    graph = LazyGraph()
+    pt_a, pt_b, pt_d, pt_e = graph.leaves(objs)
+    pt_c = pt_a.parametrize(s, pt_b, t)
+    pt_f = pt_d.parametrize(t, pt_e, s)
+    assert check_pappus([pt_a, pt_b, pt_c], [pt_d, pt_e, pt_f])
+    assert coincident(pt_a, pt_b, pt_c)
+    assume(pt_c != pt_a and pt_c != pt_b)
+    eager_c = objs[0].parametrize(s, objs[1], t)
+    assert harm_conj(pt_a, pt_b, pt_c) == harm_conj(objs[0], objs[1], eager_c)
+    mirror = pt_d.meet(pt_e)
+    assume(not mirror.incident(pt_a))
+    pt_q = involution(pt_a, mirror, pt_b)
+    assert pt_q == involution(objs[0], mirror.value(), objs[1])
+
+
+def test_ck_plane_functions_agree() -> None:
+    objs = [MyCKPoint([1, 3, 5]), MyCKPoint([3, 1, 4]), MyCKPoint([5, 2, 1])]
+    graph = LazyGraph()
+    triangle = graph.leaves(objs)
+    altitudes = tri_altitude(triangle)
+    pt_h = orthocenter(triangle)
+    assert [alt.value() for alt in altitudes] == tri_altitude(objs)
+    assert pt_h == orthocenter(objs)
+    assert all(pt_h.incident(alt) for alt in altitudes)
@@ -5,11 +5,11 @@ def test_myck_point() -> None:
     pt_p = MyCKPoint([1, 2, 3])
     ln_l = pt_p.dual_type()([4, 5, 6])
     assert isinstance(ln_l, MyCKLine)
-    assert pt_p.perp().coord == [-2, 2, -6]
+    assert pt_p.perp().coord == (-2, 2, -6)
 
 
 def test_myck_line() -> None:
     ln_l = MyCKLine([1, 2, 3])
     pt_p = ln_l.dual_type()([4, 5, 6])
     assert isinstance(pt_p, MyCKPoint)
-    assert ln_l.perp().coord == [-1, 4, -3]
+    assert ln_l.perp().coord == (-1, 4, -3)
@@ -0,0 +1,133 @@
+import doctest
+from itertools import islice
+
+import pytest
+from hypothesis import assume, given, settings
+from hypothesis.strategies import integers, tuples
+
+import projgeom.orbit
+from projgeom.ck_plane import reflect
+from projgeom.ell_object import EllipticLine, EllipticPoint
+from projgeom.hyp_object import HyperbolicLine, HyperbolicPoint
+from projgeom.orbit import orbit, orbit_levels
+from projgeom.transform import Collineation
+
+coords = tuples(integers(-20, 20), integers(-20, 20), integers(1, 20))
+
+# Reflections in the coordinate planes and in x = y, x = z and y = z: the
+# symmetry group of the cube.
+CUBE_MIRRORS = [
+    EllipticLine(c)
+    for c in ([1, 0, 0], [0, 1, 0], [0, 0, 1], [1, -1, 0], [1, 0, -1], [0, 1, -1])
+]
+HYP_MIRRORS = [
+    HyperbolicLine([1, 0, 0]),
+    HyperbolicLine([0, 1, 0]),
+    HyperbolicLine([1, 1, 2]),
+]
+
+
+def naive_reflect(mirror, obj):
+    """The scalar reflect(), which gives the zero vector for the pole, a fixed point."""
+    image = reflect(mirror, obj)
+    return obj if not any(image.coord) else image
+
+
+def naive_orbit(mirrors, seed, max_depth):
+    """Breadth first search with the scalar reflect()."""
+    found = [seed]
+    frontier = [seed]
+    for _ in range(max_depth):
+        frontier = [
+            naive_reflect(mirror, obj) for obj in frontier for mirror in mirrors
+        ]
+        frontier = [obj for obj in dict.fromkeys(frontier) if obj not in found]
+        found.extend(frontier)
+    return found
+
+
+def naive_images(mirrors, seed, max_depth):
+    """The images of `seed` under all words of length <= max_depth, in a fixed order."""
+    images = [seed]
+    frontier = [seed]
+    for _ in range(max_depth):
+        frontier = [
+            naive_reflect(mirror, obj) for obj in frontier for mirror in mirrors
+        ]
+        images.extend(frontier)
+    return images
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.orbit).failed == 0
+
+
+@given(coords)
+def test_cube_group(coord) -> None:
+    pts = list(orbit(CUBE_MIRRORS, EllipticPoint(list(coord))))
+    # The group has 48 elements, one of which (-I) fixes every projective point.
+    assert 24 % len(pts) == 0
+    assert len(set(pts)) == len(pts)
+    for pt in pts:
+        assert all(reflect(mirror, pt) in pts for mirror in CUBE_MIRRORS)
+
+
+@settings(max_examples=20)
+@given(coords)
+def test_matches_naive_bfs(coord) -> None:
+    seed = HyperbolicPoint(list(coord))
+    assume(all(seed != mirror.perp() for mirror in HYP_MIRRORS))
+    pts = list(orbit(HYP_MIRRORS, seed, max_depth=5))
+    assert set(pts) == set(naive_orbit(HYP_MIRRORS, seed, 5))
+    assert len(pts) == len(set(pts))
+
+
+def test_lines_and_triangles() -> None:
+    lines = list(orbit(HYP_MIRRORS, HyperbolicLine([1, 2, 7]), max_depth=4))
+    assert all(type(ln) is HyperbolicLine for ln in lines)
+    duals = [Collineation.from_reflection(mirror).dual() for mirror in HYP_MIRRORS]
+    expected = {HyperbolicLine([1, 2, 7])}
+    for _ in range(4):
+        expected |= {trans(ln) for ln in expected for trans in duals}
+    assert set(lines) == expected
+    triangle = (
+        HyperbolicPoint([0, 0, 1]),
+        HyperbolicPoint([1, 0, 2]),
+        HyperbolicPoint([1, 1, 3]),
+    )
+    tris = list(orbit(HYP_MIRRORS, triangle, max_depth=4))
+    keys = [frozenset(tri) for tri in tris]
+    assert len(set(keys)) == len(keys)
+    images = [naive_images(HYP_MIRRORS, pt, 4) for pt in triangle]
+    assert set(keys) == {frozenset(tri) for tri in zip(*images)}
+
+
+def test_limits_and_streaming() -> None:
+    seed = HyperbolicPoint([1, 2, 5])
+    assert len(list(orbit(HYP_MIRRORS, seed, max_size=10))) == 10
+    assert len(list(orbit(HYP_MIRRORS, seed, max_depth=0))) == 1
+    # The group is infinite: without limits, the orbit can still be consumed lazily.
+    assert len(list(islice(orbit(HYP_MIRRORS, seed), 500))) == 500
+    depths = [depth for depth, _ in orbit_levels(HYP_MIRRORS, seed, max_depth=12)]
+    assert depths == list(range(13))
+
+
+def test_big_coordinates() -> None:
+    seed = HyperbolicPoint([2**62 + 1, 3, 2**62 + 7])
+    levels = list(orbit_levels(HYP_MIRRORS, seed, max_depth=3))
+    assert levels[-1][1].dtype == object  # the products outgrow int64 and stay exact
+    pts = list(orbit(HYP_MIRRORS, seed, max_depth=3))
+    assert set(pts) == set(naive_orbit(HYP_MIRRORS, seed, 3))
+
+
+def test_invalid() -> None:
+    with pytest.raises(ValueError):
+        next(orbit([], HyperbolicPoint([1, 2, 5])))
+    with pytest.raises(ValueError):
+        next(orbit(HYP_MIRRORS, []))
+    with pytest.raises(TypeError):
+        next(orbit(HYP_MIRRORS + [EllipticLine([1, 0, 0])], HyperbolicPoint([1, 2, 5])))
+    with pytest.raises(TypeError):
+        next(
+            orbit(HYP_MIRRORS, [HyperbolicPoint([1, 2, 5]), HyperbolicLine([1, 0, 0])])
+        )
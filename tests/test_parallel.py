@@ -0,0 +1,91 @@
+import doctest
+import random
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import projgeom.parallel
+from projgeom.parallel import count_results, run_batch
+from projgeom.pg_object import PgPoint
+from projgeom.pg_plane import (
+    check_desargue,
+    check_pappus,
+    coincident,
+    harm_conj,
+    persp,
+)
+
+
+def random_point(rng):
+    return PgPoint([rng.randint(-20, 20), rng.randint(-20, 20), rng.randint(1, 20)])
+
+
+def random_triangle(rng):
+    while True:
+        triangle = [random_point(rng) for _ in range(3)]
+        if not coincident(*triangle):
+            return triangle
+
+
+def desargue_configs(num, seed=0):
+    rng = random.Random(seed)
+    for _ in range(num):
+        yield random_triangle(rng), random_triangle(rng)
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.parallel).failed == 0
+
+
+def test_ordered_matches_serial() -> None:
+    configs = list(desargue_configs(300))
+    expected = [persp(*config) for config in configs]
+    result = list(run_batch(persp, configs, chunk_size=16, max_workers=2))
+    assert result == expected
+
+
+def test_unordered_is_a_permutation() -> None:
+    configs = list(desargue_configs(200, seed=1))
+    expected = Counter(check_desargue(*config) for config in configs)
+    result = run_batch(
+        check_desargue, configs, chunk_size=7, max_workers=2, ordered=False
+    )
+    assert Counter(result) == expected
+
+
+def test_count_results() -> None:
+    rng = random.Random(2)
+    configs = []
+    for _ in range(100):
+        pt_a, pt_b, pt_d, pt_e = (random_point(rng) for _ in range(4))
+        coline1 = [pt_a, pt_b, pt_a.parametrize(2, pt_b, 3)]
+        configs.append((coline1, [pt_d, pt_e, pt_d.parametrize(1, pt_e, 4)]))
+    counts = count_results(check_pappus, configs, chunk_size=9, max_workers=2)
+    assert counts == Counter({True: 100})
+
+
+def test_stream_is_consumed_lazily() -> None:
+    consumed = []
+
+    def stream():
+        for i, config in enumerate(desargue_configs(1000, seed=3)):
+            consumed.append(i)
+            yield config
+
+    with ThreadPoolExecutor(2) as pool:
+        results = run_batch(
+            persp, stream(), chunk_size=10, max_pending=2, executor=pool
+        )
+        next(results)
+        assert len(consumed) <= 40
+        results.close()
+
+
+def test_exceptions_propagate() -> None:
+    pt_a, pt_b = PgPoint([1, 0, 0]), PgPoint([0, 1, 0])
+    configs = [(pt_a, pt_b, PgPoint([1, 1, 0])), (pt_a, pt_b, PgPoint([0, 0, 1]))]
+    with pytest.raises(AssertionError):
+        list(run_batch(harm_conj, configs, chunk_size=1, max_workers=2))
+    with pytest.raises(ValueError):
+        list(run_batch(harm_conj, configs, chunk_size=0))
@@ -22,6 +22,6 @@ def test_persp_line() -> None:
 
 
 def test_constants() -> None:
-    assert I_RE.coord == [0, 1, 1]
-    assert I_IM.coord == [1, 0, 0]
-    assert L_INF.coord == [0, -1, 1]
+    assert I_RE.coord == (0, 1, 1)
+    assert I_IM.coord == (1, 0, 0)
+    assert L_INF.coord == (0, -1, 1)
@@ -0,0 +1,126 @@
+import doctest
+
+import numpy as np
+from hypothesis import given
+from hypothesis.strategies import integers, lists, tuples
+
+import projgeom.pg_array
+from projgeom.pg_array import PgLineArray, PgPointArray, coincident_array, det_array
+from projgeom.pg_object import PgLine, PgPoint, det
+
+triplets = lists(
+    tuples(integers(-1000, 1000), integers(-1000, 1000), integers(-1000, 1000)),
+    min_size=1,
+    max_size=20,
+)
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.pg_array).failed == 0
+
+
+def test_meet_is_dual() -> None:
+    pts = PgPointArray([[1, 2, 3], [4, 5, 6]])
+    lns = pts.meet(PgPointArray([[4, 5, 6], [0, 0, 1]]))
+    assert isinstance(lns, PgLineArray)
+    assert isinstance(lns.meet(lns), PgPointArray)
+    assert lns[0] == PgLine([-3, 6, -3])
+
+
+def test_from_objects_roundtrip() -> None:
+    objs = [PgPoint([1, 2, 3]), PgPoint([4, 5, 6])]
+    pts = PgPointArray.from_objects(objs)
+    assert pts.to_objects() == objs
+    assert len(PgPointArray.from_objects([])) == 0
+
+
+def test_big_int_coordinates() -> None:
+    pts = PgPointArray([[2**70, 1, 0], [3, 2**80, 1]])
+    lns = pts.meet(PgPoint([1, 1, 1]))
+    assert lns[0] == PgPoint([2**70, 1, 0]).meet(PgPoint([1, 1, 1]))
+    assert pts.incident(lns).all()
+
+
+@given(triplets, triplets)
+def test_matches_scalar(rows_p, rows_q) -> None:
+    n = min(len(rows_p), len(rows_q))
+    pts = PgPointArray(rows_p[:n])
+    qts = PgPointArray(rows_q[:n])
+    lns = pts.meet(qts)
+    assert lns.incident(pts).all()
+    assert lns.incident(qts).all()
+    mixed = pts.parametrize(3, qts, -2)
+    dots = lns.dot(pts.aux())
+    for i in range(n):
+        pt_p = PgPoint(list(rows_p[i]))
+        pt_q = PgPoint(list(rows_q[i]))
+        assert lns[i].coord == pt_p.meet(pt_q).coord
+        assert mixed[i].coord == pt_p.parametrize(3, pt_q, -2).coord
+        assert dots[i] == pt_p.meet(pt_q).dot(pt_p.aux())
+    assert np.array_equal(pts == qts, [pt_p == pt_q for pt_p, pt_q in zip(pts, qts)])
+
+
+def test_int64_overflow_falls_back_to_exact() -> None:
+    big = 2**40
+    pts = PgPointArray([[big, 3, 1], [1, 2, 3], [-(2**62), 5, 7]])
+    qts = PgPointArray([[1, big, 1], [4, 5, 6], [2**62, -1, 1]])
+    lns = pts.meet(qts)
+    assert lns.coord.dtype == object
+    for i in range(3):
+        assert lns[i].coord == pts[i].meet(qts[i]).coord
+    assert lns.incident(pts).all() and lns.incident(qts).all()
+
+
+def test_int64_fast_path_keeps_native_dtype() -> None:
+    pts = PgPointArray(np.array([[1, 2, 3], [4, 5, 6]], dtype=object))
+    lns = pts.meet(PgPoint([7, 8, 10]))
+    assert lns.coord.dtype == np.int64
+
+
+def test_chained_meets_stay_exact() -> None:
+    pts = PgPointArray([[3, 5, 7], [11, 13, 17]])
+    qts = PgPointArray([[19, 23, 29], [31, 37, 41]])
+    scalar = [(pts[i], qts[i]) for i in range(2)]
+    for _ in range(6):
+        pts, qts = pts.meet(qts).meet(pts.aux().meet(qts.aux())), pts.parametrize(
+            2, qts, 3
+        )
+        scalar = [
+            (p.meet(q).meet(p.aux().meet(q.aux())), p.parametrize(2, q, 3))
+            for p, q in scalar
+        ]
+    for i in range(2):
+        assert pts[i].coord == scalar[i][0].coord
+        assert qts[i].coord == scalar[i][1].coord
+
+
+@given(triplets)
+def test_normalize_matches_scalar(rows) -> None:
+    pts = PgPointArray(rows).normalize()
+    for i, row in enumerate(rows):
+        assert pts[i].coord == PgPoint(list(row)).normalize().coord
+
+
+@given(triplets, triplets, triplets)
+def test_coincident_matches_scalar(rows_p, rows_q, rows_r) -> None:
+    n = min(len(rows_p), len(rows_q), len(rows_r))
+    pts, qts, rts = (PgPointArray(rows[:n]) for rows in (rows_p, rows_q, rows_r))
+    dets = det_array(pts.coord, qts.coord, rts.coord)
+    flags = pts.coincident(qts, rts)
+    triples = np.stack([pts.coord, qts.coord, rts.coord], axis=1)
+    assert np.array_equal(coincident_array(triples), flags)
+    for i in range(n):
+        assert dets[i] == det(rows_p[i], rows_q[i], rows_r[i])
+        assert flags[i] == pts[i].meet(qts[i]).incident(rts[i])
+
+
+def test_det_overflow_falls_back_to_exact() -> None:
+    big = 2**30
+    arr_a = np.array([[big, 1, 0], [1, 2, 3]])
+    arr_b = np.array([[0, big, 1], [4, 5, 6]])
+    arr_c = np.array([[1, 0, big], [7, 8, 10]])
+    dets = det_array(arr_a, arr_b, arr_c)
+    assert dets.dtype == object
+    assert dets.tolist() == [
+        det(a, b, c) for a, b, c in zip(arr_a.tolist(), arr_b.tolist(), arr_c.tolist())
+    ]
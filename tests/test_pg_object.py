@@ -1,4 +1,6 @@
-from projgeom.pg_object import PgLine, PgPoint
+import pytest
+
+from projgeom.pg_object import PgLine, PgObject, PgPoint, cross, det, dot
 
 
 def test_pg_point_meet() -> None:
@@ -6,7 +8,7 @@ def test_pg_point_meet() -> None:
     pt_q = PgPoint([4, 5, 6])
     ln_l = pt_p.meet(pt_q)
     assert isinstance(ln_l, PgLine)
-    assert ln_l.coord == [-3, 6, -3]
+    assert ln_l.coord == (-3, 6, -3)
 
 
 def test_pg_point_dual() -> None:
@@ -21,3 +23,120 @@ def test_pg_line_dual() -> None:
     pt_p = ln_l.aux()
     assert isinstance(pt_p, PgPoint)
     assert not ln_l.incident(pt_p)
+
+
+def test_normalize() -> None:
+    pt_p = PgPoint([-6, 4, 10])
+    assert pt_p.normalize().coord == (3, -2, -5)
+    assert pt_p.normalize() == pt_p
+    assert PgLine([0, 0, -5]).normalize().coord == (0, 0, 1)
+
+
+def test_auto_normalize_bounds_bit_growth() -> None:
+    pt_a, pt_b = PgPoint([3, 5, 7]), PgPoint([11, 13, 17])
+    pt_c, pt_d = PgPoint([19, 23, 29]), PgPoint([31, 37, 41])
+    PgObject.auto_normalize = True
+    try:
+        for _ in range(20):
+            pt_a, pt_b, pt_c, pt_d = (
+                pt_a.meet(pt_b).meet(pt_c.meet(pt_d)),
+                pt_a.meet(pt_c).meet(pt_b.meet(pt_d)),
+                pt_a.meet(pt_d).meet(pt_b.meet(pt_c)),
+                pt_a,
+            )
+            assert pt_a.coord == pt_a.normalize().coord
+    finally:
+        PgObject.auto_normalize = False
+    assert max(abs(x) for x in pt_a.coord).bit_length() < 64
+
+
+def test_hashable_dedup() -> None:
+    pts = [
+        PgPoint([1, 2, 3]),
+        PgPoint([-2, -4, -6]),
+        PgPoint([1, 0, 0]),
+        PgPoint([5, 0, 0]),
+    ]
+    assert len(set(pts)) == 2
+    lookup = {pt: i for i, pt in enumerate(pts)}
+    assert lookup[PgPoint([3, 6, 9])] == 1
+    assert PgLine([1, 2, 3]) not in set(pts)
+
+
+def test_canonical_key_is_cached() -> None:
+    pt_p = PgPoint([-6, 4, 10])
+    key = pt_p.canonical_key()
+    assert key == (3, -2, -5)
+    assert pt_p.canonical_key() is key
+
+
+def test_zero_vector_equality() -> None:
+    assert PgPoint([0, 0, 0]) == PgPoint([1, 2, 3])
+    assert PgPoint([1, 2, 3]) == PgPoint([0, 0, 0])
+    # The zero vector is not a projective object: it cannot be hashed.
+    with pytest.raises(ValueError):
+        hash(PgPoint([0, 0, 0]))
+    with pytest.raises(ValueError):
+        PgPoint([0, 0, 0]).canonical_key()
+
+
+def test_eq_uses_cached_keys_only_if_both_are_cached() -> None:
+    pt_p, pt_q = PgPoint([3, 6, 9]), PgPoint([-1, -2, -3])
+    assert pt_p == pt_q
+    assert pt_p._key is None and pt_q._key is None
+    hash(pt_p)
+    assert pt_p == pt_q and pt_q == pt_p
+    assert pt_q._key is None
+    hash(pt_q)
+    assert pt_p == pt_q
+    assert pt_p != PgPoint([1, 2, 4])
+
+
+def test_slotted_immutable_storage() -> None:
+    from projgeom.ell_object import EllipticLine, EllipticPoint
+    from projgeom.hyp_object import HyperbolicLine, HyperbolicPoint
+    from projgeom.myck_object import MyCKLine, MyCKPoint
+    from projgeom.persp_object import PerspLine, PerspPoint
+
+    for cls in [
+        PgPoint,
+        PgLine,
+        EllipticPoint,
+        EllipticLine,
+        HyperbolicPoint,
+        HyperbolicLine,
+        MyCKPoint,
+        MyCKLine,
+        PerspPoint,
+        PerspLine,
+    ]:
+        obj = cls([1, 2, 3])
+        assert not hasattr(obj, "__dict__")
+        assert isinstance(obj.coord, tuple)
+        assert obj.aux().coord is obj.coord
+        with pytest.raises(AttributeError):
+            obj.coord = (4, 5, 6)
+        with pytest.raises(AttributeError):
+            del obj.coord
+        assert obj.coord == (1, 2, 3)
+    coord = (1, 2, 3)
+    assert PgPoint(coord).coord is coord
+
+
+def test_immutable_key_stays_valid() -> None:
+    pt_p = PgPoint([1, 2, 3])
+    hash(pt_p)
+    with pytest.raises(AttributeError):
+        pt_p.coord = (4, 5, 6)
+    assert pt_p == PgPoint([2, 4, 6])
+    assert pt_p in {PgPoint([-1, -2, -3])}
+
+
+def test_det_coincident() -> None:
+    vec_a, vec_b, vec_c = [2**70, -3, 5], [7, 2**65, -1], [4, 9, 2**80]
+    assert det(vec_a, vec_b, vec_c) == dot(vec_a, cross(vec_b, vec_c))
+    pt_a, pt_b = PgPoint(vec_a), PgPoint(vec_b)
+    assert pt_a.coincident(pt_b, pt_a.parametrize(3, pt_b, -7))
+    assert not pt_a.coincident(pt_b, PgPoint(vec_c))
+    ln_l, ln_m = PgLine(vec_a), PgLine(vec_b)
+    assert ln_l.coincident(ln_m, ln_l.parametrize(2, ln_m, 5))
@@ -207,3 +207,13 @@ def test_equality_up_to_scalar(pt1, pt2):
     # But pt1 and pt2 should generally be different
     # (unless they happen to be scalar multiples)
     # This test mainly checks the equality logic works correctly
+
+
+@given(pg_points(), integers(min_value=-50, max_value=50))
+def test_hash_consistent_with_equality(pt1, scale):
+    """Test that projectively equal points hash alike"""
+    assume(scale != 0)
+    pt1_scaled = PgPoint([scale * coord for coord in pt1.coord])
+    assert pt1 == pt1_scaled
+    assert hash(pt1) == hash(pt1_scaled)
+    assert len({pt1, pt1_scaled}) == 1
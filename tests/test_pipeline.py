@@ -0,0 +1,126 @@
+import doctest
+import tracemalloc
+
+import numpy as np
+import pytest
+
+import projgeom.pipeline
+from projgeom.ell_object import EllipticLine, EllipticPoint
+from projgeom.ff_object import FfPoint
+from projgeom.persp_object import PerspPoint
+from projgeom.pg_object import PgLine, PgPoint
+from projgeom.pipeline import Pipeline
+from projgeom.store import MappedStore, save_coords
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.pipeline).failed == 0
+
+
+def random_points(point_type, num, seed=0):
+    rng = np.random.default_rng(seed)
+    for row in rng.integers(-50, 50, size=(num, 3)).tolist():
+        yield point_type(row)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 1000])
+def test_matches_scalar_methods(chunk_size) -> None:
+    ln_m = EllipticLine([1, -2, 3])
+    pt_o = EllipticPoint([2, 1, 1])
+    expected = []
+    for pt_p in random_points(EllipticPoint, 200):
+        pt_q = pt_p.meet(pt_o).meet(ln_m).parametrize(2, pt_o, -3)
+        if not pt_q.perp().incident(pt_o):
+            expected.append(pt_q.perp().aux().normalize())
+    pipe = (
+        Pipeline.from_objects(random_points(EllipticPoint, 200), chunk_size)
+        .meet(pt_o)
+        .meet(ln_m)
+        .parametrize(2, pt_o, -3)
+        .perp()
+        .filter_incident(pt_o, keep=False)
+        .aux()
+        .normalize()
+    )
+    result = list(pipe.objects())
+    assert [type(obj) for obj in result] == [EllipticPoint] * len(expected)
+    assert [obj.coord for obj in result] == [obj.coord for obj in expected]
+
+
+def test_constant_perp_and_big_ints() -> None:
+    pts = [PerspPoint([2**70, 1, 1]), PerspPoint([3, 4, 5])]
+    result = list(Pipeline.from_objects(pts).meet(PerspPoint([1, 2**65, 0])).objects())
+    assert result == [pt.meet(PerspPoint([1, 2**65, 0])) for pt in pts]
+    result = list(Pipeline.from_objects(pts).perp().objects())
+    assert result == [pt.perp() for pt in pts]
+
+
+def test_memory_is_bounded() -> None:
+    def stream(num):
+        for i in range(num):
+            yield np.array([[i, 1, 2]] * 1000)
+
+    ln_l = PgLine([1, 0, 0])
+
+    def peak(num):
+        tracemalloc.start()
+        count = (
+            Pipeline.from_coords(PgPoint, stream(num))
+            .meet(PgPoint([0, 1, 0]))
+            .meet(ln_l)
+            .count()
+        )
+        _, peak_size = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        assert count == 1000 * num
+        return peak_size
+
+    assert peak(200) < 2 * peak(10)
+
+
+def test_store_roundtrip(tmp_path) -> None:
+    coord = np.random.default_rng(2).integers(-1000, 1000, size=(500, 3))
+    source = tmp_path / "in.pgb"
+    target = tmp_path / "out.pgb"
+    save_coords(source, PgPoint, coord)
+    with MappedStore(source) as store:
+        count = (
+            Pipeline.from_store(store, chunk_size=64)
+            .meet(PgPoint([0, 0, 1]))
+            .save(target, width=4)
+        )
+    assert count == 500
+    with MappedStore(target) as result:
+        assert result.elem_type is PgLine
+        assert list(result) == [PgPoint(row).meet(PgPoint([0, 0, 1])) for row in coord]
+
+
+def test_errors(tmp_path) -> None:
+    with pytest.raises(TypeError):
+        list(Pipeline.from_objects([FfPoint([1, 2, 3], 7)]))
+    with pytest.raises(TypeError):
+        list(Pipeline.from_objects([PgPoint([1, 2, 3]), PgLine([1, 2, 3])]))
+    with pytest.raises(ValueError):
+        Pipeline.from_objects([], chunk_size=0)
+    with pytest.raises(ValueError):
+        Pipeline.from_objects([PgPoint([2**40, 1, 1])]).save(tmp_path / "x", width=4)
+    with pytest.raises(ValueError):
+        Pipeline.from_objects([]).save(tmp_path / "y")
+    # Failed saves leave no file behind, and do not touch an existing one.
+    assert list(tmp_path.iterdir()) == []
+    target = tmp_path / "z.pgb"
+    Pipeline.from_objects([PgPoint([1, 2, 3])]).save(target)
+    with pytest.raises(ValueError):
+        Pipeline.from_objects([PgLine([1, 2, 3])]).save(target, elem_type=PgPoint)
+    with pytest.raises(ValueError):
+        Pipeline.from_objects([PgPoint([2**40, 1, 1])]).save(target, width=4)
+    assert list(tmp_path.iterdir()) == [target]
+    with MappedStore(target) as store:
+        assert list(store) == [PgPoint([1, 2, 3])]
+
+
+def test_save_empty_stream(tmp_path) -> None:
+    path = tmp_path / "empty.pgb"
+    assert Pipeline.from_objects([]).save(path, elem_type=PgLine) == 0
+    with MappedStore(path) as store:
+        assert store.elem_type is PgLine and len(store) == 0
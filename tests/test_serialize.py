@@ -0,0 +1,98 @@
+import doctest
+import pickle
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import integers, lists, sampled_from, tuples
+
+import projgeom.serialize
+from projgeom.ell_object import EllipticPoint
+from projgeom.ff_object import FfLine, FfPoint
+from projgeom.hyp_object import HyperbolicLine, HyperbolicPoint
+from projgeom.myck_object import MyCKLine
+from projgeom.persp_object import PerspPoint
+from projgeom.pg_object import PgLine, PgObject, PgPoint
+from projgeom.serialize import pack, register, unpack, unpack_coords
+
+TYPES = [PgPoint, PgLine, EllipticPoint, HyperbolicLine, MyCKLine, PerspPoint]
+
+coord_lists = lists(
+    tuples(
+        integers(-(2**80), 2**80), integers(-(2**80), 2**80), integers(-(2**80), 2**80)
+    ),
+    max_size=20,
+)
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.serialize).failed == 0
+
+
+@pytest.mark.parametrize("obj", [PgPoint([1, -2, 3]), HyperbolicLine([2**90, 0, 1])])
+def test_pickle_roundtrip(obj) -> None:
+    data = pickle.dumps(obj)
+    result = pickle.loads(data)
+    assert type(result) is type(obj)
+    assert result.coord == obj.coord
+    assert b"_key" not in data
+
+
+def test_pickle_finite_field() -> None:
+    ln_l = FfLine([3, 6, 2], 7)
+    result = pickle.loads(pickle.dumps(ln_l))
+    assert result == ln_l and result.modulus == 7
+
+
+@given(sampled_from(TYPES), coord_lists)
+def test_pack_roundtrip(elem_type, coords) -> None:
+    objs = [elem_type(list(c)) for c in coords]
+    result = unpack(pack(objs, elem_type))
+    assert [type(obj) for obj in result] == [elem_type] * len(objs)
+    assert [obj.coord for obj in result] == [obj.coord for obj in objs]
+
+
+@pytest.mark.parametrize("bound,width", [(100, 1), (2**15, 4), (2**40, 8)])
+def test_small_coordinates_use_narrow_buffers(bound, width) -> None:
+    objs = [PgPoint([bound, -bound, 0])] * 10
+    data = pack(objs)
+    _, modulus, coord = unpack_coords(data)
+    assert modulus == 0
+    assert coord.dtype.itemsize == width
+    assert coord.tolist() == [[bound, -bound, 0]] * 10
+    assert len(data) == 24 + 30 * width
+
+
+def test_finite_field_modulus() -> None:
+    modulus = 2**127 - 1
+    objs = [FfPoint([i, 2 * i, 3], modulus) for i in range(5)]
+    result = unpack(pack(objs))
+    assert result == objs
+    assert all(obj.modulus == modulus for obj in result)
+    with pytest.raises(ValueError):
+        pack([FfPoint([1, 2, 3], 7), FfPoint([1, 2, 3], 11)])
+
+
+def test_invalid_input() -> None:
+    with pytest.raises(TypeError):
+        pack([PgPoint([1, 2, 3]), PgLine([1, 2, 3])])
+    with pytest.raises(ValueError):
+        pack([])
+    with pytest.raises(ValueError):
+        unpack(b"not packed")
+    with pytest.raises(ValueError):
+        unpack(pack([PgPoint([1, 2, 3])])[:-1])
+
+
+def test_register_user_class() -> None:
+    class Point(PgObject):
+        __slots__ = ()
+
+    with pytest.raises(TypeError):
+        pack([Point([1, 2, 3])])
+    assert register(Point) is Point
+    assert unpack(pack([Point([1, 2, 3])]))[0].coord == (1, 2, 3)
+    with pytest.raises(ValueError):
+        register(type("PgPoint", (PgObject,), {"__slots__": ()}))
+    with pytest.raises(TypeError):
+        register(int)
+    assert HyperbolicPoint.__name__ in projgeom.serialize._REGISTRY
@@ -0,0 +1,110 @@
+import doctest
+
+import numpy as np
+import pytest
+
+import projgeom.store
+from projgeom.ell_object import EllipticLine
+from projgeom.ff_object import FfLine, FfPoint
+from projgeom.myck_object import MyCKPoint
+from projgeom.persp_object import PerspLine
+from projgeom.pg_array import PgPointArray
+from projgeom.pg_object import PgPoint
+from projgeom.serialize import pack, unpack
+from projgeom.store import MappedStore, save, save_coords
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.store).failed == 0
+
+
+@pytest.mark.parametrize("bound", [100, 2**31, 2**62, 2**200])
+@pytest.mark.parametrize("elem_type", [MyCKPoint, EllipticLine, PerspLine])
+def test_roundtrip(tmp_path, elem_type, bound) -> None:
+    rng = np.random.default_rng(0)
+    objs = [
+        elem_type([int(x) * (bound // 100) for x in rng.integers(-100, 100, size=3)])
+        for _ in range(50)
+    ]
+    path = tmp_path / "objs.pgb"
+    save(path, objs)
+    with MappedStore(path) as store:
+        assert store.elem_type is elem_type
+        assert len(store) == 50
+        assert list(store) == objs
+        assert [obj.coord for obj in store[10:20]] == [obj.coord for obj in objs[10:20]]
+        assert store[-1].coord == objs[-1].coord
+        with pytest.raises(IndexError):
+            store[50]
+    assert unpack(path.read_bytes()) == objs
+
+
+def test_coords_are_memory_mapped(tmp_path) -> None:
+    coord = np.random.default_rng(1).integers(-(2**40), 2**40, size=(1000, 3))
+    path = tmp_path / "points.pgb"
+    save_coords(path, PgPoint, PgPointArray(coord))
+    with MappedStore(path) as store:
+        rows = store.coords(slice(100, 200))
+        assert isinstance(rows, np.memmap)
+        assert not rows.flags.writeable
+    # The rows stay valid after the store is closed.
+    np.testing.assert_array_equal(rows, coord[100:200])
+    with pytest.raises(ValueError):
+        store.coords()
+    with pytest.raises(ValueError):
+        store[0]
+
+
+def test_big_int_coords(tmp_path, monkeypatch) -> None:
+    monkeypatch.setattr(projgeom.store, "CHUNK_ROWS", 7)
+    coord = np.array([[2**100 + i, -i, 3**70] for i in range(30)], dtype=object)
+    path = tmp_path / "big.pgb"
+    save_coords(path, PgPoint, coord)
+    with MappedStore(path) as store:
+        assert store.width == 14
+        assert store.coords(slice(3, 5)).tolist() == coord[3:5].tolist()
+        assert [obj.coord for obj in store] == [tuple(row) for row in coord.tolist()]
+
+
+def test_finite_field_and_empty(tmp_path) -> None:
+    path = tmp_path / "ff.pgb"
+    save_coords(path, FfLine, [[1, 2, 3], [4, 5, 6]], modulus=7)
+    with MappedStore(path) as store:
+        assert list(store) == [FfLine([1, 2, 3], 7), FfLine([4, 5, 6], 7)]
+    save(path, [], PgPoint)
+    with MappedStore(path) as store:
+        assert len(store) == 0 and list(store) == []
+
+
+def test_unregistered_type(tmp_path) -> None:
+    class Unknown(PgPoint):
+        __slots__ = ()
+
+    path = tmp_path / "unknown.pgb"
+    with pytest.raises(TypeError):
+        save_coords(path, Unknown, [[1, 2, 3]])
+    with pytest.raises(TypeError):
+        save(path, [Unknown([1, 2, 3])])
+    assert not path.exists()
+
+
+def test_finite_field_needs_prime_modulus(tmp_path) -> None:
+    path = tmp_path / "ff.pgb"
+    with pytest.raises(ValueError):
+        save_coords(path, FfPoint, [[1, 2, 3]])
+    with pytest.raises(ValueError):
+        save_coords(path, FfLine, [[1, 2, 3]], modulus=9)
+    assert not path.exists()
+    save_coords(path, FfLine, [[1, 2, 3]], modulus=7)
+    with MappedStore(path) as store:
+        assert store[0] == FfLine([1, 2, 3], 7)
+
+
+def test_invalid_files(tmp_path) -> None:
+    path = tmp_path / "bad.pgb"
+    path.write_bytes(pack([PgPoint([1, 2, 3])])[:-1])
+    with pytest.raises(ValueError):
+        MappedStore(path)
+    path.write_bytes(b"garbage")
+    with pytest.raises(ValueError):
+        MappedStore(path)
@@ -0,0 +1,224 @@
+import doctest
+
+import numpy as np
+import pytest
+from hypothesis import assume, given
+from hypothesis.strategies import integers, lists, tuples
+
+import projgeom.tracer
+from projgeom.ck_plane import orthocenter, tri_altitude
+from projgeom.ell_object import EllipticPoint
+from projgeom.ff_object import FfPoint
+from projgeom.hyp_object import HyperbolicLine, HyperbolicPoint
+from projgeom.myck_object import MyCKPoint
+from projgeom.persp_object import PerspPoint
+from projgeom.pg_array import perp_array
+from projgeom.pg_object import PgLine, PgObject, PgPoint
+from projgeom.pg_plane import (
+    check_desargue,
+    check_pappus,
+    coincident,
+    harm_conj,
+    involution,
+)
+from projgeom.tracer import compile_construction
+
+rows = lists(
+    tuples(integers(-100, 100), integers(-100, 100), integers(-100, 100)),
+    min_size=6,
+    max_size=6,
+)
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.tracer).failed == 0
+
+
+def random_coords(num, seed, bits=20):
+    rng = np.random.default_rng(seed)
+    return rng.integers(-(2**bits), 2**bits, size=(num, 3))
+
+
+@pytest.mark.parametrize(
+    "point_type", [EllipticPoint, HyperbolicPoint, MyCKPoint, PerspPoint]
+)
+def test_orthocenter_matches_eager(point_type) -> None:
+    def ortho(pt_a, pt_b, pt_c):
+        return orthocenter([pt_a, pt_b, pt_c])
+
+    sample = [point_type([1, 3, 5]), point_type([3, 1, 4]), point_type([5, 2, 1])]
+    kernel = compile_construction(ortho, *sample)
+    arrays = [random_coords(50, seed) for seed in range(3)]
+    result = kernel(*arrays)
+    for i in range(50):
+        triangle = [point_type(arr[i].tolist()) for arr in arrays]
+        assert tuple(result[i].tolist()) == orthocenter(triangle).coord
+
+
+def test_tri_altitude_returns_tuple() -> None:
+    def altitudes(pt_a, pt_b, pt_c):
+        return tri_altitude([pt_a, pt_b, pt_c])
+
+    sample = [HyperbolicPoint([1, 3, 5]), HyperbolicPoint([3, 1, 4])]
+    sample.append(HyperbolicPoint([5, 2, 1]))
+    kernel = compile_construction(altitudes, *sample)
+    arrays = [random_coords(10, seed) for seed in range(3)]
+    alt_1, alt_2, alt_3 = kernel(*arrays)
+    expected = tri_altitude([HyperbolicPoint(arr[4].tolist()) for arr in arrays])
+    assert [tuple(alt[4].tolist()) for alt in (alt_1, alt_2, alt_3)] == [
+        alt.coord for alt in expected
+    ]
+
+
+def pappus_fn(pt_a, pt_b, pt_d, pt_e):
+    coline1 = [pt_a, pt_b, pt_a.parametrize(3, pt_b, 5)]
+    coline2 = [pt_d, pt_e, pt_d.parametrize(2, pt_e, 7)]
+    return check_pappus(coline1, coline2)
+
+
+def desargue_fn(pt_a, pt_b, pt_c, pt_d, pt_e, pt_f):
+    return check_desargue([pt_a, pt_b, pt_c], [pt_d, pt_e, pt_f])
+
+
+PAPPUS = compile_construction(
+    pappus_fn, *[PgPoint(c) for c in np.eye(3, dtype=int).tolist()], PgPoint([1, 1, 1])
+)
+DESARGUE = compile_construction(
+    desargue_fn,
+    *[PgPoint(c) for c in ([1, 0, 0], [0, 1, 0], [0, 0, 1])],
+    *[PgPoint(c) for c in ([3, 1, 1], [1, 3, 1], [1, 1, 3])],
+)
+
+
+@given(rows)
+def test_theorem_checkers_match_eager(coords) -> None:
+    pts = [PgPoint(list(c)) for c in coords]
+    assume(not coincident(*pts[:3]) and not coincident(*pts[3:]))
+    arrays = [np.array([c]) for c in coords]
+    assert PAPPUS(*arrays[:4]).tolist() == [pappus_fn(*pts[:4])]
+    assert DESARGUE(*arrays).tolist() == [desargue_fn(*pts)]
+
+
+def test_guard_failures_fall_back() -> None:
+    def branchy(pt_a, pt_b, pt_c):
+        if coincident(pt_a, pt_b, pt_c):
+            return pt_a.meet(pt_c)
+        return pt_a.meet(pt_b)
+
+    kernel = compile_construction(
+        branchy, PgPoint([1, 2, 3]), PgPoint([4, 5, 6]), PgPoint([0, 0, 1])
+    )
+    assert kernel.num_guards == 1
+    pt_a = np.array([[1, 2, 3], [1, 0, 0], [1, 1, 1]])
+    pt_b = np.array([[4, 5, 6], [0, 1, 0], [2, 2, 5]])
+    pt_c = np.array([[0, 0, 1], [1, 1, 0], [3, 3, 0]])
+    result = kernel(pt_a, pt_b, pt_c)
+    for i in range(3):
+        args = [PgPoint(arr[i].tolist()) for arr in (pt_a, pt_b, pt_c)]
+        assert tuple(result[i].tolist()) == branchy(*args).coord
+
+
+def test_involution_and_reflect() -> None:
+    sample = [PgPoint([0, 0, 1]), PgLine([0, 1, 0]), PgPoint([1, 2, 1])]
+    kernel = compile_construction(involution, *sample)
+    origin = random_coords(20, 0)
+    mirror = random_coords(20, 1)
+    pt_p = random_coords(20, 2)
+    result = kernel(origin, mirror, pt_p)
+    for i in range(20):
+        expected = involution(
+            PgPoint(origin[i].tolist()),
+            PgLine(mirror[i].tolist()),
+            PgPoint(pt_p[i].tolist()),
+        )
+        assert tuple(result[i].tolist()) == expected.coord
+
+    def reflected(mirror, pt_p):
+        return involution(mirror.perp(), mirror, pt_p)
+
+    kernel = compile_construction(
+        reflected, HyperbolicLine([0, 1, 0]), HyperbolicPoint([1, 2, 1])
+    )
+    result = kernel(mirror, pt_p)
+    for i in range(20):
+        ln_m = HyperbolicLine(mirror[i].tolist())
+        expected = involution(ln_m.perp(), ln_m, HyperbolicPoint(pt_p[i].tolist()))
+        assert tuple(result[i].tolist()) == expected.coord
+
+
+def test_scalar_arguments_and_big_ints() -> None:
+    def combine(pt_a, pt_b, lambda_, mu_):
+        ln_l = pt_a.meet(pt_b)
+        return pt_a.parametrize(lambda_ * 2 - mu_, pt_b, ln_l.dot(ln_l)), ln_l.dot(pt_a)
+
+    kernel = compile_construction(combine, PgPoint([1, 2, 3]), PgPoint([4, 5, 6]), 1, 2)
+    pt_a = np.array([[2**40, 1, 0], [1, 2, 3]], dtype=object)
+    pt_b = np.array([[0, 2**45, 1], [7, 8, 9]])
+    points, dots = kernel(pt_a, pt_b, np.array([3, 4]), 5)
+    assert points.dtype == object
+    for i in range(2):
+        obj_a, obj_b = PgPoint(pt_a[i].tolist()), PgPoint(pt_b[i].tolist())
+        pt_e, value = combine(obj_a, obj_b, [3, 4][i], 5)
+        assert tuple(points[i].tolist()) == pt_e.coord
+        assert dots[i] == value == 0
+
+
+def test_rejects_untraceable_arguments() -> None:
+    with pytest.raises(TypeError):
+        compile_construction(coincident, *[FfPoint([1, 2, 3], 7)] * 3)
+    pt_p = PgPoint([1, 2, 3])
+    kernel = compile_construction(
+        harm_conj, pt_p, PgPoint([0, 1, 0]), PgPoint([1, 3, 3])
+    )
+    assert kernel.num_ops > 0
+
+
+def test_auto_normalize() -> None:
+    class NormPoint(MyCKPoint):
+        """A fresh class, so that its pole/polar map is probed under `auto_normalize`."""
+
+        __slots__ = ()
+
+    def ortho(pt_a, pt_b, pt_c):
+        return orthocenter([pt_a, pt_b, pt_c])
+
+    PgObject.auto_normalize = True
+    try:
+        assert perp_array(NormPoint, np.array([[1, 2, 3]])).tolist() == [[-2, 2, -6]]
+        sample = [NormPoint([1, 3, 5]), NormPoint([3, 1, 4]), NormPoint([5, 2, 1])]
+        kernel = compile_construction(ortho, *sample)
+        arrays = [random_coords(20, seed) for seed in range(3)]
+        result = kernel(*arrays)
+        for i in range(20):
+            triangle = [NormPoint(arr[i].tolist()) for arr in arrays]
+            assert tuple(result[i].tolist()) == orthocenter(triangle).coord
+    finally:
+        PgObject.auto_normalize = False
+    assert NormPoint([2, 4, 6]).coord == (2, 4, 6)
+
+
+def test_input_shapes() -> None:
+    kernel = compile_construction(
+        harm_conj, PgPoint([1, 0, 0]), PgPoint([0, 1, 0]), PgPoint([1, 1, 0])
+    )
+    pt_a, pt_b, pt_c = (
+        np.array([[1, 2, 0]]),
+        np.array([[0, 1, 1]]),
+        np.array([[1, 3, 1]]),
+    )
+    assert kernel(pt_a, pt_b, pt_c).tolist() == [[6, 6, -6]]
+    with pytest.raises(ValueError):
+        kernel(pt_a[0], pt_b[0], pt_c[0])
+    with pytest.raises(ValueError):
+        kernel(pt_a, pt_b, np.array([[1, 3, 1], [1, 1, 1]]))
+    with pytest.raises(ValueError):
+        kernel(pt_a[np.newaxis], pt_b, pt_c)
+
+    def scale(pt_a, pt_b, lambda_):
+        return pt_a.parametrize(lambda_, pt_b, 1)
+
+    kernel = compile_construction(scale, PgPoint([1, 0, 0]), PgPoint([0, 1, 0]), 2)
+    assert kernel(pt_a, pt_b, 3).tolist() == [[3, 7, 1]]
+    assert kernel(pt_a, pt_b, np.array([3])).tolist() == [[3, 7, 1]]
+    with pytest.raises(ValueError):
+        kernel(pt_a, pt_b, np.array([[3]]))
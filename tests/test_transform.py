@@ -0,0 +1,174 @@
+import doctest
+
+import numpy as np
+import pytest
+from hypothesis import assume, given
+from hypothesis.strategies import integers, lists, sampled_from, tuples
+
+import projgeom.transform
+from projgeom.ck_plane import reflect
+from projgeom.ell_object import EllipticLine, EllipticPoint
+from projgeom.hyp_object import HyperbolicLine, HyperbolicPoint
+from projgeom.myck_object import MyCKLine, MyCKPoint
+from projgeom.pg_array import PgPointArray
+from projgeom.pg_object import PgLine, PgPoint, det
+from projgeom.pg_plane import coincident, involution
+from projgeom.transform import Collineation, Reflection, reflection
+
+coords = tuples(integers(-30, 30), integers(-30, 30), integers(-30, 30))
+matrices = lists(coords, min_size=3, max_size=3)
+
+
+def test_doctests() -> None:
+    assert doctest.testmod(projgeom.transform).failed == 0
+
+
+@given(coords, coords, coords)
+def test_involution_matches(c_o, c_m, c_p) -> None:
+    origin, mirror, pt_p = PgPoint(list(c_o)), PgLine(list(c_m)), PgPoint(list(c_p))
+    assume(not origin.incident(mirror) and pt_p != origin)
+    trans = Collineation.from_involution(origin, mirror)
+    assert trans(pt_p) == involution(origin, mirror, pt_p)
+    assert trans @ trans == Collineation.identity()
+
+
+@given(
+    sampled_from(
+        [
+            (EllipticPoint, EllipticLine),
+            (HyperbolicPoint, HyperbolicLine),
+            (MyCKPoint, MyCKLine),
+        ]
+    ),
+    coords,
+    coords,
+)
+def test_reflection_matches(types, c_m, c_p) -> None:
+    point_type, line_type = types
+    mirror, pt_p = line_type(list(c_m)), point_type(list(c_p))
+    assume(not mirror.perp().incident(mirror) and pt_p != mirror.perp())
+    trans = Collineation.from_reflection(mirror)
+    result = trans(pt_p)
+    assert type(result) is point_type
+    assert result == involution(mirror.perp(), mirror, pt_p)
+
+
+@given(lists(coords, min_size=8, max_size=8))
+def test_from_points(rows) -> None:
+    pts = [PgPoint(list(c)) for c in rows]
+    for quad in (pts[:4], pts[4:]):
+        for i in range(4):
+            assume(not coincident(*(quad[:i] + quad[i + 1 :])))
+    trans = Collineation.from_points(pts[:4], pts[4:])
+    assert [trans(pt) for pt in pts[:4]] == pts[4:]
+
+
+@given(matrices, matrices, coords, coords)
+def test_compose_inverse_and_dual(mat_a, mat_b, c_p, c_q) -> None:
+    assume(det(*mat_a) != 0 and det(*mat_b) != 0)
+    trans_a, trans_b = Collineation(mat_a), Collineation(mat_b)
+    pt_p, pt_q = PgPoint(list(c_p)), PgPoint(list(c_q))
+    assert (trans_a @ trans_b)(pt_p) == trans_a(trans_b(pt_p))
+    assert trans_a.inverse()(trans_a(pt_p)) == pt_p
+    assert (trans_a @ trans_a.inverse()) == Collineation.identity()
+    assert trans_a.dual()(pt_p.meet(pt_q)) == trans_a(pt_p).meet(trans_a(pt_q))
+    assert trans_a.dual().dual() == trans_a
+
+
+def test_apply_array() -> None:
+    trans = Collineation.from_reflection(HyperbolicLine([3, -1, 2]))
+    coord = np.random.default_rng(0).integers(-1000, 1000, size=(100, 3))
+    result = trans.apply_array(coord)
+    expected = [trans(HyperbolicPoint(row)).coord for row in coord.tolist()]
+    assert [tuple(row) for row in result.tolist()] == expected
+    big = np.array([[2**70, 1, 1], [1, 2, 3]], dtype=object)
+    result = trans.apply_array(PgPointArray(big))
+    assert isinstance(result, PgPointArray)
+    assert [tuple(row) for row in result.coord.tolist()] == [
+        trans(PgPoint(row)).coord for row in big.tolist()
+    ]
+
+
+def test_invalid_and_equality() -> None:
+    with pytest.raises(ValueError):
+        Collineation([[1, 2, 3], [2, 4, 6], [0, 0, 1]])
+    with pytest.raises(ValueError):
+        Collineation([[1, 0], [0, 1]])
+    with pytest.raises(ValueError):
+        Collineation.from_involution(PgPoint([0, 0, 1]), PgLine([0, 1, 0]))
+    pts = [PgPoint(c) for c in ([1, 0, 0], [0, 1, 0], [1, 1, 0], [0, 0, 1])]
+    with pytest.raises(ValueError):
+        Collineation.from_points(pts, pts)
+    trans = Collineation([[2, 0, 0], [0, 4, 0], [0, 0, 6]])
+    assert trans == Collineation([[-1, 0, 0], [0, -2, 0], [0, 0, -3]])
+    assert len({trans, Collineation([[1, 0, 0], [0, 2, 0], [0, 0, 3]])}) == 1
+    assert repr(trans) == "Collineation([[1, 0, 0], [0, 2, 0], [0, 0, 3]])"
+
+
+@given(
+    sampled_from(
+        [
+            (EllipticPoint, EllipticLine),
+            (HyperbolicPoint, HyperbolicLine),
+            (MyCKPoint, MyCKLine),
+        ]
+    ),
+    coords,
+    coords,
+    coords,
+)
+def test_reflection_object(types, c_m, c_p, c_q) -> None:
+    point_type, line_type = types
+    mirror = line_type(list(c_m))
+    pt_p, pt_q = point_type(list(c_p)), point_type(list(c_q))
+    assume(not mirror.perp().incident(mirror) and pt_p != mirror.perp())
+    refl = Reflection(mirror)
+    assert refl == Collineation.from_reflection(mirror)
+    assert refl(pt_p) == reflect(mirror, pt_p)
+    assert refl(refl(pt_p)) == pt_p
+    assume(pt_p != pt_q)
+    ln_l = pt_p.meet(pt_q)
+    assert type(refl(ln_l)) is line_type
+    assert refl(ln_l) == refl(pt_p).meet(refl(pt_q))
+
+
+def test_reflection_arrays() -> None:
+    refl = reflection(MyCKLine([3, -1, 2]))
+    coord = np.random.default_rng(1).integers(-1000, 1000, size=(100, 3))
+    points = refl.apply_array(coord)
+    lines = refl.apply_array(PgPointArray(coord), lines=True)
+    assert isinstance(lines, PgPointArray)
+    assert [tuple(row) for row in points.tolist()] == [
+        refl(MyCKPoint(row)).coord for row in coord.tolist()
+    ]
+    assert [tuple(row) for row in lines.coord.tolist()] == [
+        refl(MyCKLine(row)).coord for row in coord.tolist()
+    ]
+
+
+@given(sampled_from([EllipticLine, HyperbolicLine, MyCKLine]), coords, integers(-5, 5))
+def test_reflection_cached(line_type, c_m, scale) -> None:
+    assume(any(c_m) and scale != 0)
+    mirror = line_type(list(c_m))
+    assume(not mirror.perp().incident(mirror))
+    # Earlier calls with equal mirrors (with other coordinates) must not matter.
+    reflection(line_type([scale * x for x in c_m]))
+    refl = reflection(mirror)
+    assert type(refl.mirror) is line_type
+    assert refl.mirror.coord == mirror.canonical_key()
+    assert refl is reflection(line_type([-x for x in c_m]))
+    assert refl == Reflection(mirror)
+
+
+def test_reflection_cache_and_repr() -> None:
+    refl = reflection(HyperbolicLine([0, 2, 0]))
+    assert refl is reflection(HyperbolicLine([0, -1, 0]))
+    assert refl is not reflection(EllipticLine([0, 1, 0]))
+    assert refl.pole == HyperbolicPoint([0, 1, 0])
+    assert repr(refl) == "Reflection(HyperbolicLine(0 : 1 : 0))"
+    assert (
+        repr(Reflection(HyperbolicLine([0, 2, 0])))
+        == "Reflection(HyperbolicLine(0 : 2 : 0))"
+    )
+    with pytest.raises(ValueError):
+        Reflection(HyperbolicLine([1, 0, 1]))
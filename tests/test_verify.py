@@ -0,0 +1,70 @@
+from projgeom.ff_object import FfPoint
+from projgeom.pg_plane import check_desargue, check_pappus, harm_conj, persp, tri_dual
+from projgeom.verify import verify
+
+
+def pappus(pt_a, pt_b, pt_d, pt_e, s, t, u, v):
+    coline1 = [pt_a, pt_b, pt_a.parametrize(s, pt_b, t)]
+    coline2 = [pt_d, pt_e, pt_d.parametrize(u, pt_e, v)]
+    return check_pappus(coline1, coline2)
+
+
+def desargue(pt_o, pt_a, pt_b, pt_c, s, t, u):
+    # A triangle in perspective from O with the triangle (a, b, c)
+    tri2 = [pt_o.parametrize(1, pt_a, s), pt_o.parametrize(1, pt_b, t)]
+    tri2 += [pt_o.parametrize(1, pt_c, u)]
+    return check_desargue([pt_a, pt_b, pt_c], tri2)
+
+
+def test_pappus():
+    result = verify(pappus, 4, 4, trials=20, seed=42)
+    assert result.holds
+    assert result.failures == 0
+    assert result.counterexample is None
+    assert 0 < result.degree < 100
+    assert result.error_bound < 1e-300
+
+
+def test_desargue():
+    result = verify(desargue, 4, 3, trials=20, seed=42)
+    assert result.holds
+    dual = verify(lambda *pts: persp(pts[:3], pts[3:]), 6, seed=1)
+    assert not dual.holds
+
+
+def test_harm_conj_involutive():
+    def harm_twice(pt_a, pt_b, lambda_, mu_):
+        pt_c = pt_a.parametrize(lambda_, pt_b, mu_)
+        return harm_conj(pt_a, pt_b, harm_conj(pt_a, pt_b, pt_c)) == pt_c
+
+    assert verify(harm_twice, 2, 2, seed=7).holds
+
+
+def test_false_statement():
+    def false_pappus(pt_a, pt_b, pt_c, pt_d, pt_e, pt_f):
+        return check_pappus([pt_a, pt_b, pt_c], [pt_d, pt_e, pt_f])
+
+    result = verify(false_pappus, 6, trials=8, seed=3)
+    assert not result.holds
+    assert result.failures == 8
+    pts = result.counterexample
+    assert len(pts) == 6
+    assert all(isinstance(pt, FfPoint) for pt in pts)
+    assert not check_pappus(pts[:3], pts[3:])
+
+
+def test_assertion_counts_as_failure():
+    def degenerate(pt_a, pt_b):
+        return tri_dual([pt_a, pt_a, pt_b]) is not None
+
+    result = verify(degenerate, 2, trials=3, seed=0)
+    assert result.failures == 3
+
+
+def test_reproducible():
+    assert verify(pappus, 4, 4, seed=5) == verify(pappus, 4, 4, seed=5)
+
+
+def test_small_modulus_bound():
+    result = verify(pappus, 4, 4, trials=4, modulus=7, seed=0)
+    assert result.error_bound == 1.0